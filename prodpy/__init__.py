@@ -1,6 +1,36 @@
 # from . import stream
-from . import decline
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-from ._schedule import Schedule
-from ._allocate import Allocate
-from ._decline import DCA
+# Public names are imported on first access (PEP 562), so `import prodpy`
+# does not load pandas, SciPy or matplotlib until they are needed.
+_LAZY = {
+    "decline": ".decline",
+    "Schedule": "._schedule",
+    "Allocate": "._allocate",
+    "DCA": "._decline",
+    "PeriodVolumes": "._decline",
+    "MultiPhaseDCA": "._multiphase",
+}
+
+__all__ = list(_LAZY)
+
+if TYPE_CHECKING:
+    from . import decline
+    from ._schedule import Schedule
+    from ._allocate import Allocate
+    from ._decline import DCA, PeriodVolumes
+    from ._multiphase import MultiPhaseDCA
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(_LAZY[name], __name__)
+    value = module if name == "decline" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
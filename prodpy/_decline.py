@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Literal, TYPE_CHECKING
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Dict, List, Optional, Literal, Tuple, TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
@@ -12,19 +15,59 @@ if TYPE_CHECKING:
 # Use your internal modules (fallback friendly if importing locally)
 try:
     from prodpy import Schedule
-    from prodpy.decline import Arps, FitResult
+    from prodpy.decline import Arps, Backtest, FitResult, FitTable, OnlineFit, Segments, decay_weights, uptime_weights
 except Exception:
     from ._schedule import Schedule
     from .decline._arps import Arps, FitResult
+    from .decline._backtest import Backtest
+    from .decline._online import OnlineFit
+    from .decline._segment import Segments
+    from .decline._table import FitTable
+    from .decline._weights import decay_weights, uptime_weights
+
+DeclineMode = Literal['exponential', 'hyperbolic', 'harmonic', 'modified', 'exp', 'hyp', 'har', 'mod']
+
+# calendar period -> pandas period-start alias used for the volume grid
+_PERIOD_FREQ = {'M': 'MS', 'MS': 'MS', 'Q': 'QS', 'QS': 'QS', 'Y': 'YS', 'YS': 'YS', 'A': 'YS', 'AS': 'YS'}
+
+
+@dataclass(frozen=True)
+class PeriodVolumes:
+    '''
+    Forecast volumes per calendar period (see `DCA.volumes`).
+
+    Period i runs from ``start[i]`` to ``start[i + 1]`` (the last one to
+    `end`) and produces ``volume[i]``, in rate units times days.
+    '''
+
+    start: np.ndarray
+    end: np.datetime64
+    days: np.ndarray
+    volume: np.ndarray
+    freq: str = 'MS'
+
+    def __len__(self) -> int:
+        return self.volume.size
+
+    @property
+    def cumulative(self) -> np.ndarray:
+        '''Running total of the period volumes.'''
+        return np.cumsum(self.volume)
+
+    def to_frame(self) -> pd.DataFrame:
+        '''Volumes as a DataFrame indexed by period start.'''
+        return pd.DataFrame(
+            {'days': self.days, 'volume': self.volume},
+            index=pd.DatetimeIndex(self.start, name='start'),
+        )
 
-DeclineMode = Literal['exponential', 'hyperbolic', 'harmonic', 'exp', 'hyp', 'har']
 
 @dataclass
 class DCA:
     '''
     Decline Curve Analysis front-end that couples:
       - Schedule: robust time handling & elapsed days
-      - Arps:     model selection + fitting (exp/hyp/har)
+      - Arps:     model selection + fitting (exp/hyp/har/modified)
 
     Parameters
     ----------
@@ -46,6 +89,11 @@ class DCA:
     _q_obs: Optional[np.ndarray] = None
     _fit: Optional[FitResult] = None
     _arps_hat: Optional[Arps] = None
+    _online: Optional[OnlineFit] = None
+    _fit_end: Optional[pd.Timestamp] = None
+    _segments: Optional[Segments] = None
+    _weighted: bool = False
+    _forecasts: Dict[tuple, pd.DataFrame] = field(default_factory=dict, repr=False, compare=False)
 
     # ---------------- API ----------------
     def fit(
@@ -53,24 +101,205 @@ class DCA:
         model: DeclineMode = 'hyperbolic',
         *,
         b: Optional[float] = None,
+        dmin: Optional[float] = None,
+        free_b: bool = False,
+        robust: Optional[str] = None,
+        weights: Optional[np.ndarray | str] = None,
+        half_life: Optional[float] = None,
+        uptime_col: Optional[str] = None,
+        mask: Optional[np.ndarray | str] = None,
         fit_start: Optional[pd.Timestamp | str] = None,
         fit_end: Optional[pd.Timestamp | str] = None,
-        xi: float = 0.0,
+        xi: float | str = 0.0,
     ) -> 'DCA':
         '''
         Fit an Arps decline model to the data.
 
         Parameters
         ----------
-        model : {'exponential','hyperbolic','harmonic','exp','hyp','har'}
+        model : {'exponential','hyperbolic','harmonic','modified','exp','hyp','har','mod'}
             Model family to use. (Hyperbolic can accept a fixed `b`.)
+            'modified' is a hyperbolic decline that switches to exponential
+            once the nominal decline falls to `dmin`.
         b : float, optional
             Hyperbolic exponent (0<=b<=1). If None, uses Arps default mapping.
+        dmin : float, optional
+            Terminal nominal decline (1/day) of the modified hyperbolic model;
+            selects 'modified' when given with another hyperbolic `model`.
+        free_b : bool, default False
+            Estimate the hyperbolic exponent together with di and qi (b-grid
+            warm start + joint refinement). Overrides `model` and `b`.
+        robust : {'huber', 'tukey'}, optional
+            Fit by iteratively reweighted least squares so shut-in days and
+            test spikes are downweighted instead of pulling the curve.
+        weights : array or str, optional
+            Per-row weights (aligned with `df`) or the name of a weight column.
+        half_life : float, optional
+            Time-decay weighting in days: rows `half_life` days before the
+            last fitted one count half, so recent months dominate.
+        uptime_col : str, optional
+            Column with the producing fraction of each period; partially
+            shut-in periods are weighted by it (see `uptime_weights`).
+        mask : array or str, optional
+            Rows to fit (True), aligned with `df`, or the name of a boolean
+            column, e.g. from `quality_mask`; other rows stay in the history.
         fit_start, fit_end : optional
             Limit the fit window in calendar time (inclusive).
         xi : float, default 0.0
             Start time shift (in days) for model evaluation (e.g., to ignore early time).
+            "auto" searches it with `Arps.scan_xi`.
         '''
+        # 1-3) Schedule, elapsed days and the valid (t, q) samples of the fit window
+        s, t_all, q_all, t, q, good = self._window(fit_start, fit_end, mask)
+        w = self._weights(good, t, weights, half_life, uptime_col)
+
+        # 4) Configure Arps orchestrator with chosen mode/b
+        #    Arps maps mode<->b and instantiates correct model class under the hood.
+        arps = _configure(model, b, dmin, qi=float(np.nanmax(q)))
+
+        # 5) Fit (linearized init + non-linear curve_fit refinement, returns FitResult)
+        if xi == 'auto':
+            xi = arps.scan_xi(t, q)[0]
+        self._fit = arps.fit(t, q, xi=xi, free_b=free_b, robust=robust, weights=w)
+
+        self._segments = None
+        self._weighted = w is not None or robust is not None
+        self._finish(t, q, fit_end, s, t_all, q_all)
+        return self
+
+    @classmethod
+    def fit_many(
+        cls,
+        df: pd.DataFrame,
+        *,
+        well_col: str = 'well',
+        date_col: str = 'date',
+        rate_col: str = 'rate',
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        **fit_kwargs,
+    ) -> FitTable:
+        '''
+        Fit every well of a long-format table (one row per well and date).
+
+        The table is partitioned by `well_col` with one sort (rows need not
+        be ordered), and the wells are fitted with `fit` (`fit_kwargs` are
+        passed through) in a process pool. Wells are submitted in batches of
+        `chunksize` (default: about four batches per worker) so each task
+        carries enough work to amortize its scheduling and pickling, and
+        only the columns a fit needs are shipped to the workers. A row `mask`
+        of the whole table (e.g. from `quality_mask` with
+        ``wells=df[well_col]``) and per-row `weights` or `uptime_col` arrays
+        are split with the rows.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Long-format production table.
+        well_col, date_col, rate_col : str
+            Well id, date and rate columns.
+        workers : int, optional
+            Number of processes (default: all CPUs); 1 fits in this process.
+        chunksize : int, optional
+            Wells per task.
+
+        Returns
+        -------
+        FitTable
+            One row per well, sorted by well id. Wells whose fit raised keep
+            NaN parameters and the exception message in `error`.
+        '''
+        fit_kwargs = dict(fit_kwargs)
+        data = {date_col: pd.to_datetime(df[date_col]).to_numpy(), rate_col: df[rate_col].to_numpy()}
+        for key in ('weights', 'uptime_col'):
+            value = fit_kwargs.get(key)
+            if isinstance(value, str):
+                data[value] = df[value].to_numpy()
+            elif value is not None:
+                # per-row arrays travel with their well's rows, one column each
+                col = f'__{key}__'
+                data[col] = np.asarray(value, dtype=float)
+                if data[col].shape != (df.shape[0],):
+                    raise ValueError(f'{key} must have one value per row of df.')
+                fit_kwargs[key] = col
+        mask = fit_kwargs.get('mask')
+        if mask is not None:
+            # the row mask travels like the weights, without copying df
+            data['__mask__'] = np.asarray(df[mask] if isinstance(mask, str) else mask, dtype=bool)
+            if data['__mask__'].shape != (df.shape[0],):
+                raise ValueError('mask must have one value per row of df.')
+            fit_kwargs['mask'] = '__mask__'
+
+        codes, keys = pd.factorize(df[well_col], sort=True)
+        # one sort by (well, date) partitions the table into time-ordered wells
+        keep = codes >= 0
+        order = np.lexsort((data[date_col][keep], codes[keep]))
+        bounds = np.searchsorted(codes[keep][order], np.arange(keys.size + 1))
+        data = {c: v[keep][order] for c, v in data.items()}
+        parts = [
+            {c: v[bounds[i]:bounds[i + 1]] for c, v in data.items()}
+            for i in range(keys.size)
+        ]
+
+        workers = (os.cpu_count() or 1) if workers is None else int(workers)
+        if workers < 1:
+            raise ValueError('workers must be >= 1.')
+        if chunksize is None:
+            chunksize = max(1, -(-len(parts) // (4 * workers)))
+        chunks = [parts[i:i + chunksize] for i in range(0, len(parts), chunksize)]
+
+        task = partial(_fit_chunk, date_col=date_col, rate_col=rate_col, fit_kwargs=fit_kwargs)
+        if workers == 1 or len(chunks) <= 1:
+            done = [task(chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+                done = list(pool.map(task, chunks))
+
+        rows = [row for chunk in done for row in chunk]
+        return FitTable.from_results(
+            [fit for fit, _ in rows],
+            well=np.asarray(keys),
+            error=[error for _, error in rows],
+        )
+
+    def fit_segments(
+        self,
+        model: DeclineMode = 'hyperbolic',
+        *,
+        b: Optional[float] = None,
+        max_segments: int = 4,
+        min_size: int = 6,
+        criterion: str = 'bic',
+        mask: Optional[np.ndarray | str] = None,
+        fit_start: Optional[pd.Timestamp | str] = None,
+        fit_end: Optional[pd.Timestamp | str] = None,
+    ) -> 'DCA':
+        '''
+        Fit a piecewise decline whose segment boundaries are found automatically.
+
+        Workovers and choke changes restart the decline; `Arps.segment`
+        locates up to `max_segments` segments of at least `min_size` samples
+        and keeps the count with the lowest `criterion`. The last segment is
+        then refitted like `fit` (with `xi` at its start) and drives `run`,
+        `update` and `plot`; earlier segments only shape the fitted history.
+        The segments are available as `segments`; `mask` is that of `fit`.
+        '''
+        s, t_all, q_all, t, q, _ = self._window(fit_start, fit_end, mask)
+        arps = _configure(model, b, None, qi=float(np.nanmax(q)))
+
+        self._segments = arps.segment(t, q, max_segments=max_segments, min_size=min_size, criterion=criterion)
+        self._fit = arps.fit(t, q, xi=self._segments.last.xi)
+        self._weighted = False
+        self._finish(t, q, fit_end, s, t_all, q_all)
+        return self
+
+    @property
+    def segments(self) -> Optional[Segments]:
+        '''Segments of the last `fit_segments` (None after a single-window `fit`).'''
+        return self._segments
+
+    def _window(self, fit_start, fit_end, keep=None):
+        '''Schedule, elapsed days, rates, and the valid samples inside the fit window with their row mask.'''
         # 1) Build schedule & elapsed days
         s = Schedule(pd.to_datetime(self.df[self.date_col]))
         t_all = s.days_since_start()  # float days since first date (robust & vectorized)
@@ -85,33 +314,130 @@ class DCA:
         # 3) Pull observed rates, ensure numeric/finite
         q_all = pd.to_numeric(self.df[self.rate_col], errors='coerce').to_numpy()
         good = mask & np.isfinite(q_all) & (q_all > 0)
+        if keep is not None:
+            keep = np.asarray(self.df[keep] if isinstance(keep, str) else keep, dtype=bool)
+            if keep.shape != good.shape:
+                raise ValueError('mask must have one value per row of df.')
+            good &= keep
 
         t = t_all[good]
         q = q_all[good]
 
         if t.size < 3:
             raise ValueError('Not enough valid (t, q) points to fit (need >= 3).')
+        return s, t_all, q_all, t, q, good
+
+    def _weights(self, good, t, weights, half_life, uptime_col) -> Optional[np.ndarray]:
+        '''Product of the requested per-row weights on the fitted samples (None if unweighted).'''
+        w = None
+        if weights is not None:
+            col = self.df[weights] if isinstance(weights, str) else weights
+            w = np.asarray(pd.to_numeric(pd.Series(np.asarray(col)), errors='coerce'), dtype=float)
+            if w.shape != good.shape:
+                raise ValueError('weights must have one value per row of df.')
+            w = np.nan_to_num(w[good], nan=0.0)
+        if uptime_col is not None:
+            up = uptime_weights(pd.to_numeric(self.df[uptime_col], errors='coerce').to_numpy()[good])
+            w = up if w is None else w * up
+        if half_life is not None:
+            decay = decay_weights(t, half_life)
+            w = decay if w is None else w * decay
+        return w
+
+    def _finish(self, t, q, fit_end, s, t_all, q_all) -> None:
+        '''State shared by `fit` and `fit_segments` once `_fit` is set.'''
+        self._arps_hat = Arps.from_result(self._fit)
+
+        # 6) Keep running regression sums so `update` can refit incrementally
+        self._online = OnlineFit.from_result(self._arps_hat, t, q, self._fit)
+        self._fit_end = None if fit_end is None else pd.Timestamp(fit_end)
+
+        # 7) Cache for plotting/forecasting
+        self._sched, self._t_days, self._q_obs = s, t_all, q_all
+        self._forecasts.clear()
 
-        # 4) Configure Arps orchestrator with chosen mode/b
-        #    Arps maps mode<->b and instantiates correct model class under the hood.
-        mode_name, b_eff = Arps.option(mode=model.lower(), b=b)
-        arps = Arps(di=1.0, qi=float(np.nanmax(q)), b=b_eff, mode=mode_name)
-
-        # 5) Fit (linearized init + non-linear curve_fit refinement, returns FitResult)
-        self._fit = arps.fit(t, q, xi=xi)
+    def update(self, df: pd.DataFrame, *, rtol: Optional[float] = None) -> 'DCA':
+        '''
+        Append rows newer than the fitted history and refresh the fit.
 
-        self._arps_hat = Arps(di=self._fit.di, qi=self._fit.qi, b=self._fit.b)
+        Only the new rows are parsed and added to the running regression
+        sums; the non-linear polish reruns only when the linear estimate moves
+        by more than `rtol` (see `OnlineFit`). The model family, `b` and `xi`
+        of the last `fit` are kept, and rows after its `fit_end` are added to
+        the history without entering the fit. If the refit raises, the DCA
+        (history, fit and running sums) is left as it was.
 
-        # 6) Cache for plotting/forecasting
-        self._sched, self._t_days, self._q_obs = s, t_all, q_all
+        Parameters
+        ----------
+        df : pd.DataFrame
+            New rows with the same date and rate columns, all later than the
+            last fitted date.
+        rtol : float, optional
+            Relative change of the linear (di, qi) that triggers the polish.
+        '''
+        if self._online is None or self._sched is None:
+            raise RuntimeError('Call .fit(...) before updating.')
+        if self._weighted:
+            raise RuntimeError('update keeps unweighted running sums; refit weighted or robust fits with .fit(...).')
+        if df.shape[0] == 0:
+            return self
+
+        new = Schedule(pd.to_datetime(df[self.date_col]))
+        if new.series.iloc[0] <= self._sched.series.iloc[-1]:
+            raise ValueError('New rows must be later than the existing history.')
+
+        t_new = new.days_since(self._sched.series.iloc[0])
+        q_new = pd.to_numeric(df.loc[new.series.index, self.rate_col], errors='coerce').to_numpy()
+
+        use = np.ones(t_new.size, dtype=bool)
+        if self._fit_end is not None:
+            use = new.isprior(self._fit_end)
+
+        self._fit = self._online.update(t_new[use], q_new[use], rtol=rtol)
+        self._arps_hat = Arps.from_result(self._fit)
+
+        # fresh labels: a new batch usually restarts at 0, and the schedule
+        # aligns to df rows by label
+        self.df = pd.concat([self.df, df], ignore_index=True)
+        self._sched = Schedule(pd.to_datetime(self.df[self.date_col]))
+        self._t_days = np.concatenate([self._t_days, t_new])
+        self._q_obs = np.concatenate([self._q_obs, q_new])
+        self._forecasts.clear()
 
         return self
 
+    def backtest(
+        self,
+        model: DeclineMode = 'hyperbolic',
+        *,
+        b: Optional[float] = None,
+        dmin: Optional[float] = None,
+        horizon: int = 12,
+        window: Optional[int] = None,
+        min_points: int = 6,
+    ) -> Backtest:
+        '''
+        Hindcast the chosen model over the whole history (see `Arps.backtest`).
+
+        Every sample is a cutoff: the model is fitted to the data up to it
+        (expanding, or the last `window` samples) and the next `horizon`
+        samples are forecast and scored. Times are days since the first date.
+        '''
+        s = Schedule(pd.to_datetime(self.df[self.date_col]))
+        q = pd.to_numeric(self.df.loc[s.series.index, self.rate_col], errors='coerce').to_numpy()
+
+        arps = _configure(model, b, dmin)
+        return arps.backtest(
+            s.days_since_start(), q,
+            wells=np.zeros(s.size, dtype=int),
+            horizon=horizon, window=window, min_points=min_points,
+        )
+
     def run(
         self,
         *,
         periods: Optional[int] = None,
-        horizon_days: Optional[int] = 365,
+        horizon_days: Optional[int | str] = 365,
         econ_rate: Optional[float] = None,
     ) -> pd.DataFrame:
         '''
@@ -121,18 +447,35 @@ class DCA:
         ----------
         periods : int, optional
             Number of *additional* samples after last history. If None, infer from horizon_days.
-        horizon_days : int, optional
+        horizon_days : int or 'econ', optional
             If periods is None, extend by this many days beyond last history (default 365).
+            'econ' forecasts until the economic limit (requires `econ_rate`).
         econ_rate : float, optional
-            If provided, stop forecast once q(t) drops below this rate.
+            If provided, stop forecast once q(t) drops below this rate. The
+            cutoff time comes from the model's closed-form inverse, and the
+            grid is only built and evaluated up to it.
+
+        Forecasts are memoized per (periods, horizon_days, econ_rate) until
+        the next `fit`, `fit_segments` or `update`; every call returns its
+        own copy.
 
         Returns
         -------
         DataFrame with columns: ['date','t_days','q_hist','q_fit','q_forecast','N_forecast'].
         '''
+        return self._forecast(periods, horizon_days, econ_rate).copy()
+
+    def _forecast(self, periods, horizon_days, econ_rate) -> pd.DataFrame:
+        '''Memoized forecast frame shared by `run` and `plot` (do not modify).'''
         if self._sched is None or self._fit is None:
             raise RuntimeError('Call .fit(...) before forecasting.')
 
+        key = (periods, horizon_days, econ_rate)
+        if key not in self._forecasts:
+            self._forecasts[key] = self._build_forecast(periods, horizon_days, econ_rate)
+        return self._forecasts[key]
+
+    def _build_forecast(self, periods, horizon_days, econ_rate) -> pd.DataFrame:
         s = self._sched
         t_all = self._t_days
         q_all = self._q_obs
@@ -145,43 +488,137 @@ class DCA:
         else:
             dt = 1.0
 
-        # Build future time grid
+        # Economic limit: time at which the fitted rate reaches econ_rate
+        t_ec = np.inf
+        if econ_rate is not None:
+            if not econ_rate > 0:
+                raise ValueError('econ_rate must be > 0.')
+            t_ec = self._fit.xi + float(self._arps_hat.model.t_at_q(econ_rate))
+
+        # Build future time grid, no further than the economic limit
         t_last = float(t_all[-1]) if t_all.size else 0.0
-        if periods is None:
+        if periods is None and horizon_days == 'econ':
+            if econ_rate is None:
+                raise ValueError("horizon_days='econ' requires econ_rate.")
+            if not np.isfinite(t_ec):
+                raise ValueError('The fitted model never reaches econ_rate.')
+            periods = max(0, int(np.floor((t_ec - t_last) / dt)))
+        elif periods is None:
             horizon = float(horizon_days or 365)
             periods = max(1, int(np.ceil(horizon / dt)))
+        if np.isfinite(t_ec):
+            periods = min(periods, max(0, int(np.floor((t_ec - t_last) / dt))))
+
+        nhist = t_all.size
+        t_grid = np.empty(nhist + periods)
+        t_grid[:nhist] = t_all
+        t_grid[nhist:] = t_last + dt * np.arange(1, periods + 1, dtype=float)
+
+        # Rate & cum on the full grid in one pass of the Arps orchestrator
+        q_fit_full, N_full = self._arps_hat.evaluate(t_grid, xi=self._fit.xi)
+        if self._segments is not None:
+            # history before the last segment follows the earlier segments, and
+            # the cumulative keeps counting their volume across the change points
+            before = t_grid < self._fit.xi
+            q_fit_full[before] = self._segments.run(t_grid[before])
+            N_full[before] = self._segments.run(t_grid[before], cum=True)
+            N_full[~before] += self._segments.run([self._fit.xi], cum=True)[0]
+
+        # History past the economic limit (the future grid already stops there)
+        past = t_grid > t_ec
+        q_fit_full[past] = np.nan
+        N_full[past] = np.nan
+
+        # Calendar dates: history as parsed, then the last date stepped at the same cadence
+        dates = np.empty(t_grid.size, dtype='datetime64[ns]')
+        dates[:nhist] = s.series.to_numpy(dtype='datetime64[ns]')
+        offsets = np.round((t_grid[nhist:] - t_last) * 86400e9).astype('timedelta64[ns]')
+        dates[nhist:] = s.series.iloc[-1].to_datetime64() + offsets
+
+        q_hist = np.full(t_grid.size, np.nan)
+        q_hist[:nhist] = q_all
+        q_forecast = q_fit_full.copy()
+        q_forecast[:max(nhist - 1, 0)] = np.nan  # the model's forecasted segment only
+
+        return pd.DataFrame({
+            'date': dates,
+            't_days': t_grid,
+            'q_hist': q_hist,
+            'q_fit': q_fit_full,
+            'q_forecast': q_forecast,
+            'N_forecast': N_full,
+        })
 
-        t_future = t_last + dt * np.arange(1, periods + 1, dtype=float)
-        t_grid = np.concatenate([t_all, t_future])
-
-        # Evaluate model on full grid (rate & cum) using Arps orchestrator
-        q_fit_full = self._arps_hat.run(t_grid, xi=self._fit.xi, cum=False)
-        N_full = self._arps_hat.run(t_grid, xi=self._fit.xi, cum=True)
+    def volumes(
+        self,
+        freq: str = 'M',
+        *,
+        periods: int = 12,
+        start: Optional[pd.Timestamp | str] = None,
+        uptime: Optional[float | np.ndarray] = None,
+        econ_rate: Optional[float] = None,
+    ) -> PeriodVolumes:
+        '''
+        Exact forecast volumes per calendar month, quarter or year.
 
-        # Economic cutoff (optional)
-        if econ_rate is not None and np.nanmin(q_fit_full) <= econ_rate:
-            cut_idx = np.argmax(q_fit_full < econ_rate)
-            if cut_idx > 0:
-                q_fit_full[cut_idx:] = np.nan
-                N_full[cut_idx:] = np.nan
+        Period edges come from `Schedule.get` and every volume is the
+        difference N(t_end) - N(t_start) of the fitted cumulative, evaluated
+        once for all edges, so no rate is integrated numerically.
 
-        # Assemble DataFrame on calendar time using Schedule + original + extended dates
-        # Extend calendar using last date and the same cadence
-        last_date = s.series.iloc[-1]
-        future_dates = last_date + pd.to_timedelta(np.round((t_future - t_last), 9), unit='D')
-        date_full = pd.Index(s.series).append(pd.Index(future_dates))
+        Parameters
+        ----------
+        freq : {'M', 'Q', 'Y'}, default 'M'
+            Calendar period.
+        periods : int, default 12
+            Number of periods.
+        start : optional
+            Start of the first period (default: the last history date); the
+            first period ends at the next calendar boundary.
+        uptime : float or array, optional
+            Producing fraction of every period (scalar or one per period);
+            volumes are scaled by it.
+        econ_rate : float, optional
+            No production after the fitted rate reaches this rate.
 
-        df = pd.DataFrame({
-            'date': date_full.to_numpy(),
-            't_days': t_grid,
-            'q_hist': np.pad(q_all.astype(float), (0, t_future.size), constant_values=np.nan),
-            'q_fit': q_fit_full,
-        })
-        # separate column for the model's forecasted segment only
-        df['q_forecast'] = df['q_fit'].where(df.index >= (len(t_all) - 1), np.nan)
-        df['N_forecast'] = N_full
-        
-        return df
+        Volumes before the fitted `xi` (e.g. the start of the last segment)
+        are not counted.
+        '''
+        if self._sched is None or self._fit is None:
+            raise RuntimeError('Call .fit(...) before forecasting.')
+        alias = _PERIOD_FREQ.get(freq.upper())
+        if alias is None:
+            raise ValueError(f"freq must be one of 'M', 'Q' or 'Y', got {freq!r}.")
+        if periods < 1:
+            raise ValueError('periods must be >= 1.')
+
+        t0 = self._sched.series.iloc[0]
+        first = self._sched.series.iloc[-1] if start is None else pd.Timestamp(start)
+        floor = first.to_period(alias[0]).to_timestamp()
+
+        # calendar boundaries after `first`; the first period may be partial
+        edges = Schedule.get((floor, floor), freq=alias, periods=periods + 1).series.to_numpy(dtype='datetime64[ns]').copy()
+        edges[0] = first.to_datetime64()
+
+        t = (edges - t0.to_datetime64()) / np.timedelta64(1, 'D')
+        t = np.maximum(t, self._fit.xi)
+        if econ_rate is not None:
+            if not econ_rate > 0:
+                raise ValueError('econ_rate must be > 0.')
+            t = np.minimum(t, self._fit.xi + float(self._arps_hat.model.t_at_q(econ_rate)))
+
+        N = self._arps_hat.run(t, xi=self._fit.xi, cum=True)
+        volume = np.diff(N)
+        if uptime is not None:
+            up = np.broadcast_to(np.asarray(uptime, dtype=float), volume.shape)
+            volume = volume * np.clip(up, 0.0, 1.0)
+
+        return PeriodVolumes(
+            start=edges[:-1],
+            end=edges[-1],
+            days=np.diff(edges) / np.timedelta64(1, 'D'),
+            volume=volume,
+            freq=alias,
+        )
 
     def plot(
         self,
@@ -203,7 +640,7 @@ class DCA:
         except ImportError as exc:
             raise ImportError('Plotting requires matplotlib. Install prodpy[plots].') from exc
 
-        fdf = self.run(periods=periods, horizon_days=horizon_days)
+        fdf = self._forecast(periods, horizon_days, None)
 
         if ax is None:
             _, ax = plt.subplots(figsize=(8.5, 5.0))
@@ -226,3 +663,32 @@ class DCA:
             plt.tight_layout()
             plt.show()
         return ax
+
+
+def _fit_chunk(
+    chunk: List[Dict[str, np.ndarray]],
+    *,
+    date_col: str,
+    rate_col: str,
+    fit_kwargs: Dict[str, Any],
+) -> List[Tuple[Optional[FitResult], str]]:
+    '''Fit a batch of wells (`DCA.fit_many` task); failures become (None, message).'''
+    out = []
+    for columns in chunk:
+        try:
+            dca = DCA(pd.DataFrame(columns), date_col=date_col, rate_col=rate_col)
+            out.append((dca.fit(**fit_kwargs)._fit, ''))
+        except Exception as exc:  # captured per well, reported in FitTable.error
+            out.append((None, f'{type(exc).__name__}: {exc}'))
+    return out
+
+
+def _configure(model: str, b: Optional[float], dmin: Optional[float], qi: float = 1.0) -> Arps:
+    """Arps orchestrator for a DCA model name, `b` and terminal decline."""
+    mode = model.lower()
+    if dmin is not None and mode not in ('exponential', 'exp', 'harmonic', 'har'):
+        mode = 'modified'
+    mode_name, b_eff = Arps.option(mode=mode, b=b)
+    if mode_name == 'Modified':
+        return Arps(di=1.0, qi=qi, b=b_eff, mode='modified', dmin=0.0 if dmin is None else dmin)
+    return Arps(di=1.0, qi=qi, b=b_eff, mode=mode_name)
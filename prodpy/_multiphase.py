@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Use your internal modules (fallback friendly if importing locally)
+try:
+    from prodpy import Schedule
+    from prodpy.decline import Arps, FitTable, decay_weights, uptime_weights
+except Exception:
+    from ._schedule import Schedule
+    from .decline._arps import Arps
+    from .decline._table import FitTable
+    from .decline._weights import decay_weights, uptime_weights
+
+from ._decline import DeclineMode, _configure
+from .decline._linstats import LinearFit, LinearStats
+from .decline._robust import _irls
+
+
+@dataclass
+class MultiPhaseDCA:
+    '''
+    Decline Curve Analysis of several phases of one well on a shared time axis.
+
+    Dates are parsed and the `Schedule`, elapsed days and fit window are
+    built once for all phases. Every phase is one group of a single
+    `Arps.fit_batch` call, whose linearized estimates seed the same
+    non-linear polish as `DCA.fit` (so each phase matches a `DCA.fit` of
+    its column), and the phase forecasts are evaluated together as an
+    `ArpsBatch`.
+
+    Water and gas are usually forecast through their ratio to oil instead
+    of a decline of their own (rising water cannot be fitted by Arps): the
+    log water-oil and gas-oil ratios are regressed on the fitted oil
+    cumulative, the classic semilog WOR/GOR-vs-Np trends, and the water and
+    gas rates are the oil forecast times the extrapolated ratio. Water cut,
+    WOR and GOR are then consistent with the phase forecasts by construction.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Must contain a datetime column and one rate column per phase.
+    date_col : str, default "date"
+        Name of the datetime-like column.
+    oil_col, water_col, gas_col : str or None
+        Rate columns of the phases; None leaves a phase out.
+    '''
+
+    df: pd.DataFrame
+    date_col: str = 'date'
+    oil_col: Optional[str] = 'oil'
+    water_col: Optional[str] = 'water'
+    gas_col: Optional[str] = 'gas'
+
+    # --- internal state after fit ---
+    _sched: Optional[Schedule] = None
+    _t_days: Optional[np.ndarray] = None
+    _q_obs: Optional[np.ndarray] = None
+    _fits: Optional[FitTable] = None
+    _trends: Optional[Dict[str, LinearFit]] = None
+
+    @property
+    def phases(self) -> List[str]:
+        '''Rate columns of the phases, in the order of the fit table rows.'''
+        return [c for c in (self.oil_col, self.water_col, self.gas_col) if c is not None]
+
+    @property
+    def fits(self) -> Optional[FitTable]:
+        '''Decline fit of every phase (one row per phase, `well` holds the column name).'''
+        return self._fits
+
+    @property
+    def ratio_trends(self) -> Optional[Dict[str, LinearFit]]:
+        '''
+        Regression of log(q_phase / q_oil) on the fitted oil cumulative, per
+        water/gas column (empty unless fitted with ``ratios=True``).
+        '''
+        return self._trends
+
+    # ---------------- API ----------------
+    def fit(
+        self,
+        model: DeclineMode = 'hyperbolic',
+        *,
+        b: Optional[float] = None,
+        dmin: Optional[float] = None,
+        robust: Optional[str] = None,
+        half_life: Optional[float] = None,
+        uptime_col: Optional[str] = None,
+        fit_start: Optional[pd.Timestamp | str] = None,
+        fit_end: Optional[pd.Timestamp | str] = None,
+        xi: float | np.ndarray | str = 0.0,
+        refine: bool = True,
+        ratios: bool = True,
+    ) -> 'MultiPhaseDCA':
+        '''
+        Fit one decline model family to every phase, and the ratio trends.
+
+        Parameters are those of `DCA.fit`; `xi` may also hold one start time
+        per phase.
+
+        refine : bool, default True
+            Polish every phase with the non-linear least squares of `DCA.fit`,
+            started from the batched linearized estimates. With False the
+            phases keep the linearized estimates of `Arps.fit_batch`, which
+            differ from `DCA.fit` on noisy data.
+        ratios : bool, default True
+            Forecast water and gas from their ratio to oil (see the class
+            docstring); a phase falls back to its own decline when its ratio
+            trend cannot be fitted. With False every phase follows its own
+            decline.
+
+        Phases that cannot be fitted (fewer than 3 positive rates, no
+        decline, or a failed polish) keep a row of NaN parameters, with the
+        reason in `error`.
+        '''
+        phases = self.phases
+        if not phases:
+            raise ValueError('Provide at least one phase column.')
+
+        # 1) Schedule & elapsed days, once for all phases
+        s = Schedule(pd.to_datetime(self.df[self.date_col]))
+        t_all = s.days_since_start()
+
+        # 2) Fit window (by calendar dates), shared by all phases
+        mask = np.ones(s.size, dtype=bool)
+        if fit_start is not None or fit_end is not None:
+            start = fit_start if fit_start is not None else s.mindate
+            end = fit_end if fit_end is not None else s.maxdate
+            mask = s.isbetween(start, end, inclusive='both')
+
+        # 3) Rates of every phase in schedule order, shape (n_phases, n_rows)
+        rows = self.df.loc[s.series.index, phases]
+        q_all = rows.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float).T
+        good = mask & np.isfinite(q_all) & (q_all > 0)
+        up = None
+        if uptime_col is not None:
+            up = uptime_weights(pd.to_numeric(self.df.loc[s.series.index, uptime_col], errors='coerce').to_numpy())
+
+        # 4) One batched linearized fit, every phase a group
+        arps = _configure(model, b, dmin)
+        table = arps.fit_batch(
+            [t_all[g] for g in good],
+            [q[g] for q, g in zip(q_all, good)],
+            xi=xi,
+            robust=robust,
+            weights=None if up is None else [up[g] for g in good],
+            half_life=half_life,
+        )
+
+        # 5) Non-linear polish of every phase, seeded by its batched estimate
+        results, errors = [], []
+        for i, g in enumerate(good):
+            row = table[i]
+            if not table.valid[i]:
+                results.append(None)
+                errors.append('ValueError: no declining trend to fit.' if g.sum() >= 3 else
+                              'ValueError: Not enough valid (t, q) points to fit (need >= 3).')
+            elif not refine:
+                results.append(row.to_result())
+                errors.append('')
+            else:
+                t = t_all[g]
+                w = None if up is None else up[g]
+                if half_life is not None:
+                    decay = decay_weights(t, half_life)
+                    w = decay if w is None else w * decay
+                try:
+                    results.append(arps.fit(t, q_all[i, g], xi=row.xi, robust=robust, weights=w, p0=(row.di, row.qi)))
+                    errors.append('')
+                except Exception as exc:  # reported per phase in FitTable.error
+                    results.append(None)
+                    errors.append(f'{type(exc).__name__}: {exc}')
+        self._fits = FitTable.from_results(results, well=np.array(phases, dtype=object), error=errors)
+
+        # 6) Ratio trends: log(q_phase / q_oil) against the fitted oil cumulative
+        self._trends = {}
+        if ratios and self.oil_col is not None and self._fits.valid[0] and len(phases) > 1:
+            Np = Arps.from_result(self._fits[0]).run(t_all, xi=self._fits.xi[0], cum=True)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                logr = np.log(q_all[1:] / q_all[0])
+            use = good[1:] & good[0] & np.isfinite(Np)
+            codes, cols = np.nonzero(use)  # ratio and row of every sample
+            x, y = Np[cols], logr[use]
+            w = None
+            if up is not None or half_life is not None:
+                w = np.ones(codes.size) if up is None else up[cols]
+                if half_life is not None:
+                    w = w * decay_weights(t_all[cols], half_life, ref=float(t_all[good[0]].max()))
+            if robust is None:
+                stats = LinearStats.from_groups(codes, x, y, len(phases) - 1, w)
+            else:
+                stats = _irls(codes, x, y, len(phases) - 1, loss=robust, w0=w)[0]
+            for k, c in enumerate(phases[1:]):
+                if stats.n[k] >= 3 and np.isfinite(stats.slope[k]):
+                    self._trends[c] = stats.take(k).result()
+
+        self._sched, self._t_days, self._q_obs = s, t_all, q_all
+        return self
+
+    def run(
+        self,
+        *,
+        periods: Optional[int] = None,
+        horizon_days: Optional[int] = 365,
+    ) -> pd.DataFrame:
+        '''
+        Forecast every phase and their ratios on the history + future grid.
+
+        The grid is that of `DCA.run`: the history dates, then `periods`
+        further steps (default: `horizon_days` worth) at the median cadence.
+
+        Returns
+        -------
+        DataFrame with 'date' and 't_days', then for every phase column c:
+        'c_hist' (observed), 'c_fit' (model rate) and 'c_cum' (model
+        cumulative since the oil `xi` for ratio-forecast phases, since the
+        phase's own `xi` otherwise), and the ratios 'water_cut' =
+        qw / (qo + qw), 'wor' = qw / qo and 'gor' = qg / qo of the phase
+        forecasts that are present.
+        '''
+        if self._sched is None or self._fits is None:
+            raise RuntimeError('Call .fit(...) before forecasting.')
+
+        s = self._sched
+        t_all = self._t_days
+        nhist = t_all.size
+
+        # Historical cadence (median dt in days) and future grid
+        dt = float(np.median(np.diff(t_all))) if nhist >= 2 else 1.0
+        if not np.isfinite(dt) or dt <= 0:
+            dt = 1.0
+        if periods is None:
+            periods = max(1, int(np.ceil(float(horizon_days or 365) / dt)))
+        t_last = float(t_all[-1])
+        t_grid = np.concatenate([t_all, t_last + dt * np.arange(1, periods + 1, dtype=float)])
+
+        # Rates & cumulatives of all phase declines, shape (n_phases, n_times)
+        ok = self._fits.valid
+        q_fit = np.full((len(ok), t_grid.size), np.nan)
+        N_fit = np.full((len(ok), t_grid.size), np.nan)
+        if np.any(ok):
+            batch = self._fits[ok].to_batch()
+            with np.errstate(invalid='ignore', over='ignore'):
+                q_fit[ok] = batch.q(t_grid)
+                N_fit[ok] = batch.N(t_grid)
+
+        # Ratio-forecast phases: oil rate times exp(c + m Np); their
+        # cumulative is the integral of the ratio over the oil cumulative
+        for k, c in enumerate(self.phases[1:], start=1):
+            trend = self._trends.get(c) if self._trends else None
+            if trend is None:
+                continue
+            m, a = trend.slope, np.exp(trend.intercept)
+            Np = np.nan_to_num(N_fit[0], nan=0.0)
+            with np.errstate(over='ignore', invalid='ignore'):
+                q_fit[k] = q_fit[0] * a * np.exp(m * Np)
+                N_fit[k] = a * (np.expm1(m * Np) / m if m != 0 else Np)
+            N_fit[k, np.isnan(N_fit[0])] = np.nan
+
+        dates = np.empty(t_grid.size, dtype='datetime64[ns]')
+        dates[:nhist] = s.series.to_numpy(dtype='datetime64[ns]')
+        offsets = np.round((t_grid[nhist:] - t_last) * 86400e9).astype('timedelta64[ns]')
+        dates[nhist:] = s.series.iloc[-1].to_datetime64() + offsets
+
+        out = {'date': dates, 't_days': t_grid}
+        for i, c in enumerate(self.phases):
+            hist = np.full(t_grid.size, np.nan)
+            hist[:nhist] = self._q_obs[i]
+            out[f'{c}_hist'] = hist
+            out[f'{c}_fit'] = q_fit[i]
+            out[f'{c}_cum'] = N_fit[i]
+
+        q = dict(zip(self.phases, q_fit))
+        qo, qw, qg = (q.get(c) for c in (self.oil_col, self.water_col, self.gas_col))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if qo is not None and qw is not None:
+                out['water_cut'] = qw / (qo + qw)
+                out['wor'] = qw / qo
+            if qo is not None and qg is not None:
+                out['gor'] = qg / qo
+
+        return pd.DataFrame(out)
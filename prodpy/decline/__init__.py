@@ -1,4 +1,57 @@
-from ._arps import Arps, FitResult
-from ._exponential import Exponential
-from ._hyperbolic import Hyperbolic
-from ._harmonic import Harmonic
\ No newline at end of file
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Public names are imported on first access (PEP 562); SciPy itself is
+# only imported inside the fitting routines that use it.
+_LAZY = {
+    "Arps": "._arps",
+    "FitResult": "._arps",
+    "Backtest": "._backtest",
+    "ArpsBatch": "._batch",
+    "OnlineFit": "._online",
+    "solve_time": "._inverse",
+    "quality_mask": "._quality",
+    "Sampler": "._sample",
+    "Segments": "._segment",
+    "Selection": "._select",
+    "BatchFit": "._table",
+    "FitRow": "._table",
+    "FitTable": "._table",
+    "decay_weights": "._weights",
+    "uptime_weights": "._weights",
+    "Exponential": "._exponential",
+    "Hyperbolic": "._hyperbolic",
+    "ModifiedHyperbolic": "._modified",
+    "Harmonic": "._harmonic",
+}
+
+__all__ = list(_LAZY)
+
+if TYPE_CHECKING:
+    from ._arps import Arps, FitResult
+    from ._backtest import Backtest
+    from ._batch import ArpsBatch
+    from ._inverse import solve_time
+    from ._online import OnlineFit
+    from ._quality import quality_mask
+    from ._sample import Sampler
+    from ._segment import Segments
+    from ._select import Selection
+    from ._table import BatchFit, FitRow, FitTable
+    from ._weights import decay_weights, uptime_weights
+    from ._exponential import Exponential
+    from ._hyperbolic import Hyperbolic
+    from ._modified import ModifiedHyperbolic
+    from ._harmonic import Harmonic
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
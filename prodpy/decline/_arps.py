@@ -2,13 +2,11 @@ from __future__ import annotations
 
 import logging
 import math
-from dataclasses import dataclass
-from typing import Dict, Tuple, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
 
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
-from scipy.stats import linregress, t
-from scipy.optimize import curve_fit
 
 # Adjust imports to your package structure
 try:
@@ -20,8 +18,18 @@ except Exception:
     from ._hyperbolic import Hyperbolic
     from ._harmonic import Harmonic
 
+from ._modified import ModifiedHyperbolic
+from ._backtest import Backtest, _hindcast
+from ._batch import _group
+from ._linstats import LinearStats
+from ._robust import _irls
+from ._weights import _flatten, _group_decay, _normalize
+from ._segment import Segments, _partition
+from ._select import MODELS, Selection, _criteria
+from ._table import FitTable
+
 Number = float | int
-ModelLike = Exponential | Harmonic | Hyperbolic
+ModelLike = Exponential | Harmonic | Hyperbolic | ModifiedHyperbolic
 
 
 def _as_array(x: ArrayLike) -> NDArray[np.float64]:
@@ -37,6 +45,27 @@ def _shift(x: NDArray[np.float64], y: NDArray[np.float64], *, xi: Number = 0.0)
     mask = x >= xi
     return (x[mask] - xi, y[mask])
 
+def _weighted(x: NDArray[np.float64], y: NDArray[np.float64], w: Optional[ArrayLike], *, xi: Number = 0.0):
+    """`_shift` and `_nzero` that carry per-sample weights along (rescaled to a mean of one)."""
+    if w is None:
+        xx, yy = _nzero(*_shift(x, y, xi=xi))
+        return xx, yy, None
+    mask = (~np.isnan(y)) & (y != 0.0)
+    if xi != 0:
+        mask &= x >= xi
+    ww = np.broadcast_to(_as_array(w), x.shape)[mask]
+    if np.any(~np.isfinite(ww)) or np.any(ww < 0):
+        raise ValueError("weights must be finite and >= 0.")
+    return x[mask] - xi, y[mask], _normalize(np.zeros(ww.size, dtype=np.intp), ww, 1)
+
+def _check_fitted(di: float, qi: float) -> None:
+    """Reject non-linear fits that left the declining-model domain (di, qi > 0)."""
+    if not (di > 0 and qi > 0):
+        raise ValueError(
+            f"Non-linear fit did not converge to a declining model (di={di:.6g}, qi={qi:.6g}); "
+            "the data may not decline."
+        )
+
 @dataclass(frozen=True)
 class FitResult:
     b: float
@@ -48,16 +77,24 @@ class FitResult:
     di_error: float
     qi_error: float
     linear: object  # scipy.stats._stats_py.LinregressResult, but we avoid private type
+    b_error: float = float("nan")  # only estimated by free-b hyperbolic fits
+    dmin: float = 0.0  # terminal decline of modified hyperbolic fits
+    cov: Optional[NDArray[np.float64]] = field(default=None, compare=False, repr=False)  # (di, qi[, b]) covariance
 
 class Arps:
     """
-    Orchestrator for Arps decline models (Exponential, Hyperbolic, Harmonic).
+    Orchestrator for Arps decline models (Exponential, Hyperbolic, Harmonic,
+    ModifiedHyperbolic).
 
     Choose model via `b` or `mode`:
       b=0     → Exponential
       0<b<1   → Hyperbolic (b fixed)
       b=1     → Harmonic
-      mode in {"exponential"|"exp", "hyperbolic"|"hyp", "harmonic"|"har"}
+      mode in {"exponential"|"exp", "hyperbolic"|"hyp", "harmonic"|"har",
+               "modified"|"mod"}
+
+    The modified hyperbolic (b fixed, terminal decline `dmin`) is chosen by
+    mode "modified" or by passing `dmin` without a mode.
 
     Parameters
     ----------
@@ -69,6 +106,8 @@ class Arps:
         Arps exponent; ignored if `mode` provided
     mode : str, optional
         Model kind (case-insensitive synonyms accepted)
+    dmin : float, optional
+        Terminal nominal decline of the modified hyperbolic model (1/time)
     """
 
     _MODE_BY_BOUNDS = {0.0: "Exponential", 1.0: "Harmonic"}
@@ -76,18 +115,41 @@ class Arps:
         "exponential": 0.0, "exp": 0.0,
         "hyperbolic": 0.5,  "hyp": 0.5,   # default b for convenience
         "harmonic": 1.0,    "har": 1.0,
+        "modified": 0.5,    "mod": 0.5,
     }
+    _MODIFIED = {"modified", "mod"}
+    # candidate exponents scored by free-b hyperbolic fits
+    _B_GRID = np.linspace(0.0, 1.0, 41)[1:]
+    # samples x exponents stacked per segmented pass of the grouped b-grid scan
+    _STACK = 1 << 24
+
     _CLASS_BY_MODE: Dict[str, type] = {
         "Exponential": Exponential,
         "Hyperbolic": Hyperbolic,
         "Harmonic": Harmonic,
+        "Modified": ModifiedHyperbolic,
     }
 
-    def __init__(self, di: Number, qi: Number, *, b: Optional[Number] = None, mode: Optional[str] = None):
+    def __init__(
+        self,
+        di: Number,
+        qi: Number,
+        *,
+        b: Optional[Number] = None,
+        mode: Optional[str] = None,
+        dmin: Optional[Number] = None,
+    ):
         self._di = float(di)
         self._qi = float(qi)
+        self._dmin = 0.0 if dmin is None else float(dmin)
 
-        if mode is None and b is None:
+        if mode is None and dmin is not None:
+            mode = "Modified"
+        if mode is not None and mode.lower() in self._MODIFIED:
+            mode = "Modified"
+            if b is None:
+                b = self.mode2b("modified")
+        elif mode is None and b is None:
             mode, b = "Exponential", 0.0
         elif mode is None and b is not None:
             mode = self.b2mode(float(b))
@@ -95,12 +157,14 @@ class Arps:
             b = self.mode2b(mode)
 
         self._b = float(b)  # store b (for Hyperbolic fixed b); ignored by Exp/Harm
-        self._mode_name = mode if mode in {"Exponential", "Hyperbolic", "Harmonic"} else self.b2mode(self._b)
+        self._mode_name = mode if mode in self._CLASS_BY_MODE else self.b2mode(self._b)
 
         # Construct the underlying model
         cls = self._CLASS_BY_MODE[self._mode_name]
-        if cls is Hyperbolic:
-            self.model: ModelLike = cls(b=self._b, di=self._di, qi=self._qi)
+        if cls is ModifiedHyperbolic:
+            self.model: ModelLike = cls(b=self._b, di=self._di, qi=self._qi, dmin=self._dmin)
+        elif cls is Hyperbolic:
+            self.model = cls(b=self._b, di=self._di, qi=self._qi)
         else:
             self.model = cls(di=self._di, qi=self._qi)
 
@@ -113,8 +177,8 @@ class Arps:
     def mode2b(cls, mode: str) -> float:
         m = cls._B_BY_MODE.get(mode.lower())
         if m is None:
-            logging.error("Invalid mode: %s. Use 'exponential'|'hyperbolic'|'harmonic'.", mode)
-            raise ValueError("Invalid mode. Use 'exponential'|'hyperbolic'|'harmonic'.")
+            logging.error("Invalid mode: %s. Use 'exponential'|'hyperbolic'|'harmonic'|'modified'.", mode)
+            raise ValueError("Invalid mode. Use 'exponential'|'hyperbolic'|'harmonic'|'modified'.")
         return float(m)
 
     @classmethod
@@ -123,6 +187,8 @@ class Arps:
             return "Exponential", 0.0
         if mode is None:
             return cls.b2mode(float(b)), float(b)  # type: ignore[arg-type]
+        if mode.lower() in cls._MODIFIED:
+            return "Modified", cls.mode2b(mode) if b is None else float(b)
         if b is None:
             return cls.b2mode(cls.mode2b(mode)), cls.mode2b(mode)
         # both provided → prefer explicit b, but return canonical mode for that b
@@ -133,6 +199,10 @@ class Arps:
     def b(self) -> float:
         return self._b
 
+    @property
+    def dmin(self) -> float:
+        return self._dmin
+
     @property
     def mode(self) -> str:
         # lowercase for API symmetry with your models’ .mode
@@ -141,28 +211,90 @@ class Arps:
     def with_params(self, *, di: Optional[Number] = None, qi: Optional[Number] = None) -> "Arps":
         di = self._di if di is None else float(di)
         qi = self._qi if qi is None else float(qi)
-        return Arps(di, qi, b=self._b, mode=self._mode_name)
+        return Arps(di, qi, b=self._b, mode=self._mode_name, dmin=self._dmin if self._dmin else None)
+
+    @classmethod
+    def from_result(cls, result: FitResult) -> "Arps":
+        """Fitted model of a `FitResult` (or `FitRow`), keeping a modified hyperbolic tail."""
+        if result.dmin:
+            return cls(result.di, result.qi, b=result.b, mode="modified", dmin=result.dmin)
+        return cls(result.di, result.qi, b=result.b)
 
     # alias to mirror your model API, if desired
     def __call__(self, di: Number, qi: Number) -> "Arps":
         return self.with_params(di=di, qi=qi)
 
-    def run(self, x: ArrayLike, *, xi: Number = 0.0, cum: bool = False) -> NDArray[np.float64]:
+    def run(
+        self,
+        x: ArrayLike,
+        *,
+        xi: Number = 0.0,
+        cum: bool = False,
+        out: Optional[NDArray[np.float64]] = None,
+    ) -> NDArray[np.float64]:
+        """
+        Rate (or cumulative with `cum=True`) at x; NaN before a non-zero `xi`.
+
+        With `out` (float64, shape of x) the result is written in place and
+        no temporary arrays are allocated besides the xi mask.
+        """
+        xx = _as_array(x)
+        evaluate = self.model.N if cum else self.model.q
+        if xi == 0:
+            return evaluate(xx, out=out)
+        out = self._shifted(xx, xi, out)
+        with np.errstate(invalid="ignore", over="ignore", divide="ignore"):  # x < xi is masked below
+            evaluate(out, out=out)
+        return self._mask(xx, xi, out)
+
+    def evaluate(
+        self,
+        x: ArrayLike,
+        *,
+        xi: Number = 0.0,
+        out: Optional[Tuple[NDArray[np.float64], NDArray[np.float64]]] = None,
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Rate and cumulative at x in one pass, as (q, N).
+
+        Equivalent to ``(run(x, xi=xi), run(x, xi=xi, cum=True))`` but both
+        come from one evaluation of the decline integral. `out` is an
+        optional (q, N) pair of buffers written in place.
+        """
         xx = _as_array(x)
-        # Shift only for x>=xi
-        if xi != 0:
-            mask = xx >= xi
-            out = np.full_like(xx, np.nan, dtype=float)
-            shifted = xx[mask] - xi
-            y = self.model.N(shifted) if cum else self.model.q(shifted)
-            out[mask] = y
-            return out
-        return self.model.N(xx) if cum else self.model.q(xx)
+        if xi == 0:
+            return self.model.qN(xx, out=out)
+        q, N = (None, None) if out is None else out
+        t = self._shifted(xx, xi, N)
+        with np.errstate(invalid="ignore", over="ignore", divide="ignore"):  # x < xi is masked below
+            q, N = self.model.qN(t, out=(q, t))
+        return self._mask(xx, xi, q), self._mask(xx, xi, N)
+
+    @staticmethod
+    def _shifted(x: NDArray[np.float64], xi: Number, out: Optional[NDArray[np.float64]]) -> NDArray[np.float64]:
+        if out is None:
+            return np.subtract(x, xi)
+        if out.shape != x.shape or out.dtype != np.float64:
+            raise ValueError(f"out must be a float64 array of shape {x.shape}, got {out.dtype} {out.shape}")
+        return np.subtract(x, xi, out=out)
+
+    @staticmethod
+    def _mask(x: NDArray[np.float64], xi: Number, out: NDArray[np.float64]) -> NDArray[np.float64]:
+        # times before the start of the decline have no forecast
+        np.copyto(out, np.nan, where=x < xi)
+        return out
 
     # ----------------- regression & fit -----------------
-    def linregress(self, x: ArrayLike, y: ArrayLike, *, xi: Number = 0.0, **kwargs):
-        xx, yy = _shift(_as_array(x), _as_array(y), xi=xi)
-        xx, yy = _nzero(xx, yy)
+    def linregress(self, x: ArrayLike, y: ArrayLike, *, xi: Number = 0.0, weights: Optional[ArrayLike] = None, **kwargs):
+        """
+        Linearized regression (SciPy `linregress` result); with per-sample
+        `weights` it is the weighted least-squares line as a `LinearFit`.
+        """
+        from scipy.stats import linregress
+
+        xx, yy, ww = _weighted(_as_array(x), _as_array(y), weights, xi=xi)
+        if ww is not None:
+            return LinearStats.from_samples(xx, self.model.linearize(yy), ww).result()
         try:
             y_lin = self.model.linearize(yy)
             res = linregress(xx, y_lin, **kwargs)
@@ -173,34 +305,444 @@ class Arps:
 
     def _invert_from_lin(self, linres) -> Tuple[float, float]:
         # Map to appropriate inversion signature
-        if isinstance(self.model, Hyperbolic):
+        if isinstance(self.model, (Hyperbolic, ModifiedHyperbolic)):
             di, qi = self.model.invert(linres.slope, linres.intercept, self.model.b)
         else:
             di, qi = self.model.invert(linres.slope, linres.intercept)
         return float(di), float(qi)
 
-    def fit(self, x: ArrayLike, y: ArrayLike, *, xi: Number = 0.0, p0: Tuple[float, float] | None = None, **kwargs) -> FitResult:
-        xx, yy = _shift(_as_array(x), _as_array(y), xi=xi)
-        xx, yy = _nzero(xx, yy)
+    def _forward(self, x: NDArray[np.float64], di, qi) -> NDArray[np.float64]:
+        # rate of the current family for raw parameter values/arrays
+        if isinstance(self.model, ModifiedHyperbolic):
+            return self.model._rate(x, di, qi, self.model.b, self.model.dmin)
+        if isinstance(self.model, Hyperbolic):
+            return self.model._rate(x, di, qi, self.model.b)
+        return self.model._rate(x, di, qi)
+
+    def _jac(self, x: NDArray[np.float64], di, qi) -> NDArray[np.float64]:
+        # (∂q/∂di, ∂q/∂qi) of the current family; b (and dmin) stay fixed
+        if isinstance(self.model, ModifiedHyperbolic):
+            return self.model._jac(x, di, qi, self.model.b, self.model.dmin)
+        if isinstance(self.model, Hyperbolic):
+            return self.model._jac(x, di, qi, self.model.b)[:, :2]
+        return self.model._jac(x, di, qi)
+
+    def _invert_stats(self, stats: LinearStats, b=None) -> Tuple[NDArray[np.float64], ...]:
+        """
+        Vectorized inversion of linearized estimates to (di, qi) and their
+        delta-method variances; `b` (default: the model's) may hold one
+        positive exponent per entry.
+        """
+        m, c = stats.slope, stats.intercept
+        b = self._b if b is None else b
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            if np.ndim(b) == 0 and b == 0.0:
+                # y = ln(q): di = -m, qi = exp(c)
+                di, qi = -m, np.exp(c)
+                g_di = (-np.ones_like(m), np.zeros_like(c))
+                g_qi = (np.zeros_like(m), qi)
+            else:
+                # y = q^{-b}: di = m / (b c), qi = c^{-1/b}  (b=1 is the harmonic case)
+                di, qi = m / (b * c), np.power(c, -1.0 / b)
+                g_di = (1.0 / (b * c), -di / c)
+                g_qi = (np.zeros_like(m), -qi / (b * c))
+
+            var_m, var_c, cov = stats.stderr ** 2, stats.intercept_stderr ** 2, stats.covariance
+            var_di = g_di[0] ** 2 * var_m + g_di[1] ** 2 * var_c + 2.0 * g_di[0] * g_di[1] * cov
+            var_qi = g_qi[0] ** 2 * var_m + g_qi[1] ** 2 * var_c + 2.0 * g_qi[0] * g_qi[1] * cov
+        return di, qi, var_di, var_qi
+
+    def _fit_groups(self, keys, codes, tt, qq, xi_w, w=None, robust: Optional[str] = None) -> FitTable:
+        """
+        Linearized per-well fits on prepared (shifted, filtered) long-format
+        data, weighted by `w` if given; `robust` ('huber'/'tukey') reweights
+        them by IRLS.
+        """
+        nwells = keys.size
+        lin = self.model.linearize(qq)
+        if w is not None:
+            w = _normalize(codes, w, nwells)
+        if robust is not None:
+            stats, w = _irls(codes, tt, lin, nwells, loss=robust, w0=w)
+        else:
+            stats = LinearStats.from_groups(codes, tt, lin, nwells, w)
+        count = stats.n if w is None else np.bincount(codes, weights=(w > 0).astype(float), minlength=nwells)
+        di, qi, var_di, var_qi = self._invert_stats(stats)
+
+        ok = (count >= 3) & np.isfinite(di) & np.isfinite(qi) & (di > 0) & (qi > 0)
+        di, qi = np.where(ok, di, np.nan), np.where(ok, qi, np.nan)
+
+        # rate-space R², same definition as `rsquared` (weighted if `w` is)
+        with np.errstate(invalid="ignore", over="ignore"):
+            ycal = self._forward(tt, di[codes], qi[codes])
+        wr = 1.0 if w is None else w
+        ssres = np.bincount(codes, weights=wr * (qq - ycal) ** 2, minlength=nwells)
+        sq = LinearStats.from_groups(codes, tt, qq, nwells, w)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2 = np.where(ok & (sq._Syy > 0), 1.0 - ssres / sq._Syy, np.nan)
+            di_err = np.where(ok, np.sqrt(var_di), np.nan)
+            qi_err = np.where(ok, np.sqrt(var_qi), np.nan)
+
+        return FitTable(
+            well=keys,
+            b=np.full(nwells, self._b),
+            di=di,
+            qi=qi,
+            xi=xi_w,
+            n=count.astype(np.int64),
+            r2=r2,
+            di_error=di_err,
+            qi_error=qi_err,
+            slope=stats.slope,
+            intercept=stats.intercept,
+            rvalue=stats.rvalue,
+            dmin=np.full(nwells, self._dmin),
+        )
+
+    def fit_batch(
+        self,
+        x: ArrayLike | Sequence[ArrayLike],
+        y: ArrayLike | Sequence[ArrayLike],
+        *,
+        wells: Optional[ArrayLike] = None,
+        xi: ArrayLike | str = 0.0,
+        min_points: int = 10,
+        max_start: float = 0.5,
+        robust: Optional[str] = None,
+        weights: Optional[ArrayLike | Sequence[ArrayLike]] = None,
+        half_life: Optional[float] = None,
+    ) -> FitTable:
+        """
+        Linearized fit of the current model family to many wells in one pass.
+
+        Parameters
+        ----------
+        x, y : array_like or sequence of array_like
+            Long-format time and rate columns (with `wells`), or ragged
+            sequences holding one array per well (without `wells`).
+        wells : array_like, optional
+            Well id of every sample in long format.
+        xi : float or array_like, default 0.0
+            Start time, scalar or one per well (in the order of `FitTable.well`).
+            Samples before a non-zero `xi` are dropped and time is shifted by it.
+            "auto" picks every well's start with the prefix-sum search of
+            `scan_xi` (wells without an admissible start keep xi = 0).
+        min_points, max_start
+            Search limits for `xi="auto"`, see `scan_xi`.
+        robust : {'huber', 'tukey'}, optional
+            Downweight outliers (shut-in days, test spikes) by iteratively
+            reweighted least squares; every iteration is one segmented
+            weighted regression over all wells. `n` then counts the samples
+            with a non-zero final weight, and `r2` is weighted.
+        weights : array_like or sequence of array_like, optional
+            Per-sample weights in the layout of `y` (e.g. `uptime_weights`).
+        half_life : float, optional
+            Exponential time-decay weighting: samples `half_life` before a
+            well's latest one count half (see `decay_weights`).
+
+        Weighted sums are accumulated in the same segmented pass as the
+        unweighted ones, and weights are rescaled to a mean of one per well.
+
+        The regression of every well is solved from per-well sufficient
+        statistics accumulated in a single segmented sum, so the cost is a
+        few array passes over all samples regardless of the well count.
+        Non-finite and non-positive rates are ignored. Unlike `fit`, there is
+        no non-linear refinement; the result matches the `linear` stage of `fit`.
+        """
+        prepared = self._prepare_groups(x, y, wells, xi, min_points, max_start, weights=weights, half_life=half_life)
+        return self._fit_groups(*prepared, robust=robust)
+
+    def _prepare_groups(
+        self,
+        x,
+        y,
+        wells,
+        xi,
+        min_points: int = 10,
+        max_start: float = 0.5,
+        *,
+        weights=None,
+        half_life: Optional[float] = None,
+    ):
+        """
+        Group, shift by xi and filter long-format data:
+        (keys, codes, t, q, xi per well, weights or None).
+        """
+        keys, codes, xx, yy = _group(x, y, wells)
+        nwells = keys.size
+        ww = None
+        if weights is not None:
+            ww = _flatten(weights, wells)
+            if ww.shape != xx.shape:
+                raise ValueError("weights must have the layout of y.")
+            if np.any(~np.isfinite(ww)) or np.any(ww < 0):
+                raise ValueError("weights must be finite and >= 0.")
+
+        if isinstance(xi, str):
+            if xi != "auto":
+                raise ValueError("xi must be a number, an array or 'auto'.")
+            xi_w = self._scan_xi_groups(codes, xx, yy, nwells, min_points, max_start)
+        else:
+            xi_w = np.broadcast_to(_as_array(xi), (nwells,)).astype(float)
+        x0 = xi_w[codes]
+        keep = np.isfinite(xx) & np.isfinite(yy) & (yy > 0) & ((x0 == 0.0) | (xx >= x0))
+        codes, tt = codes[keep], xx[keep] - x0[keep]
+        if ww is not None:
+            ww = ww[keep]
+        if half_life is not None:
+            decay = _group_decay(codes, tt, half_life, nwells)
+            ww = decay if ww is None else ww * decay
+        return keys, codes, tt, yy[keep], xi_w, ww
+
+    def backtest(
+        self,
+        x: ArrayLike | Sequence[ArrayLike],
+        y: ArrayLike | Sequence[ArrayLike],
+        *,
+        wells: Optional[ArrayLike] = None,
+        horizon: int = 12,
+        window: Optional[int] = None,
+        min_points: int = 6,
+    ) -> Backtest:
+        """
+        Rolling-origin hindcast: fit on the data up to each sample k, forecast
+        samples k+1 … k+horizon and compare with the observations.
+
+        Parameters
+        ----------
+        x, y, wells
+            Data in the layouts accepted by `fit_batch`.
+        horizon : int, default 12
+            Number of samples forecast after every cutoff.
+        window : int, optional
+            Rolling window length in samples; None uses expanding windows
+            from each well's first sample.
+        min_points : int, default 6
+            Smallest number of samples a fit may use.
+
+        All cutoffs of all wells are linearized fits solved from one set of
+        prefix sums, and all horizons are evaluated in one vectorized call.
+        Fitted parameters refer to each window's start (`Backtest.start`).
+        """
+        keys, codes, xx, yy = _group(x, y, wells)
+        return _hindcast(self, keys, codes, xx, yy, horizon=horizon, window=window, min_points=min_points)
+
+    def segment(
+        self,
+        x: ArrayLike,
+        y: ArrayLike,
+        *,
+        max_segments: int = 4,
+        min_size: int = 6,
+        criterion: str = "bic",
+        max_candidates: Optional[int] = None,
+    ) -> Segments:
+        """
+        Split the history into decline segments and fit each one.
+
+        Workovers, choke changes and other interventions restart the
+        decline. The change points are found by dynamic programming over
+        the linearized regression costs of the candidate segments, which
+        come from one set of prefix sums; the number of segments (up to
+        `max_segments`, each of at least `min_size` samples) is the one with
+        the lowest `criterion` ('aic' or 'bic').
+
+        Change points are searched among at most `max_candidates` (default
+        ``16 * max_segments``) split points screened in O(n), so the cost is
+        O(n + max_candidates² · max_segments); shorter histories, or a
+        `max_candidates` above the sample count, give the exact search.
+
+        Returns
+        -------
+        Segments
+            Linearized fits of the current family, one per segment, with
+            `xi` set to each segment's start time; the last one forecasts.
+        """
+        xx, yy = _as_array(x), _as_array(y)
+        keep = np.isfinite(xx) & np.isfinite(yy) & (yy > 0)
+        xx, yy = xx[keep], yy[keep]
+        order = np.argsort(xx, kind="stable")
+        return _partition(
+            self, xx[order], yy[order],
+            max_segments=max_segments, min_size=min_size, criterion=criterion,
+            max_candidates=max_candidates,
+        )
+
+    # ----------------- start-point (xi) search -----------------
+    def _xi_scores(self, xx, lin, first, stop, min_points: int, max_start: float) -> NDArray[np.float64]:
+        """
+        Adjusted R² of the linearized regression over samples [k, stop) for
+        every sample k of time-sorted data, from one set of prefix sums.
+        `first`/`stop` bound the segment (well) each sample belongs to.
+        """
+        k = np.arange(xx.size)
+        P = LinearStats.prefix(xx - xx.mean() if xx.size else xx, lin)
+        tail = P.take(stop) - P.take(k)
+
+        di, qi, _, _ = self._invert_stats(tail)
+        with np.errstate(invalid="ignore"):
+            ok = (tail.n >= min_points) & ((k - first) <= max_start * (stop - first)) & (di > 0) & (qi > 0)
+        return np.where(ok, tail.rsquared_adj, np.nan)
+
+    def scan_xi(
+        self,
+        x: ArrayLike,
+        y: ArrayLike,
+        *,
+        min_points: int = 10,
+        max_start: float = 0.5,
+    ) -> Tuple[float, NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Search the fit start time (xi) over every sample in one pass.
+
+        Each sample is a candidate start; the linearized regression over the
+        samples from it onwards is evaluated for all candidates at once from
+        prefix sums, and scored by its adjusted R². Candidates must leave at
+        least `min_points` samples, lie in the first `max_start` fraction of
+        the history and give a declining trend.
+
+        Returns
+        -------
+        (xi, candidates, scores): best start, the time-sorted candidate
+        times and their scores (NaN where not admissible).
+        """
+        xx, yy = _as_array(x), _as_array(y)
+        good = np.isfinite(xx) & np.isfinite(yy) & (yy > 0)
+        order = np.argsort(xx[good], kind="stable")
+        xx, yy = xx[good][order], yy[good][order]
+
+        score = self._xi_scores(xx, self.model.linearize(yy), 0, xx.size, min_points, max_start)
+        if not np.any(np.isfinite(score)):
+            raise ValueError(f"No admissible start: need a declining trend over >= {min_points} points.")
+        return float(xx[np.nanargmax(score)]), xx, score
+
+    def _scan_xi_groups(self, codes, xx, yy, nwells: int, min_points: int, max_start: float) -> NDArray[np.float64]:
+        """Best xi per well (0.0 where none is admissible), same scoring as `scan_xi`."""
+        good = np.isfinite(xx) & np.isfinite(yy) & (yy > 0)
+        codes, xx, yy = codes[good], xx[good], yy[good]
+        order = np.lexsort((xx, codes))
+        codes, xx, yy = codes[order], xx[order], yy[order]
+
+        counts = np.bincount(codes, minlength=nwells)
+        stop = np.cumsum(counts)
+        first = stop - counts
+
+        score = self._xi_scores(xx, self.model.linearize(yy), first[codes], stop[codes], min_points, max_start)
+        score = np.where(np.isfinite(score), score, -np.inf)
 
-        linres = self.linregress(xx, yy, xi=0.0)  # already shifted above
+        # within each well, order by descending score; the first entry is the best start
+        best = np.lexsort((-score, codes))[first[counts > 0]]
+        xi = np.zeros(nwells)
+        found = np.isfinite(score[best])
+        xi[codes[best[found]]] = xx[best[found]]
+        return xi
+
+    def fit(
+        self,
+        x: ArrayLike,
+        y: ArrayLike,
+        *,
+        xi: Number | str = 0.0,
+        p0: Tuple[float, ...] | None = None,
+        free_b: bool = False,
+        bgrid: ArrayLike | None = None,
+        robust: Optional[str] = None,
+        weights: Optional[ArrayLike] = None,
+        **kwargs,
+    ) -> FitResult:
+        """
+        Fit the model to (x, y): linearized regression for the initial guess,
+        then non-linear least squares on the rate.
+
+        With `robust` ('huber' or 'tukey') the linearized regression is
+        solved by iteratively reweighted least squares, so shut-in days and
+        test spikes lose their pull, and the final weights carry over to the
+        non-linear stage (samples with zero weight are left out).
+
+        `weights` (one per sample, e.g. from `decay_weights` or
+        `uptime_weights`) make both stages weighted least squares; with
+        `robust` they multiply the IRLS weights.
+
+        With `free_b=True` the hyperbolic exponent is estimated as well: the
+        exponents in `bgrid` (default 40 values in (0, 1]) are scored in one
+        vectorized pass, and the best one warm-starts a joint (di, qi, b) fit.
+        `p0` is then (di, qi, b).
+
+        `xi="auto"` selects the start time with `scan_xi` (default limits).
+        """
+        if isinstance(xi, str):
+            if xi != "auto":
+                raise ValueError("xi must be a number or 'auto'.")
+            xi = self.scan_xi(x, y)[0]
+
+        xx, yy, weights = _weighted(_as_array(x), _as_array(y), weights, xi=xi)
+
+        if free_b:
+            if isinstance(self.model, ModifiedHyperbolic):
+                raise ValueError("free_b is not supported by the modified hyperbolic model.")
+            if robust is not None:
+                raise ValueError("robust is not supported together with free_b.")
+            return self._fit_free_b(xx, yy, xi=xi, p0=p0, bgrid=bgrid, weights=weights, **kwargs)
+
+        if robust is None:
+            linres = self.linregress(xx, yy, xi=0.0, weights=weights)  # already shifted above
+        else:
+            lin = self.model.linearize(yy)
+            finite = np.isfinite(lin)
+            xx, yy, lin = xx[finite], yy[finite], lin[finite]
+            w0 = None if weights is None else weights[finite]
+            stats, weights = _irls(np.zeros(xx.size, dtype=np.intp), xx, lin, 1, loss=robust, w0=w0)
+            linres = stats.take(0).result()
         if p0 is None:
-            p0 = self._invert_from_lin(linres)
+            try:
+                p0 = self._invert_from_lin(linres)
+            except ValueError:
+                if not isinstance(self.model, ModifiedHyperbolic):
+                    raise
+                # a long exponential tail bends q^{-b} away from a line;
+                # start from the average log-decline instead
+                p0 = Exponential.invert(*np.polyfit(xx, np.log(yy), 1))
+
+        return self._refine(xx, yy, p0, xi=xi, linear=linres, weights=weights, **kwargs)
+
+    def _refine(
+        self,
+        xx: NDArray[np.float64],
+        yy: NDArray[np.float64],
+        p0,
+        *,
+        xi: Number,
+        linear,
+        weights: Optional[NDArray[np.float64]] = None,
+        **kwargs,
+    ) -> FitResult:
+        """
+        Non-linear least-squares polish of (di, qi) on prepared (shifted,
+        filtered) data; `weights` scale the squared residuals (R² is then
+        weighted too) and samples with zero weight are dropped.
+        """
+        from scipy.optimize import curve_fit
+
+        w = None
+        if weights is not None:
+            keep = weights > 0
+            xx, yy, w = xx[keep], yy[keep], weights[keep]
+            kwargs.setdefault("sigma", 1.0 / np.sqrt(w))
 
-        # forward model (rate)
+        # forward model (rate) and its analytic Jacobian on raw parameters,
+        # so curve_fit neither rebuilds models nor differentiates numerically
         def fwd(xv, di, qi):
-            if isinstance(self.model, Hyperbolic):
-                m = self.model.with_params(di=di, qi=qi, b=self.model.b)
-            else:
-                m = self.model.with_params(di=di, qi=qi)
-            return m.q(xv)
+            return self._forward(xv, di, qi)
+
+        kwargs.setdefault("jac", lambda xv, di, qi: self._jac(xv, di, qi))
 
         popt, pcov = curve_fit(fwd, xx, yy, p0=p0, **kwargs)
         di_hat, qi_hat = map(float, popt)
+        _check_fitted(di_hat, qi_hat)
 
         # R²
         ycal = fwd(xx, di_hat, qi_hat)
-        r2 = self.rsquared(ycal, yy)
+        r2 = self.rsquared(ycal, yy, w)
 
         # parameter std errors
         perr = np.sqrt(np.diag(pcov)) if (pcov is not None and np.all(np.isfinite(pcov))) else np.array([np.nan, np.nan])
@@ -215,13 +757,270 @@ class Arps:
             r2=float(r2),
             di_error=di_err,
             qi_error=qi_err,
-            linear=linres,
+            linear=linear,
+            dmin=self._dmin,
+            cov=pcov,
+        )
+
+    def select(
+        self,
+        x: ArrayLike,
+        y: ArrayLike,
+        *,
+        xi: Number = 0.0,
+        b: float = 0.5,
+        criterion: str = "bic",
+        **kwargs,
+    ) -> Selection:
+        """
+        Fit every decline family to (x, y) and rank them by information criterion.
+
+        The data are shifted, filtered and converted once; the exponential,
+        hyperbolic (exponent `b`), harmonic and free-b hyperbolic fits then
+        run on the same arrays. A family whose fit fails scores NaN.
+
+        Returns
+        -------
+        Selection
+            Per-model `fits` (`FitResult`), n, sse, aic, bic and r2 arrays in
+            the order of `Selection.models`, and the `best` model name.
+        """
+        xx, yy = _shift(_as_array(x), _as_array(y), xi=xi)
+        xx, yy = _nzero(xx, yy)
+
+        fits, sse = {}, np.full(len(MODELS), np.nan)
+        for i, name in enumerate(MODELS):
+            try:
+                if name == "free":
+                    fit = self._fit_free_b(xx, yy, xi=xi, p0=None, bgrid=None, **kwargs)
+                    ycal = Hyperbolic._rate(xx, fit.di, fit.qi, fit.b)
+                else:
+                    arps = Arps(1.0, 1.0, mode=name, b=b if name == "hyperbolic" else None)
+                    stats = LinearStats.from_samples(xx, arps.model.linearize(yy))
+                    di, qi, _, _ = arps._invert_stats(stats)
+                    fit = arps._refine(xx, yy, (float(di), float(qi)), xi=xi, linear=stats.result(), **kwargs)
+                    ycal = arps._forward(xx, fit.di, fit.qi)
+            except (RuntimeError, ValueError):
+                continue
+            fits[name] = fit
+            sse[i] = np.sum((yy - ycal) ** 2)
+
+        n = np.full(len(MODELS), xx.size)
+        aic, bic = _criteria(sse, n, [3 if name == "free" else 2 for name in MODELS])
+        r2 = np.array([fits[name].r2 if name in fits else np.nan for name in MODELS])
+        return Selection(MODELS, fits, n, sse, aic, bic, r2, criterion)
+
+    def select_batch(
+        self,
+        x: ArrayLike | Sequence[ArrayLike],
+        y: ArrayLike | Sequence[ArrayLike],
+        *,
+        wells: Optional[ArrayLike] = None,
+        xi: ArrayLike | str = 0.0,
+        b: float = 0.5,
+        criterion: str = "bic",
+    ) -> Selection:
+        """
+        Linearized version of `select` for many wells (see `fit_batch`).
+
+        Grouping and filtering run once; every fixed family is one segmented
+        regression, and the free-b candidate keeps, per well, the best of
+        the `_B_GRID` exponents, all scored in one stacked segmented pass.
+        Scores have shape (n_wells, n_models) and `fits` holds one
+        `FitTable` per model.
+        """
+        keys, codes, tt, qq, xi_w, _ = self._prepare_groups(x, y, wells, xi)
+        sstot = LinearStats.from_groups(codes, tt, qq, keys.size)._Syy
+
+        def sse_of(fit: FitTable) -> NDArray[np.float64]:
+            return np.where(np.isfinite(fit.r2), (1.0 - fit.r2) * sstot, np.nan)
+
+        fits = {}
+        for name in MODELS[:3]:
+            arps = Arps(1.0, 1.0, mode=name, b=b if name == "hyperbolic" else None)
+            fits[name] = arps._fit_groups(keys, codes, tt, qq, xi_w)
+
+        fits["free"] = self._free_b_groups(keys, codes, tt, qq, xi_w, sstot)
+
+        sse = np.column_stack([sse_of(fits[name]) for name in MODELS])
+        n = np.column_stack([fits[name].n for name in MODELS])
+        aic, bic = _criteria(sse, n, [3 if name == "free" else 2 for name in MODELS])
+        r2 = np.column_stack([fits[name].r2 for name in MODELS])
+        return Selection(MODELS, fits, n, sse, aic, bic, r2, criterion)
+
+    def _free_b_groups(self, keys, codes, tt, qq, xi_w, sstot, bgrid=None) -> FitTable:
+        """
+        Per-well best exponent of `bgrid` (default `_B_GRID`) by rate-space
+        SSE, the grouped counterpart of `scan_b`.
+
+        The grid is stacked into the group codes (group k * n_wells + well),
+        so every exponent of every well comes from one segmented regression,
+        one inversion and one residual pass. Very large tables are stacked in
+        blocks of exponents to bound memory.
+        """
+        B = np.atleast_1d(_as_array(self._B_GRID if bgrid is None else bgrid))
+        nwells, size = keys.size, tt.size
+        best = np.full(nwells, np.inf)
+        columns = ("b", "di", "qi", "n", "di_error", "qi_error", "slope", "intercept", "rvalue")
+        out = {f: np.full(nwells, np.nan) for f in columns}
+
+        # sums of x alone are shared by every exponent
+        xs = LinearStats.from_groups(codes, tt, np.zeros_like(tt), nwells)
+        step = max(1, self._STACK // max(size, 1))
+        for lo in range(0, B.size, step):
+            Bk = B[lo:lo + step]
+            G = Bk.size * nwells
+            gcodes = (np.arange(Bk.size)[:, None] * nwells + codes[None, :]).ravel()
+            bb = np.repeat(Bk, nwells)
+            xt = np.broadcast_to(tt, (Bk.size, size)).ravel()
+            with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+                lin = np.power(qq[None, :], -Bk[:, None]).ravel()
+            stats = LinearStats(
+                n=np.tile(xs.n, Bk.size),
+                sx=np.tile(xs.sx, Bk.size),
+                sy=np.bincount(gcodes, weights=lin, minlength=G),
+                sxx=np.tile(xs.sxx, Bk.size),
+                sxy=np.bincount(gcodes, weights=xt * lin, minlength=G),
+                syy=np.bincount(gcodes, weights=lin * lin, minlength=G),
+            )
+            di, qi, var_di, var_qi = self._invert_stats(stats, bb)
+            ok = (stats.n >= 3) & np.isfinite(di) & np.isfinite(qi) & (di > 0) & (qi > 0)
+            di, qi = np.where(ok, di, np.nan), np.where(ok, qi, np.nan)
+
+            # the fitted rate straight from the line: q = (c + m t)^(-1/b)
+            with np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+                line = stats.intercept[gcodes] + stats.slope[gcodes] * xt
+                ycal = np.power(line, -1.0 / bb[gcodes])
+            sse = np.bincount(gcodes, weights=(np.tile(qq, Bk.size) - ycal) ** 2, minlength=G)
+            sse = np.where(ok, sse, np.inf).reshape(Bk.size, nwells)
+
+            # first exponent with the lowest SSE, across blocks as well
+            k = np.argmin(sse, axis=0)
+            pick = k * nwells + np.arange(nwells)
+            better = sse[k, np.arange(nwells)] < best
+            best = np.where(better, sse[k, np.arange(nwells)], best)
+            with np.errstate(invalid="ignore"):
+                new = {
+                    "b": bb[pick], "di": di[pick], "qi": qi[pick], "n": stats.n[pick],
+                    "di_error": np.sqrt(var_di[pick]), "qi_error": np.sqrt(var_qi[pick]),
+                    "slope": stats.slope[pick], "intercept": stats.intercept[pick],
+                    "rvalue": stats.rvalue[pick],
+                }
+            for f, v in new.items():
+                out[f] = np.where(better, v, out[f])
+
+        found = np.isfinite(best)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2 = np.where(found & (sstot > 0), 1.0 - best / sstot, np.nan)
+        n = np.bincount(codes, minlength=nwells)
+        return FitTable(
+            well=keys,
+            b=np.where(found, out["b"], B[0]),
+            di=out["di"],
+            qi=out["qi"],
+            xi=xi_w,
+            n=n.astype(np.int64),
+            r2=r2,
+            di_error=out["di_error"],
+            qi_error=out["qi_error"],
+            slope=out["slope"],
+            intercept=out["intercept"],
+            rvalue=out["rvalue"],
         )
 
     @staticmethod
-    def rsquared(ycal: ArrayLike, yobs: ArrayLike) -> float:
+    def scan_b(x: ArrayLike, y: ArrayLike, bgrid: ArrayLike) -> Tuple[NDArray[np.float64], ...]:
+        """
+        Score hyperbolic exponents on prepared (x, y) data in one pass.
+
+        Every candidate b linearizes y as q^{-b}; the regressions of all rows
+        share x and are solved together, inverted to (di, qi) and scored by
+        the rate-space sum of squared residuals.
+
+        Returns
+        -------
+        (b, di, qi, sse) arrays, one entry per candidate; candidates giving a
+        non-declining trend have NaN parameters and infinite sse.
+        """
+        xx, yy = _as_array(x), _as_array(y)
+        B = np.atleast_1d(_as_array(bgrid))
+        if np.any(B <= 0.0) or np.any(B > 1.0):
+            raise ValueError("bgrid values must be in (0, 1].")
+
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            Y = np.power(yy[None, :], -B[:, None])
+            stats = LinearStats(
+                n=np.full(B.size, float(xx.size)),
+                sx=np.full(B.size, xx.sum()),
+                sy=Y.sum(axis=1),
+                sxx=np.full(B.size, np.dot(xx, xx)),
+                sxy=Y @ xx,
+                syy=np.einsum("ij,ij->i", Y, Y),
+            )
+            m, c = stats.slope, stats.intercept
+            di, qi = m / (B * c), np.power(c, -1.0 / B)
+
+            ok = np.isfinite(di) & np.isfinite(qi) & (di > 0) & (qi > 0)
+            di, qi = np.where(ok, di, np.nan), np.where(ok, qi, np.nan)
+
+            Q = Hyperbolic._rate(xx[None, :], di[:, None], qi[:, None], B[:, None])
+            sse = np.where(ok, np.sum((Q - yy[None, :]) ** 2, axis=1), np.inf)
+        return B, di, qi, sse
+
+    def _fit_free_b(self, xx, yy, *, xi, p0, bgrid, weights=None, **kwargs) -> FitResult:
+        from scipy.optimize import curve_fit
+        from scipy.stats import linregress
+
+        if weights is not None:
+            keep = weights > 0
+            xx, yy, weights = xx[keep], yy[keep], weights[keep]
+            kwargs.setdefault("sigma", 1.0 / np.sqrt(weights))
+
+        if p0 is None:
+            B, di, qi, sse = self.scan_b(xx, yy, self._B_GRID if bgrid is None else bgrid)
+            k = int(np.argmin(sse))
+            if not np.isfinite(sse[k]):
+                raise ValueError("No exponent in bgrid gives a declining hyperbolic trend.")
+            p0 = (float(di[k]), float(qi[k]), float(B[k]))
+
+        def fwd(xv, di, qi, b):
+            return Hyperbolic._rate(xv, di, qi, b)
+
+        kwargs.setdefault("jac", lambda xv, di, qi, b: Hyperbolic._jac(xv, di, qi, b))
+        kwargs.setdefault("bounds", ([0.0, 0.0, 0.0], [np.inf, np.inf, 1.0]))
+
+        popt, pcov = curve_fit(fwd, xx, yy, p0=p0, **kwargs)
+        di_hat, qi_hat, b_hat = map(float, popt)
+        _check_fitted(di_hat, qi_hat)
+
+        r2 = self.rsquared(fwd(xx, di_hat, qi_hat, b_hat), yy, weights)
+        perr = np.sqrt(np.diag(pcov)) if (pcov is not None and np.all(np.isfinite(pcov))) else np.full(3, np.nan)
+        di_err, qi_err, b_err = map(float, perr)
+
+        return FitResult(
+            b=b_hat,
+            di=di_hat,
+            qi=qi_hat,
+            xi=float(xi),
+            n=int(xx.size),
+            r2=float(r2),
+            di_error=di_err,
+            qi_error=qi_err,
+            linear=linregress(xx, Hyperbolic._linearize(yy, b_hat)),
+            b_error=b_err,
+            cov=pcov,
+        )
+
+    @staticmethod
+    def rsquared(ycal: ArrayLike, yobs: ArrayLike, w: Optional[ArrayLike] = None) -> float:
         yc = _as_array(ycal)
         yo = _as_array(yobs)
+        if w is not None:
+            ww = _as_array(w)
+            ybar = np.nansum(ww * yo) / np.nansum(ww)
+            ssres = np.nansum(ww * (yo - yc) ** 2)
+            sstot = np.nansum(ww * (yo - ybar) ** 2)
+            return float(1.0 - ssres / sstot) if sstot > 0 else float("nan")
         ssres = np.nansum((yo - yc) ** 2)
         sstot = np.nansum((yo - np.nanmean(yo)) ** 2)
         return float(1.0 - ssres / sstot) if sstot > 0 else float("nan")
@@ -230,7 +1029,11 @@ class Arps:
     def reader(result: FitResult) -> str:
         mode_name = Arps.b2mode(result.b)
         s = []
-        s.append(f"\nDecline mode is {mode_name} and the exponent is {result.b}.\n")
+        if result.dmin:
+            s.append(f"\nDecline mode is Modified hyperbolic, the exponent is {result.b} "
+                     f"and the terminal decline is {result.dmin:.6g}.\n")
+        else:
+            s.append(f"\nDecline mode is {mode_name} and the exponent is {result.b}.\n")
         s.append(f"Linear regression R-squared is {result.linear.rvalue**2:.5f}")
         s.append(f"Non-linear curve fit R-squared is {result.r2:.5f}\n")
         s.append(f"Initial x (xi) is {result.xi:.3f}")
@@ -240,7 +1043,14 @@ class Arps:
 
     @staticmethod
     def simulate(result: FitResult, prc: float = 50.0) -> Tuple[float, float]:
-        """Return one (di, qi) sample at percentile `prc` using fitted std errors (approx t-intervals)."""
+        """
+        Return one (di, qi) sample at percentile `prc` using fitted std errors (approx t-intervals).
+
+        For bands or Monte Carlo runs use `Sampler`, which draws correlated
+        samples from the fit covariance and evaluates them all at once.
+        """
+        from scipy.stats import t
+
         dof = max(result.n - 2, 1)
         tcrit = t.ppf(prc / 100.0, dof)
         di = result.di + tcrit * result.di_error
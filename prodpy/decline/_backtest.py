@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ._linstats import LinearStats
+
+
+@dataclass(frozen=True)
+class Backtest:
+    """
+    Hindcast of decline fits: one row per cutoff, one column per horizon.
+
+    Row i is a linearized fit to the samples of well `well[code[i]]` in the
+    window [start[i], cutoff[i]] (times), whose forecasts for the next
+    `horizon` samples are `forecast[i]` against the observed `actual[i]`.
+    Horizons that run past the end of a well's history are NaN.
+    """
+
+    well: NDArray
+    code: NDArray[np.intp]
+    start: NDArray[np.float64]
+    cutoff: NDArray[np.float64]
+    di: NDArray[np.float64]
+    qi: NDArray[np.float64]
+    forecast: NDArray[np.float64]
+    actual: NDArray[np.float64]
+
+    def __len__(self) -> int:
+        return self.code.size
+
+    @property
+    def horizon(self) -> int:
+        return self.forecast.shape[1]
+
+    @property
+    def error(self) -> NDArray[np.float64]:
+        """Forecast minus actual, shape (n_cutoffs, horizon)."""
+        return self.forecast - self.actual
+
+    def metrics(self) -> Dict[str, NDArray[np.float64]]:
+        """
+        Error metrics per well and horizon, each of shape (n_wells, horizon):
+        'count', 'bias' (mean error), 'mae', 'rmse' and 'mape' (percent).
+        """
+        nwells, H = self.well.size, self.horizon
+        err = self.error
+        valid = np.isfinite(err)
+        idx = (self.code[:, None] * H + np.arange(H))[valid]
+
+        def total(w=None):
+            return np.bincount(idx, weights=w, minlength=nwells * H).reshape(nwells, H)
+
+        e = err[valid]
+        count = total()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                "count": count,
+                "bias": total(e) / count,
+                "mae": total(np.abs(e)) / count,
+                "rmse": np.sqrt(total(e * e) / count),
+                "mape": 100.0 * total(np.abs(e) / self.actual[valid]) / count,
+            }
+
+
+def _hindcast(
+    arps,
+    keys: NDArray,
+    codes: NDArray[np.intp],
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    *,
+    horizon: int,
+    window: Optional[int],
+    min_points: int,
+) -> Backtest:
+    """Every expanding (or rolling) window fit of every well from one set of prefix sums."""
+    if horizon < 1:
+        raise ValueError("horizon must be >= 1.")
+    if min_points < 3:
+        raise ValueError("min_points must be >= 3.")
+
+    good = np.isfinite(x) & np.isfinite(y) & (y > 0)
+    codes, x, y = codes[good], x[good], y[good]
+    order = np.lexsort((x, codes))
+    codes, x, y = codes[order], x[order], y[order]
+
+    counts = np.bincount(codes, minlength=keys.size)
+    stop = np.cumsum(counts)[codes]
+    first = stop - counts[codes]
+
+    # fits over [s, k] for every cutoff sample k
+    k = np.arange(x.size)
+    s = first if window is None else np.maximum(first, k + 1 - int(window))
+    xbar = x.mean() if x.size else 0.0
+    P = LinearStats.prefix(x - xbar, arps.model.linearize(y))
+    stats = (P.take(k + 1) - P.take(s)).shift(x[s] - xbar)  # intercept at window start
+
+    di, qi, _, _ = arps._invert_stats(stats)
+    with np.errstate(invalid="ignore"):
+        use = (stats.n >= min_points) & (k + 1 < stop) & np.isfinite(di) & np.isfinite(qi) & (di > 0) & (qi > 0)
+    k, s, di, qi = k[use], s[use], di[use], qi[use]
+
+    # targets k+1 … k+horizon within the same well
+    j = k[:, None] + np.arange(1, horizon + 1)
+    inside = j < stop[k][:, None]
+    j = np.where(inside, j, k[:, None])
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        forecast = arps._forward(x[j] - x[s][:, None], di[:, None], qi[:, None])
+    forecast = np.where(inside, forecast, np.nan)
+    actual = np.where(inside, y[j], np.nan)
+
+    return Backtest(
+        well=keys,
+        code=codes[k],
+        start=x[s],
+        cutoff=x[k],
+        di=di,
+        qi=qi,
+        forecast=forecast,
+        actual=actual,
+    )
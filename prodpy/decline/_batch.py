@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from . import _modified as _mh
+from ._hyperbolic import _kernel_D, _kernel_N, _kernel_Nec, _kernel_T, _kernel_q, _kernel_tN
+
+Number = Union[int, float]
+
+
+def _as_array(t: ArrayLike) -> NDArray[np.float64]:
+    return np.asarray(t, dtype=float)
+
+
+def _validate_positive(name: str, value: NDArray[np.float64]) -> None:
+    if not np.all(value > 0):
+        raise ValueError(f"{name} must be > 0 for every well, got {value[~(value > 0)][:5]!r}")
+
+
+def _validate_b(b: NDArray[np.float64]) -> None:
+    if not np.all((b >= 0.0) & (b <= 1.0)):
+        raise ValueError(f"b must be in [0, 1] for every well, got {b[~((b >= 0.0) & (b <= 1.0))][:5]!r}")
+
+
+@dataclass(frozen=True, init=False)
+class ArpsBatch:
+    """
+    Batched Arps decline models held as parameter arrays.
+
+    One instance represents `n` wells; every evaluator returns an array of
+    shape (n_wells, n_times) computed in a single vectorized call.
+
+    Parameters
+    ----------
+    di : array_like
+        Initial nominal decline per well (1/time).
+    qi : array_like
+        Initial rate per well.
+    b : array_like, default 0.0
+        Arps exponent per well in [0, 1] (0 → exponential, 1 → harmonic).
+    xi : array_like, default 0.0
+        Per-well time offset. As in `Arps.run`, times before a non-zero `xi`
+        evaluate to NaN and the model is evaluated at `t - xi` otherwise.
+    dmin : array_like, default 0.0
+        Per-well terminal decline of the modified hyperbolic model; wells
+        with dmin > 0 switch to exponential decline once d(t) reaches it.
+
+    Scalars broadcast against arrays, so `ArpsBatch(di, qi, b=0.5)` builds
+    a hyperbolic batch with a common exponent.
+
+    The time argument `t` of the evaluators is either a 1-D grid shared by
+    all wells, shape (n_times,), or a 2-D per-well grid, shape (n_wells, n_times).
+
+    The economic-limit functions (`r`, `T`, `N_ec`, `econ`) take the cutoff
+    rate `q_ec` the same way: a scalar gives one value per well, a 1-D
+    array of cases (e.g. price decks) gives (n_wells, n_cases), and a 2-D
+    array gives per-well cutoffs of shape (n_wells, n_cases).
+    """
+
+    di: NDArray[np.float64]
+    qi: NDArray[np.float64]
+    b: NDArray[np.float64]
+    xi: NDArray[np.float64]
+    dmin: NDArray[np.float64]
+
+    def __init__(
+        self,
+        di: ArrayLike,
+        qi: ArrayLike,
+        *,
+        b: ArrayLike = 0.0,
+        xi: ArrayLike = 0.0,
+        dmin: ArrayLike = 0.0,
+    ):
+        arrays = np.broadcast_arrays(*(np.atleast_1d(_as_array(v)) for v in (di, qi, b, xi, dmin)))
+        if arrays[0].ndim != 1:
+            raise ValueError("ArpsBatch parameters must be scalars or 1-D arrays.")
+        di, qi, b, xi, dmin = (np.array(a, dtype=float) for a in arrays)
+
+        _validate_positive("di", di)
+        _validate_positive("qi", qi)
+        _validate_b(b)
+        if not np.all(dmin >= 0.0):
+            raise ValueError(f"dmin must be >= 0 for every well, got {dmin[~(dmin >= 0.0)][:5]!r}")
+
+        for name, value in zip(("di", "qi", "b", "xi", "dmin"), (di, qi, b, xi, dmin)):
+            value.setflags(write=False)
+            object.__setattr__(self, name, value)
+
+    # ---- construction helpers -----------------------------------------------
+    @classmethod
+    def from_results(cls, results: Iterable) -> "ArpsBatch":
+        """Stack an iterable of `FitResult` records into one batch."""
+        rows = [(r.di, r.qi, r.b, r.xi, r.dmin) for r in results]
+        if not rows:
+            raise ValueError("Provide at least one fit result.")
+        di, qi, b, xi, dmin = np.array(rows, dtype=float).T
+        return cls(di, qi, b=b, xi=xi, dmin=dmin)
+
+    def take(self, index: ArrayLike) -> "ArpsBatch":
+        """Return the sub-batch selected by a slice, integer or boolean index."""
+        idx = index if isinstance(index, slice) else np.asarray(index)
+        return ArpsBatch(self.di[idx], self.qi[idx], b=self.b[idx], xi=self.xi[idx], dmin=self.dmin[idx])
+
+    @property
+    def size(self) -> int:
+        return self.di.size
+
+    def __len__(self) -> int:
+        return self.di.size
+
+    # ---- grid handling ------------------------------------------------------
+    def _tau(self, t: ArrayLike) -> Tuple[NDArray[np.float64], NDArray[np.bool_] | None]:
+        """Shifted (n_wells, n_times) time grid and the mask of points before `xi`."""
+        tt = _as_array(t)
+        if tt.ndim == 0:
+            tt = tt.reshape(1)
+        if tt.ndim == 1:
+            tt = tt[None, :]
+        elif tt.ndim != 2 or tt.shape[0] != self.size:
+            raise ValueError(f"t must be 1-D or of shape ({self.size}, n_times), got {tt.shape}")
+
+        xi = self.xi[:, None]
+        tau = tt - xi
+        if not np.any(xi):
+            return tau, None
+        return tau, (xi != 0.0) & (tau < 0.0)
+
+    @property
+    def _modified(self) -> bool:
+        """Whether any well has a terminal decline (modified hyperbolic kernels needed)."""
+        return bool(np.any(self.dmin > 0.0))
+
+    def _evaluate(self, t: ArrayLike, kernel, modified=None) -> NDArray[np.float64]:
+        tau, before = self._tau(t)
+        # one kernel for every b in [0, 1]: no routing by family; the
+        # modified kernels reduce to it for dmin = 0 and are used only if needed
+        params = self.di[:, None], self.qi[:, None], self.b[:, None]
+        if modified is not None and self._modified:
+            out = modified(tau, *params, self.dmin[:, None])
+        else:
+            out = kernel(tau, *params)
+        if before is not None:
+            out[before] = np.nan
+        return out
+
+    # ---- core formulas ------------------------------------------------------
+    def q(self, t: ArrayLike) -> NDArray[np.float64]:
+        """Rate q(t) for every well, shape (n_wells, n_times)."""
+        return self._evaluate(t, _kernel_q, _mh._kernel_q)
+
+    def N(self, t: ArrayLike) -> NDArray[np.float64]:
+        """Cumulative production N(t) for every well, shape (n_wells, n_times)."""
+        return self._evaluate(t, _kernel_N, _mh._kernel_N)
+
+    def d(self, t: ArrayLike) -> NDArray[np.float64]:
+        """Nominal decline d(t) = di / (1 + b*di*t) (floored at dmin) for every well."""
+        return self._evaluate(
+            t,
+            lambda tau, di, qi, b: di / (1.0 + b * di * tau),
+            lambda tau, di, qi, b, dmin: _mh._kernel_d(tau, di, b, dmin),
+        )
+
+    def D(self, t: ArrayLike) -> NDArray[np.float64]:
+        """Effective decline over Δt=1, D = 1 - (1 + b*d)^(-1/b), for every well."""
+        return self._evaluate(
+            t,
+            lambda tau, di, qi, b: _kernel_D(tau, di, b),
+            lambda tau, di, qi, b, dmin: _mh._kernel_Dm(tau, di, b, dmin),
+        )
+
+    # ---- economic limit & life ----------------------------------------------
+    def _cases(self, values: ArrayLike, name: str) -> Tuple[NDArray[np.float64], ...]:
+        """Per-case values (cutoffs, targets) and the parameters (di, qi, b, xi, dmin) broadcast against them."""
+        vv = _as_array(values)
+        if vv.ndim == 1:
+            vv = vv[None, :]
+        elif vv.ndim == 2 and vv.shape[0] != self.size:
+            raise ValueError(f"{name} must be scalar, 1-D or of shape ({self.size}, n_cases), got {vv.shape}")
+        elif vv.ndim > 2:
+            raise ValueError(f"{name} must be scalar, 1-D or 2-D, got shape {vv.shape}")
+
+        params = self.di, self.qi, self.b, self.xi, self.dmin
+        if vv.ndim == 2:
+            params = tuple(p[:, None] for p in params)
+        return (vv, *params)
+
+    def _cutoffs(self, q_ec: ArrayLike) -> Tuple[NDArray[np.float64], ...]:
+        """Cutoff grid and the parameters (di, qi, b, dmin) broadcast against it."""
+        qe, di, qi, b, _, dmin = self._cases(q_ec, "q_ec")
+        _validate_positive("q_ec", qe)
+        return qe, di, qi, b, dmin
+
+    def r(self, q_ec: ArrayLike) -> NDArray[np.float64]:
+        """Rate ratio r = qi / q_ec for every well and cutoff."""
+        qe, _, qi, _, _ = self._cutoffs(q_ec)
+        return qi / qe
+
+    def econ(
+        self,
+        q_ec: ArrayLike,
+        *,
+        max_life: Optional[ArrayLike] = None,
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Producing life T and cumulative at the economic limit N_ec (EUR).
+
+        Both are measured from the start of the decline (`xi`) and come
+        from the same ln(qi/q_ec) in one pass. Wells already at or below the
+        cutoff get T = 0 and N_ec = 0. With `max_life` (scalar or
+        broadcastable against the result) life is capped there and N_ec is
+        the cumulative at the cap. Wells with a terminal decline use the
+        closed-form modified hyperbolic life, so long tails cost nothing extra.
+        """
+        qe, di, qi, b, dmin = self._cutoffs(q_ec)
+        qe = np.minimum(qe, qi)  # r >= 1
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            if self._modified:
+                T = _mh._kernel_tq(qe, di, qi, b, dmin)
+                N = _mh._kernel_N(T, di, qi, b, dmin)
+                cumulative = lambda t: _mh._kernel_N(t, di, qi, b, dmin)
+            else:
+                T = _kernel_T(qe, di, qi, b)
+                N = _kernel_Nec(qe, di, qi, b)
+                cumulative = lambda t: _kernel_N(t, di, qi, b)
+            if max_life is not None:
+                cap = _as_array(max_life)
+                if np.any(cap < 0):
+                    raise ValueError("max_life must be >= 0.")
+                capped = T > cap
+                T = np.where(capped, cap, T)
+                N = np.where(capped, cumulative(T), N)
+        return T, N
+
+    def T(self, q_ec: ArrayLike, *, max_life: Optional[ArrayLike] = None) -> NDArray[np.float64]:
+        """Producing life until q(t) = q_ec, optionally capped at `max_life` (see `econ`)."""
+        return self.econ(q_ec, max_life=max_life)[0]
+
+    def N_ec(self, q_ec: ArrayLike, *, max_life: Optional[ArrayLike] = None) -> NDArray[np.float64]:
+        """Cumulative production at the economic limit (EUR), see `econ`."""
+        return self.econ(q_ec, max_life=max_life)[1]
+
+    # ---- inverse-time queries ------------------------------------------------
+    def t_at_q(self, q: ArrayLike) -> NDArray[np.float64]:
+        """
+        Time when each well's rate reaches q, including the `xi` offset, so
+        ``batch.q(batch.t_at_q(q))`` returns q. `q` is laid out like `q_ec`;
+        rates above qi give times before xi.
+        """
+        qq, di, qi, b, xi, dmin = self._cases(q, "q")
+        _validate_positive("q", qq)
+        if self._modified:
+            return xi + _mh._kernel_tq(qq, di, qi, b, dmin)
+        return xi + _kernel_T(qq, di, qi, b)
+
+    def t_at_N(self, N: ArrayLike) -> NDArray[np.float64]:
+        """
+        Time when each well's cumulative reaches N, including the `xi`
+        offset. `N` is laid out like `q_ec`; volumes beyond the ultimate
+        recovery of a well (exponential and hyperbolic only) give inf.
+        """
+        NN, di, qi, b, xi, dmin = self._cases(N, "N")
+        if self._modified:
+            return xi + _mh._kernel_tNm(NN, di, qi, b, dmin)
+        return xi + _kernel_tN(NN, di, qi, b)
+
+    def __repr__(self) -> str:
+        return f"ArpsBatch(n={self.size})"
+
+
+def _group(
+    x: ArrayLike | Sequence[ArrayLike],
+    y: ArrayLike | Sequence[ArrayLike],
+    wells: Optional[ArrayLike] = None,
+) -> Tuple[NDArray, NDArray[np.intp], NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Flatten well data into (keys, codes, x, y).
+
+    With `wells` given, `x`, `y` and `wells` are flat long-format columns and
+    `keys` holds the sorted unique well ids. Without it, `x` and `y` are
+    ragged sequences with one array per well and `keys` is their position.
+    """
+    if wells is None:
+        xs = [np.ravel(_as_array(v)) for v in x]
+        ys = [np.ravel(_as_array(v)) for v in y]
+        if len(xs) != len(ys) or any(a.size != b.size for a, b in zip(xs, ys)):
+            raise ValueError("x and y must hold the same number of equally sized arrays.")
+        keys = np.arange(len(xs))
+        codes = np.repeat(keys, [a.size for a in xs])
+        xx = np.concatenate(xs) if xs else np.empty(0)
+        yy = np.concatenate(ys) if ys else np.empty(0)
+        return keys, codes, xx, yy
+
+    xx, yy = np.ravel(_as_array(x)), np.ravel(_as_array(y))
+    ww = np.ravel(np.asarray(wells))
+    if not (xx.size == yy.size == ww.size):
+        raise ValueError("x, y and wells must have the same length.")
+    keys, codes = np.unique(ww, return_inverse=True)
+    return keys, codes.astype(np.intp), xx, yy
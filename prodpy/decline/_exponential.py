@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, replace
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
-from scipy.stats import linregress
 
 Number = Union[int, float]
 
@@ -19,6 +18,15 @@ def _validate_positive(name: str, value: Number) -> None:
     if not (value > 0):
         raise ValueError(f"{name} must be > 0, got {value!r}")
 
+
+def _output(t: NDArray[np.float64], out: Optional[NDArray[np.float64]]) -> NDArray[np.float64]:
+    """Caller's `out` buffer (same shape as t, float64) or a fresh one."""
+    if out is None:
+        return np.empty_like(t)
+    if out.shape != t.shape or out.dtype != np.float64:
+        raise ValueError(f"out must be a float64 array of shape {t.shape}, got {out.dtype} {out.shape}")
+    return out
+
 @dataclass(frozen=True)
 class Exponential:
     """
@@ -37,6 +45,8 @@ class Exponential:
     Notes:
     - di > 0, qi > 0, t >= 0, q_ec > 0
     - Accepts array-like t and returns NumPy arrays.
+    - q, N, d and D write into `out` when given (no temporaries); `qN`
+      evaluates rate and cumulative together.
     """
 
     di: float = 1.0
@@ -65,35 +75,77 @@ class Exponential:
         return self.with_params(di=di, qi=qi)
 
     # ---- core formulas ------------------------------------------------------
-    def q(self, t: ArrayLike) -> NDArray[np.float64]:
+    def q(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
         """Rate q(t)."""
         tt = _as_array(t)
-        return self.qi * np.exp(-self.di * tt)
+        out = _output(tt, out)
+        np.multiply(tt, -self.di, out=out)
+        np.exp(out, out=out)
+        return np.multiply(out, self.qi, out=out)
+
+    @staticmethod
+    def _rate(t: NDArray[np.float64], di, qi) -> NDArray[np.float64]:
+        """Rate kernel on raw arrays; di and qi broadcast against t, no validation."""
+        return qi * np.exp(-di * t)
 
-    def d(self, t: ArrayLike) -> NDArray[np.float64]:
+    def jac(self, t: ArrayLike) -> NDArray[np.float64]:
+        """
+        Partial derivatives of q(t), shape (t.size, 2), columns (∂q/∂di, ∂q/∂qi):
+          ∂q/∂di = -t * q
+          ∂q/∂qi = exp(-di * t)
+        """
+        return self._jac(np.ravel(_as_array(t)), self.di, self.qi)
+
+    @staticmethod
+    def _jac(t: NDArray[np.float64], di, qi) -> NDArray[np.float64]:
+        out = np.empty((t.size, 2))
+        np.exp(-di * t, out=out[:, 1])
+        np.multiply(-qi * t, out[:, 1], out=out[:, 0])
+        return out
+
+    def d(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
         """
         Nominal decline rate d(t) = - (dq/dt) / q = di (constant).
         Returns an array with the same shape as t.
         """
-        tt = _as_array(t)
-        return np.full_like(tt, self.di, dtype=float)
+        out = _output(_as_array(t), out)
+        out.fill(self.di)
+        return out
 
-    def D(self, t: ArrayLike) -> NDArray[np.float64]:
+    def D(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
         """
         Effective (continuous) decline over Δt=1 (dimensionless):
         D = 1 - exp(-di), constant.
         Returns an array with the same shape as t.
         """
-        tt = _as_array(t)
-        val = 1.0 - math.exp(-self.di)
-        return np.full_like(tt, val, dtype=float)
+        out = _output(_as_array(t), out)
+        out.fill(-math.expm1(-self.di))
+        return out
 
-    def N(self, t: ArrayLike) -> NDArray[np.float64]:
+    def N(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
         """
         Cumulative production N(t) = (qi/di) * (1 - exp(-di * t)).
         """
         tt = _as_array(t)
-        return (self.qi / self.di) * (1.0 - np.exp(-self.di * tt))
+        out = _output(tt, out)
+        np.multiply(tt, -self.di, out=out)
+        np.expm1(out, out=out)
+        return np.multiply(out, -self.qi / self.di, out=out)
+
+    def qN(self, t: ArrayLike, out: Optional[Tuple[NDArray[np.float64], NDArray[np.float64]]] = None) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Rate and cumulative in one pass: with e = expm1(-di * t),
+        q = qi * (1 + e) and N = -(qi/di) * e.
+        """
+        tt = _as_array(t)
+        q, N = (None, None) if out is None else out
+        q, N = _output(tt, q), _output(tt, N)
+        np.multiply(tt, -self.di, out=N)
+        np.expm1(N, out=N)
+        np.add(N, 1.0, out=q)
+        np.multiply(q, self.qi, out=q)
+        np.multiply(N, -self.qi / self.di, out=N)
+        return q, N
 
     # ---- economic limit & life ----------------------------------------------
     def r(self, q_ec: Number) -> float:
@@ -109,6 +161,23 @@ class Exponential:
         _validate_positive("q_ec", q_ec)
         return math.log(self.r(q_ec)) / self.di
 
+    def t_at_q(self, q: ArrayLike) -> NDArray[np.float64]:
+        """
+        Time when the rate reaches q (inverse of `q`; array version of `T`):
+        t = ln(qi / q) / di. Rates above qi give t < 0.
+        """
+        with np.errstate(divide="ignore"):
+            return np.log(self.qi / _as_array(q)) / self.di
+
+    def t_at_N(self, N: ArrayLike) -> NDArray[np.float64]:
+        """
+        Time when the cumulative reaches N (inverse of `N`):
+        t = -ln(1 - N*di/qi) / di. Volumes at or beyond qi/di give inf.
+        """
+        x = _as_array(N) * (self.di / self.qi)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(x >= 1.0, np.inf, -np.log1p(-x) / self.di)
+
     def N_ec(self, q_ec: Number) -> float:
         """
         Cumulative production at economic limit:
@@ -151,6 +220,8 @@ class Exponential:
         Estimate di and qi via log-linear regression:
           regress y = ln(q) on t ⇒ slope=m, intercept=c ⇒ di, qi
         """
+        from scipy.stats import linregress
+
         tt = _as_array(t)
         qq = _as_array(q)
         if tt.shape != qq.shape:
@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, replace
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
-from scipy.stats import linregress
 
 Number = Union[int, float]
 
@@ -18,6 +17,14 @@ def _validate_positive(name: str, value: Number) -> None:
 	if not (value > 0):
 		raise ValueError(f"{name} must be > 0, got {value!r}")
 
+def _output(t: NDArray[np.float64], out: Optional[NDArray[np.float64]]) -> NDArray[np.float64]:
+	"""Caller's `out` buffer (same shape as t, float64) or a fresh one."""
+	if out is None:
+		return np.empty_like(t)
+	if out.shape != t.shape or out.dtype != np.float64:
+		raise ValueError(f"out must be a float64 array of shape {t.shape}, got {out.dtype} {out.shape}")
+	return out
+
 @dataclass(frozen=True)
 class Harmonic:
 	"""
@@ -36,6 +43,8 @@ class Harmonic:
 	Notes:
 	- di > 0, qi > 0, t >= 0, q_ec > 0
 	- Accepts array-like t and returns NumPy arrays.
+	- q, N, d and D write into `out` when given (no temporaries); `qN`
+	  evaluates rate and cumulative together.
 	"""
 
 	di: float = 1.0
@@ -64,35 +73,79 @@ class Harmonic:
 		return self.with_params(di=di, qi=qi)
 
 	# ---- core formulas ------------------------------------------------------
-	def q(self, t: ArrayLike) -> NDArray[np.float64]:
+	def q(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
 		"""Rate q(t)."""
 		tt = _as_array(t)
-		return self.qi / (1.0 + self.di * tt)
+		out = _output(tt, out)
+		np.multiply(tt, self.di, out=out)
+		np.add(out, 1.0, out=out)
+		return np.divide(self.qi, out, out=out)
 
 	# Optional alias for backwards compatibility
 	qt = q
 
-	def d(self, t: ArrayLike) -> NDArray[np.float64]:
+	@staticmethod
+	def _rate(t: NDArray[np.float64], di, qi) -> NDArray[np.float64]:
+		"""Rate kernel on raw arrays; di and qi broadcast against t, no validation."""
+		return qi / (1.0 + di * t)
+
+	def jac(self, t: ArrayLike) -> NDArray[np.float64]:
+		"""
+		Partial derivatives of q(t), shape (t.size, 2), columns (∂q/∂di, ∂q/∂qi):
+		  ∂q/∂di = -qi * t / (1 + di * t)^2
+		  ∂q/∂qi = 1 / (1 + di * t)
+		"""
+		return self._jac(np.ravel(_as_array(t)), self.di, self.qi)
+
+	@staticmethod
+	def _jac(t: NDArray[np.float64], di, qi) -> NDArray[np.float64]:
+		out = np.empty((t.size, 2))
+		np.divide(1.0, 1.0 + di * t, out=out[:, 1])
+		np.multiply(-qi * t, out[:, 1] ** 2, out=out[:, 0])
+		return out
+
+	def d(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
 		"""
 		Nominal decline d(t) = - (dq/dt) / q = di / (1 + di * t).
 		"""
 		tt = _as_array(t)
-		return self.di / (1.0 + self.di * tt)
+		out = _output(tt, out)
+		np.multiply(tt, self.di, out=out)
+		np.add(out, 1.0, out=out)
+		return np.divide(self.di, out, out=out)
 
-	def D(self, t: ArrayLike) -> NDArray[np.float64]:
+	def D(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
 		"""
 		Effective (continuous) decline over Δt=1 (dimensionless):
 		For b=1: D(t) = 1 - (1 + d(t))^{-1} = d(t) / (1 + d(t)).
 		"""
-		d_nom = self.d(t)
-		return d_nom / (1.0 + d_nom)
+		d_nom = self.d(t, out=out)
+		return np.divide(d_nom, 1.0 + d_nom, out=d_nom)
 
-	def N(self, t: ArrayLike) -> NDArray[np.float64]:
+	def N(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
 		"""
 		Cumulative production N(t) = (qi/di) * ln(1 + di * t).
 		"""
 		tt = _as_array(t)
-		return (self.qi / self.di) * np.log1p(self.di * tt)
+		out = _output(tt, out)
+		np.multiply(tt, self.di, out=out)
+		np.log1p(out, out=out)
+		return np.multiply(out, self.qi / self.di, out=out)
+
+	def qN(self, t: ArrayLike, out: Optional[Tuple[NDArray[np.float64], NDArray[np.float64]]] = None) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+		"""
+		Rate and cumulative in one pass: with u = di * t,
+		q = qi / (1 + u) and N = (qi/di) * ln(1 + u).
+		"""
+		tt = _as_array(t)
+		q, N = (None, None) if out is None else out
+		q, N = _output(tt, q), _output(tt, N)
+		np.multiply(tt, self.di, out=q)
+		np.log1p(q, out=N)
+		np.multiply(N, self.qi / self.di, out=N)
+		np.add(q, 1.0, out=q)
+		np.divide(self.qi, q, out=q)
+		return q, N
 
 	# ---- economic limit & life ----------------------------------------------
 	def r(self, q_ec: Number) -> float:
@@ -108,6 +161,22 @@ class Harmonic:
 		_validate_positive("q_ec", q_ec)
 		return (self.r(q_ec) - 1.0) / self.di
 
+	def t_at_q(self, q: ArrayLike) -> NDArray[np.float64]:
+		"""
+		Time when the rate reaches q (inverse of `q`; array version of `T`):
+		t = (qi / q - 1) / di. Rates above qi give t < 0.
+		"""
+		with np.errstate(divide="ignore"):
+			return (self.qi / _as_array(q) - 1.0) / self.di
+
+	def t_at_N(self, N: ArrayLike) -> NDArray[np.float64]:
+		"""
+		Time when the cumulative reaches N (inverse of `N`):
+		t = (exp(N*di/qi) - 1) / di.
+		"""
+		with np.errstate(over="ignore"):
+			return np.expm1(_as_array(N) * (self.di / self.qi)) / self.di
+
 	def N_ec(self, q_ec: Number) -> float:
 		"""
 		Cumulative production at economic limit:
@@ -151,6 +220,8 @@ class Harmonic:
 		"""
 		Estimate di and qi via linear regression on y = 1/q.
 		"""
+		from scipy.stats import linregress
+
 		tt = _as_array(t)
 		qq = _as_array(q)
 		if tt.shape != qq.shape:
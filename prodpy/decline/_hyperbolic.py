@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, replace
-from typing import Any, Tuple, Union
+from typing import Any, Optional, Tuple, Union
 
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
-from scipy.stats import linregress
 
 # -----------------------------
 # Shared doc for symbols/units
@@ -42,21 +41,111 @@ def _validate_positive(name: str, value: Number) -> None:
     if not (value > 0):
         raise ValueError(f"{name} must be > 0, got {value!r}")
 
+def _output(t: NDArray[np.float64], out: Optional[NDArray[np.float64]]) -> NDArray[np.float64]:
+    """Caller's `out` buffer (same shape as t, float64) or a fresh one."""
+    if out is None:
+        return np.empty_like(t)
+    if out.shape != t.shape or out.dtype != np.float64:
+        raise ValueError(f"out must be a float64 array of shape {t.shape}, got {out.dtype} {out.shape}")
+    return out
+
 def _validate_b(b: Number) -> None:
     # Allow [0, 1] with stable limits; you can restrict to (0,1) if desired.
     if not (0.0 <= b <= 1.0):
         raise ValueError(f"b must be in [0, 1], got {b!r}")
 
+# -----------------------------
+# Stable kernels for b in [0, 1]
+# -----------------------------
+# All kernels take raw (broadcastable) arrays for t, di, qi and b, so one call
+# covers mixed exponential / hyperbolic / harmonic batches. They are written
+# in terms of the decline integral
+#
+#   s(t) = ∫ d dt = ln(qi / q) = ln(1 + b*di*t) / b = di*t * L(b*di*t),
+#
+# with L(u) = log1p(u)/u and E(x) = expm1(x)/x, both → 1 at 0. This removes
+# the 1/b and 1/(1-b) singularities, so b = 0 and b = 1 give the exponential
+# and harmonic closed forms without branching.
+
+def _log1p_ratio(u):
+    """L(u) = log1p(u) / u, continuous at u = 0."""
+    u = np.asarray(u, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(u == 0.0, 1.0, np.log1p(u) / u)
+
+def _expm1_ratio(x):
+    """E(x) = expm1(x) / x, continuous at x = 0."""
+    x = np.asarray(x, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        return np.where(x == 0.0, 1.0, np.expm1(x) / x)
+
+def _kernel_s(t, di, b):
+    """Decline integral s(t) = ln(qi / q(t))."""
+    dit = di * t
+    return dit * _log1p_ratio(b * dit)
+
+def _kernel_q(t, di, qi, b):
+    """q(t) = qi * exp(-s)."""
+    return qi * np.exp(-_kernel_s(t, di, b))
+
+def _kernel_N(t, di, qi, b):
+    """N(t) = (qi/di) * (1 - exp(-(1-b)*s)) / (1-b) = (qi/di) * s * E(-(1-b)*s)."""
+    s = _kernel_s(t, di, b)
+    return (qi / di) * s * _expm1_ratio(-(1.0 - b) * s)
+
+def _kernel_D(t, di, b):
+    """D = 1 - (1 + b*d)^(-1/b) = -expm1(-d * L(b*d)) with d = d(t)."""
+    d = di / (1.0 + b * di * t)
+    return -np.expm1(-d * _log1p_ratio(b * d))
+
+def _kernel_T(q_ec, di, qi, b):
+    """T = (r^b - 1) / (b*di) = ln(r)/di * E(b*ln(r)), r = qi/q_ec."""
+    lnr = np.log(qi / q_ec)
+    return lnr / di * _expm1_ratio(b * lnr)
+
+def _kernel_tN(N, di, qi, b):
+    """
+    Time to cumulative N, the inverse of `_kernel_N`: with x = N*di/qi the
+    decline integral is s = -log1p(-(1-b)*x)/(1-b) = x * L(-(1-b)*x) and
+    t = s/di * E(b*s) as in `_kernel_T`. Volumes at or beyond the
+    asymptote qi/(di*(1-b)) are never reached and give inf.
+    """
+    x = N * di / qi
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        s = x * _log1p_ratio(-(1.0 - b) * x)
+        t = s / di * _expm1_ratio(b * s)
+    return np.where((1.0 - b) * x >= 1.0, np.inf, t)
+
+def _kernel_Nec(q_ec, di, qi, b):
+    """N_ec = N(T); at T the decline integral equals ln(r)."""
+    lnr = np.log(qi / q_ec)
+    return (qi / di) * lnr * _expm1_ratio(-(1.0 - b) * lnr)
+
+def _kernel_dqdb(t, di, b):
+    """
+    ∂ln(q)/∂b = [ln(1 + u) - u/(1 + u)] / b^2 with u = b*di*t,
+    written as (di*t)^2 * G(u) where G(u) → 1/2 at u = 0.
+    """
+    dit = di * t
+    u = np.asarray(b * dit, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        G = (np.log1p(u) - u / (1.0 + u)) / (u * u)
+    series = 0.5 - 2.0 * u / 3.0 + 0.75 * u * u
+    return dit * dit * np.where(np.abs(u) < 1e-4, series, G)
+
 @dataclass(frozen=True)
 class Hyperbolic():
     """
     Hyperbolic (Arps) decline model.
 
     q(t) = qi / (1 + b * di * t)^(1/b),    for 0 < b < 1
-    Limits:
+    Limits (evaluated exactly, b = 0 and b = 1 are valid):
       - Exponential (b → 0): q(t) = qi * exp(-di * t)
       - Harmonic    (b → 1): q(t) = qi / (1 + di * t)
 
+    q, N, d and D write into `out` when given (no temporaries); `qN`
+    evaluates rate and cumulative together from one decline integral.
+
     """ + BASE_DOC
 
     b: float = 0.5
@@ -80,45 +169,105 @@ class Hyperbolic():
         """Configure di, qi and return a new instance (functional style)."""
         return self.with_params(di=di, qi=qi)
 
-    def q(self, t: ArrayLike) -> NDArray[np.float64]:
+    def q(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
         """Rate q(t)."""
         tt = _as_array(t)
-        b, di, qi = self.b, self.di, self.qi
+        out = self._integral(tt, _output(tt, out))
+        np.negative(out, out=out)
+        np.exp(out, out=out)
+        return np.multiply(out, self.qi, out=out)
+
+    def _integral(self, t: NDArray[np.float64], out: NDArray[np.float64], where=True) -> NDArray[np.float64]:
+        """Decline integral s(t) = ln(qi / q(t)) written into `out` where `where` (scalar b, so no ratio kernel)."""
+        if self.b == 0.0:
+            return np.multiply(t, self.di, out=out, where=where)
+        np.multiply(t, self.b * self.di, out=out, where=where)
+        np.log1p(out, out=out, where=where)
+        return np.divide(out, self.b, out=out, where=where)
+
+    def _cumulative(self, s: NDArray[np.float64], out: NDArray[np.float64], where=True) -> NDArray[np.float64]:
+        """N = (qi/di) * (1 - exp(-(1-b)*s)) / (1-b) from the decline integral s (may alias `out`)."""
+        if self.b == 1.0:
+            return np.multiply(s, self.qi / self.di, out=out, where=where)
+        np.multiply(s, self.b - 1.0, out=out, where=where)
+        np.expm1(out, out=out, where=where)
+        return np.multiply(out, self.qi / (self.di * (self.b - 1.0)), out=out, where=where)
 
-        with np.errstate(over="ignore", invalid="ignore"):
-            return qi / np.power(1.0 + b * di * tt, 1.0 / b)
+    @staticmethod
+    def _rate(t: NDArray[np.float64], di, qi, b) -> NDArray[np.float64]:
+        """Rate kernel on raw arrays; di, qi and b broadcast against t, no validation."""
+        return _kernel_q(t, di, qi, b)
 
-    def d(self, t: ArrayLike) -> NDArray[np.float64]:
+    def jac(self, t: ArrayLike) -> NDArray[np.float64]:
+        """
+        Partial derivatives of q(t), shape (t.size, 3), columns (∂q/∂di, ∂q/∂qi, ∂q/∂b).
+        With u = b*di*t:
+          ∂q/∂di = -t * q / (1 + u)
+          ∂q/∂qi = q / qi
+          ∂q/∂b  = q * [ln(1 + u) / b^2 - di*t / (b*(1 + u))]
+        """
+        return self._jac(np.ravel(_as_array(t)), self.di, self.qi, self.b)
+
+    @staticmethod
+    def _jac(t: NDArray[np.float64], di, qi, b) -> NDArray[np.float64]:
+        out = np.empty((t.size, 3))
+        np.exp(-_kernel_s(t, di, b), out=out[:, 1])
+        q = qi * out[:, 1]
+        np.multiply(-t / (1.0 + b * di * t), q, out=out[:, 0])
+        np.multiply(q, _kernel_dqdb(t, di, b), out=out[:, 2])
+        return out
+
+    def d(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
         """
         Nominal decline rate d(t) = - (dq/dt) / q.
         For hyperbolic: d(t) = di / (1 + b * di * t)
         """
         tt = _as_array(t)
-        b, di = self.b, self.di
+        out = _output(tt, out)
+        np.multiply(tt, self.b * self.di, out=out)
+        np.add(out, 1.0, out=out)
+        return np.divide(self.di, out, out=out)
 
-        return di / (1.0 + b * di * tt)
-
-    def D(self, t: ArrayLike) -> NDArray[np.float64]:
+    def D(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
         """
         Effective (continuous) decline over Δt=1 (dimensionless).
         For a nominal d(t), the effective over unit time is: D = 1 - exp(-∫ d dt) over 1 time unit.
         For practical workflows people often use: D = 1 - (1 + b d)^(-1/b) when d is (locally) nominal.
         """
-        d_nom, b = self.d(t), self.b
-        with np.errstate(over="ignore", invalid="ignore"):
-            return 1.0 - np.power(1.0 + b * d_nom, -1.0 / b)
-
-    def N(self, t: ArrayLike) -> NDArray[np.float64]:
+        out = self.d(t, out=out)
+        if self.b == 0.0:
+            np.negative(out, out=out)
+        else:
+            np.multiply(out, self.b, out=out)
+            np.log1p(out, out=out)
+            np.multiply(out, -1.0 / self.b, out=out)
+        np.expm1(out, out=out)
+        return np.negative(out, out=out)
+
+    def N(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
         """
         Cumulative production N(t).
         Hyperbolic (0<b<1): N(t) = (qi/di)/(1-b) * [1 - (1 + b*di*t)^(1 - 1/b)]
-
+        Evaluated in log1p/expm1 form, exact at b = 0 and b = 1.
         """
         tt = _as_array(t)
-        b, di, qi = self.b, self.di, self.qi
+        out = self._integral(tt, _output(tt, out))
+        return self._cumulative(out, out)
 
-        with np.errstate(over="ignore", invalid="ignore"):
-            return (qi / di) / (1.0 - b) * (1.0 - np.power(1.0 + b * di * tt, 1.0 - 1.0 / b))
+    def qN(self, t: ArrayLike, out: Optional[Tuple[NDArray[np.float64], NDArray[np.float64]]] = None) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Rate and cumulative in one pass: both follow from the decline
+        integral s(t), q = qi * exp(-s) and N as in `N`.
+        """
+        tt = _as_array(t)
+        q, N = (None, None) if out is None else out
+        q, N = _output(tt, q), _output(tt, N)
+        self._integral(tt, N)
+        np.negative(N, out=q)
+        np.exp(q, out=q)
+        np.multiply(q, self.qi, out=q)
+        self._cumulative(N, N)
+        return q, N
 
     def r(self, q_ec: Number) -> float:
         """Rate ratio r = qi / q_ec."""
@@ -132,27 +281,32 @@ class Hyperbolic():
 
         """
         _validate_positive("q_ec", q_ec)
-        b, di, r = self.b, self.di, self.r(q_ec)
+        return float(_kernel_T(float(q_ec), self.di, self.qi, self.b))
 
-        return (r**b - 1.0) / (b * di)
+    def t_at_q(self, q: ArrayLike) -> NDArray[np.float64]:
+        """
+        Time when the rate reaches q (inverse of `q`; array version of `T`):
+        t = ((qi/q)^b - 1) / (b*di). Rates above qi give t < 0.
+        """
+        with np.errstate(divide="ignore"):
+            return _kernel_T(_as_array(q), self.di, self.qi, self.b)
+
+    def t_at_N(self, N: ArrayLike) -> NDArray[np.float64]:
+        """
+        Time when the cumulative reaches N (inverse of `N`):
+        t = ([1 - (1-b)*N*di/qi]^(-b/(1-b)) - 1) / (b*di).
+        Volumes beyond the ultimate recovery qi/(di*(1-b)) give inf.
+        """
+        return _kernel_tN(_as_array(N), self.di, self.qi, self.b)
 
     def N_ec(self, q_ec: Number) -> float:
         """
         Cumulative production at economic limit.
-        Uses your closed-form with r and T; handled robustly for limits.
+        Equivalent to N_ec = (qi*T*b)/(1-b) * ( (r^{-b} - r^{-1}) / (1 - r^{-b}) ),
+        evaluated as N(T) in the stable form so b = 0, b = 1 and r → 1 are exact.
         """
         _validate_positive("q_ec", q_ec)
-        b = self.b
-        T = self.T(q_ec)
-        r = self.r(q_ec)
-
-        # Your original compact expression:
-        # N_ec = (qi*T*b)/(1-b) * ( (r^{-b} - r^{-1}) / (1 - r^{-b}) )
-        r_m_b = r ** (-b)
-        r_m_1 = r ** (-1.0)
-        num = r_m_b - r_m_1
-        den = 1.0 - r_m_b
-        return (self.qi * T * b) / (1.0 - b) * (num / den)
+        return float(_kernel_Nec(float(q_ec), self.di, self.qi, self.b))
 
     # ---- linearization & inversion ------------------------------------------
     @staticmethod
@@ -189,6 +343,8 @@ class Hyperbolic():
         Estimate di and qi via linearization (b fixed):
         regress y = q^{-b} on t ⇒ slope=m, intercept=c ⇒ di, qi
         """
+        from scipy.stats import linregress
+
         tt = _as_array(t)
         qq = _as_array(q)
         if tt.shape != qq.shape:
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+Curve = Callable[[NDArray[np.float64]], NDArray[np.float64]]
+
+
+def solve_time(
+    f: Curve,
+    target: ArrayLike,
+    *,
+    dfdt: Optional[Curve] = None,
+    increasing: bool = True,
+    t_max: float = 1e9,
+    rtol: float = 1e-12,
+    maxiter: int = 100,
+) -> NDArray[np.float64]:
+    """
+    Vectorized inverse of a monotone curve: the t >= 0 with f(t) = target.
+
+    Fallback for models without a closed-form inverse (the Arps models have
+    `t_at_q` / `t_at_N`). Every element is solved at once by safeguarded
+    Newton iterations: a bracket [lo, hi] is grown geometrically from
+    [0, 1] until it holds the root, and Newton steps that leave it (or any
+    step when `dfdt` is None) are replaced by bisection.
+
+    Parameters
+    ----------
+    f : callable
+        Curve evaluated elementwise on an array of times shaped like `target`
+        (parameters can be closed over as arrays broadcast to that shape).
+    target : array_like
+        Values to reach, e.g. cumulative volumes or rates.
+    dfdt : callable, optional
+        Time derivative of `f` (e.g. the rate for a cumulative curve).
+    increasing : bool, default True
+        Whether `f` increases with time (cumulative) or decreases (rate).
+    t_max : float, default 1e9
+        Search horizon; targets not reached by then give inf.
+    rtol : float, default 1e-12
+        Convergence tolerance on the step, relative to max(|t|, 1).
+    maxiter : int, default 100
+        Maximum number of Newton/bisection iterations.
+
+    Returns
+    -------
+    ndarray
+        Times shaped like `target`; 0 where f(0) already reaches the target.
+    """
+    goal = np.asarray(target, dtype=float)
+    sign = 1.0 if increasing else -1.0
+
+    def g(t):
+        return sign * (f(t) - goal)
+
+    lo = np.zeros_like(goal)
+    hi = np.ones_like(goal)
+    with np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+        reached = g(lo) >= 0.0
+        g_hi = g(hi)
+        for _ in range(128):
+            grow = (g_hi < 0.0) & (hi < t_max)
+            if not np.any(grow):
+                break
+            lo = np.where(grow, hi, lo)
+            hi = np.where(grow, np.minimum(4.0 * hi, t_max), hi)
+            g_hi = np.where(grow, g(hi), g_hi)
+        never = ~(g_hi >= 0.0)
+
+        t = 0.5 * (lo + hi)
+        for _ in range(maxiter):
+            gt = g(t)
+            above = gt >= 0.0
+            hi = np.where(above, t, hi)
+            lo = np.where(above, lo, t)
+
+            step = t - gt / (sign * dfdt(t)) if dfdt is not None else np.full_like(t, np.nan)
+            inside = np.isfinite(step) & (step > lo) & (step < hi)
+            t_new = np.where(inside, step, 0.5 * (lo + hi))
+
+            done = np.abs(t_new - t) <= rtol * np.maximum(np.abs(t_new), 1.0)
+            t = t_new
+            if np.all(done | reached | never):
+                break
+
+    t = np.where(reached, 0.0, t)
+    return np.where(never & ~reached, np.inf, t)
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+def _as_array(x: ArrayLike) -> NDArray[np.float64]:
+    return np.asarray(x, dtype=float)
+
+
+class LinearFit(NamedTuple):
+    """Regression estimates with the attribute names of `scipy.stats.linregress`."""
+
+    slope: float
+    intercept: float
+    rvalue: float
+    stderr: float
+    intercept_stderr: float
+
+
+@dataclass(frozen=True)
+class LinearStats:
+    """
+    Sufficient statistics of the simple linear regression y = c + m x.
+
+    Every field is an array (0-d for one sample set, 1-D for one entry per
+    group), so the estimates of thousands of regressions are a handful of
+    array operations:
+
+      n   = Σ 1        sx  = Σ x        sy  = Σ y
+      sxx = Σ x²       sxy = Σ x y      syy = Σ y²
+
+    Statistics of disjoint sample sets add up, which is what makes them
+    usable for segmented, prefix-sum and incremental regressions.
+
+    Weighted regressions use the same fields with every sum weighted
+    (n = Σ w, sx = Σ w x, ...); the estimates are then the weighted least
+    squares ones.
+    """
+
+    n: NDArray[np.float64]
+    sx: NDArray[np.float64]
+    sy: NDArray[np.float64]
+    sxx: NDArray[np.float64]
+    sxy: NDArray[np.float64]
+    syy: NDArray[np.float64]
+
+    # ---- construction -------------------------------------------------------
+    @classmethod
+    def from_samples(cls, x: ArrayLike, y: ArrayLike, w: Optional[ArrayLike] = None) -> "LinearStats":
+        """Statistics of one sample set, optionally with per-sample weights `w`."""
+        xx, yy = _as_array(x), _as_array(y)
+        if w is not None:
+            ww = np.broadcast_to(_as_array(w), xx.shape)
+            wx, wy = ww * xx, ww * yy
+            return cls(
+                n=np.asarray(ww.sum()),
+                sx=np.asarray(wx.sum()),
+                sy=np.asarray(wy.sum()),
+                sxx=np.asarray(np.dot(wx, xx)),
+                sxy=np.asarray(np.dot(wx, yy)),
+                syy=np.asarray(np.dot(wy, yy)),
+            )
+        return cls(
+            n=np.asarray(float(xx.size)),
+            sx=np.asarray(xx.sum()),
+            sy=np.asarray(yy.sum()),
+            sxx=np.asarray(np.dot(xx, xx)),
+            sxy=np.asarray(np.dot(xx, yy)),
+            syy=np.asarray(np.dot(yy, yy)),
+        )
+
+    @classmethod
+    def zeros(cls, shape=()) -> "LinearStats":
+        """Statistics of empty sample sets."""
+        return cls(*(np.zeros(shape) for _ in range(6)))
+
+    @classmethod
+    def from_groups(
+        cls,
+        codes: ArrayLike,
+        x: ArrayLike,
+        y: ArrayLike,
+        ngroups: int,
+        w: Optional[ArrayLike] = None,
+    ) -> "LinearStats":
+        """
+        Per-group statistics from integer group codes in [0, ngroups),
+        optionally with per-sample weights `w`.
+
+        Samples do not need to be sorted; groups without samples get zeros.
+        """
+        cc = np.asarray(codes, dtype=np.intp)
+        xx, yy = _as_array(x), _as_array(y)
+        wx, wy = (xx, yy) if w is None else (_as_array(w) * xx, _as_array(w) * yy)
+
+        def total(v=None):
+            return np.bincount(cc, weights=v, minlength=ngroups).astype(float)
+
+        return cls(
+            n=total(None if w is None else np.broadcast_to(_as_array(w), cc.shape)),
+            sx=total(wx),
+            sy=total(wy),
+            sxx=total(wx * xx),
+            sxy=total(wx * yy),
+            syy=total(wy * yy),
+        )
+
+    @classmethod
+    def prefix(cls, x: ArrayLike, y: ArrayLike) -> "LinearStats":
+        """
+        Prefix sums with a leading zero: entry k holds the statistics of the
+        first k samples, so samples [i, j) are `P.take(j) - P.take(i)`.
+        """
+        xx, yy = _as_array(x), _as_array(y)
+
+        def cumsum(v):
+            out = np.zeros(v.size + 1)
+            np.cumsum(v, out=out[1:])
+            return out
+
+        return cls(
+            n=np.arange(xx.size + 1, dtype=float),
+            sx=cumsum(xx),
+            sy=cumsum(yy),
+            sxx=cumsum(xx * xx),
+            sxy=cumsum(xx * yy),
+            syy=cumsum(yy * yy),
+        )
+
+    def take(self, index: ArrayLike) -> "LinearStats":
+        """Entries selected by an integer or boolean index."""
+        return LinearStats(*(getattr(self, f)[index] for f in self.__dataclass_fields__))
+
+    def shift(self, a: ArrayLike) -> "LinearStats":
+        """Statistics of (x - a, y), e.g. to move the intercept to x = a."""
+        a = _as_array(a)
+        return LinearStats(
+            n=self.n,
+            sx=self.sx - self.n * a,
+            sy=self.sy,
+            sxx=self.sxx - 2.0 * a * self.sx + self.n * a * a,
+            sxy=self.sxy - a * self.sy,
+            syy=self.syy,
+        )
+
+    def __sub__(self, other: "LinearStats") -> "LinearStats":
+        return LinearStats(
+            n=self.n - other.n,
+            sx=self.sx - other.sx,
+            sy=self.sy - other.sy,
+            sxx=self.sxx - other.sxx,
+            sxy=self.sxy - other.sxy,
+            syy=self.syy - other.syy,
+        )
+
+    def __add__(self, other: "LinearStats") -> "LinearStats":
+        return LinearStats(
+            n=self.n + other.n,
+            sx=self.sx + other.sx,
+            sy=self.sy + other.sy,
+            sxx=self.sxx + other.sxx,
+            sxy=self.sxy + other.sxy,
+            syy=self.syy + other.syy,
+        )
+
+    # ---- centered moments ---------------------------------------------------
+    @property
+    def _Sxx(self) -> NDArray[np.float64]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.sxx - self.sx * self.sx / self.n
+
+    @property
+    def _Sxy(self) -> NDArray[np.float64]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.sxy - self.sx * self.sy / self.n
+
+    @property
+    def _Syy(self) -> NDArray[np.float64]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.syy - self.sy * self.sy / self.n
+
+    # ---- estimates ----------------------------------------------------------
+    @property
+    def slope(self) -> NDArray[np.float64]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self._Sxy / self._Sxx
+
+    @property
+    def intercept(self) -> NDArray[np.float64]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (self.sy - self.slope * self.sx) / self.n
+
+    @property
+    def rvalue(self) -> NDArray[np.float64]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = self._Sxy / np.sqrt(self._Sxx * self._Syy)
+        return np.clip(r, -1.0, 1.0)
+
+    @property
+    def rsquared_adj(self) -> NDArray[np.float64]:
+        """Adjusted R² = 1 - (1 - r²)(n - 1)/(n - 2); NaN for n <= 2."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2 = self.rvalue ** 2
+            return np.where(self.n > 2, 1.0 - (1.0 - r2) * (self.n - 1.0) / (self.n - 2.0), np.nan)
+
+    @property
+    def sse(self) -> NDArray[np.float64]:
+        """Residual sum of squares of the least-squares line."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.maximum(self._Syy - self._Sxy * self._Sxy / self._Sxx, 0.0)
+
+    @property
+    def variance(self) -> NDArray[np.float64]:
+        """Residual variance σ² = SSE / (n - 2)."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.n > 2, self.sse / (self.n - 2.0), np.nan)
+
+    @property
+    def stderr(self) -> NDArray[np.float64]:
+        """Standard error of the slope (same definition as `scipy.stats.linregress`)."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.sqrt(self.variance / self._Sxx)
+
+    @property
+    def intercept_stderr(self) -> NDArray[np.float64]:
+        """Standard error of the intercept."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.stderr * np.sqrt(self.sxx / self.n)
+
+    @property
+    def covariance(self) -> NDArray[np.float64]:
+        """Covariance between slope and intercept estimates."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return -(self.sx / self.n) * self.variance / self._Sxx
+
+    def result(self) -> LinearFit:
+        """Estimates of a single regression as a `LinearFit` record."""
+        return LinearFit(
+            slope=float(self.slope),
+            intercept=float(self.intercept),
+            rvalue=float(self.rvalue),
+            stderr=float(self.stderr),
+            intercept_stderr=float(self.intercept_stderr),
+        )
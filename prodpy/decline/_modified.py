@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._hyperbolic import BASE_DOC, Hyperbolic, _expm1_ratio
+from ._hyperbolic import _kernel_D as _hyp_D
+from ._hyperbolic import _kernel_N as _hyp_N
+from ._hyperbolic import _kernel_s as _hyp_s
+from ._hyperbolic import _kernel_T as _hyp_T
+from ._hyperbolic import _kernel_tN as _hyp_tN
+
+Number = Union[int, float]
+
+
+def _as_array(t: ArrayLike) -> NDArray[np.float64]:
+    return np.asarray(t, dtype=float)
+
+
+def _validate_positive(name: str, value: Number) -> None:
+    if not (value > 0):
+        raise ValueError(f"{name} must be > 0, got {value!r}")
+
+
+def _output(t: NDArray[np.float64], out: Optional[NDArray[np.float64]]) -> NDArray[np.float64]:
+    """Caller's `out` buffer (same shape as t, float64) or a fresh one."""
+    if out is None:
+        return np.empty_like(t)
+    if out.shape != t.shape or out.dtype != np.float64:
+        raise ValueError(f"out must be a float64 array of shape {t.shape}, got {out.dtype} {out.shape}")
+    return out
+
+# -----------------------------
+# Kernels (broadcast over t, di, qi, b, dmin)
+# -----------------------------
+# The nominal decline d(t) = di / (1 + b*di*t) is floored at dmin: the curve
+# is hyperbolic until d reaches dmin at
+#
+#   t_sw = (di - dmin) / (b * di * dmin)
+#
+# and exponential with decline dmin afterwards. t_sw = 0 when di <= dmin
+# (exponential at dmin from the start) and t_sw = inf when the floor is never
+# reached (dmin = 0, or b = 0 with di > dmin), so dmin = 0 is the plain
+# hyperbolic curve.
+
+def _kernel_tsw(di, b, dmin):
+    """Switch time t_sw from hyperbolic to terminal exponential decline."""
+    di, b, dmin = (np.asarray(v, dtype=float) for v in (di, b, dmin))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (di - dmin) / (b * di * dmin)
+    return np.where(di <= dmin, 0.0, np.where((b == 0.0) | (dmin == 0.0), np.inf, t))
+
+def _switch(di, qi, b, dmin):
+    """(t_sw, s_sw, q_sw, N_sw): switch time, decline integral, rate and cumulative at the switch."""
+    tsw = _kernel_tsw(di, b, dmin)
+    finite = np.isfinite(tsw)
+    tf = np.where(finite, tsw, 0.0)
+    s_sw = np.where(finite, _hyp_s(tf, di, b), np.inf)
+    N_sw = np.where(finite, _hyp_N(tf, di, qi, b), np.inf)
+    return tsw, s_sw, qi * np.exp(-s_sw), N_sw
+
+def _split(t, tsw):
+    """Time spent on the hyperbolic (tau) and on the exponential (dt) segment."""
+    with np.errstate(invalid="ignore"):
+        return np.minimum(t, tsw), np.maximum(t - tsw, 0.0)
+
+def _kernel_q(t, di, qi, b, dmin):
+    """q(t) = qi * exp(-s_hyp(min(t, t_sw)) - dmin * max(t - t_sw, 0))."""
+    tau, dt = _split(t, _kernel_tsw(di, b, dmin))
+    return qi * np.exp(-(_hyp_s(tau, di, b) + dmin * dt))
+
+def _kernel_N(t, di, qi, b, dmin):
+    """N(t) = N_hyp(min(t, t_sw)) + q_sw * (1 - exp(-dmin*dt)) / dmin."""
+    return _kernel_qN(t, di, qi, b, dmin)[1]
+
+def _kernel_qN(t, di, qi, b, dmin):
+    """Rate and cumulative from one split of t at the switch."""
+    tsw, _, q_sw, _ = _switch(di, qi, b, dmin)
+    tau, dt = _split(t, tsw)
+    s = _hyp_s(tau, di, b)
+    q = qi * np.exp(-(s + dmin * dt))
+    N_hyp = (qi / di) * s * _expm1_ratio(-(1.0 - b) * s)
+    N_exp = np.where(dt > 0.0, q_sw * dt * _expm1_ratio(-dmin * dt), 0.0)
+    return q, N_hyp + N_exp
+
+def _kernel_d(t, di, b, dmin):
+    """d(t) = max(di / (1 + b*di*t), dmin)."""
+    return np.maximum(di / (1.0 + b * di * t), dmin)
+
+def _kernel_Dm(t, di, b, dmin):
+    """Effective decline: hyperbolic form before the switch, 1 - exp(-dmin) after."""
+    return np.where(t < _kernel_tsw(di, b, dmin), _hyp_D(t, di, b), -np.expm1(-dmin))
+
+def _kernel_tq(q, di, qi, b, dmin):
+    """Time when the rate reaches q (economic life for q = q_ec)."""
+    tsw, s_sw, _, _ = _switch(di, qi, b, dmin)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lnr = np.log(qi / q)
+        after = lnr > s_sw
+        t_hyp = _hyp_T(q, di, qi, b)
+        t_exp = tsw + (lnr - s_sw) / dmin
+    return np.where(after, t_exp, t_hyp)
+
+def _kernel_tNm(N, di, qi, b, dmin):
+    """Time when the cumulative reaches N; inf beyond the ultimate recovery."""
+    tsw, _, q_sw, N_sw = _switch(di, qi, b, dmin)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = (N - N_sw) * dmin / q_sw
+        t_exp = np.where(x >= 1.0, np.inf, tsw - np.log1p(-x) / dmin)
+    return np.where(N > N_sw, t_exp, _hyp_tN(N, di, qi, b))
+
+def _kernel_Nec(q_ec, di, qi, b, dmin):
+    """Cumulative at the economic limit, N(T(q_ec))."""
+    return _kernel_N(_kernel_tq(q_ec, di, qi, b, dmin), di, qi, b, dmin)
+
+@dataclass(frozen=True)
+class ModifiedHyperbolic:
+    """
+    Modified hyperbolic decline: hyperbolic with a terminal exponential tail.
+
+    The nominal decline follows the hyperbolic d(t) = di / (1 + b*di*t) until
+    it falls to `dmin`, at the switch time
+
+      t_sw = (di - dmin) / (b * di * dmin),
+
+    and stays at dmin afterwards:
+
+      q(t) = qi / (1 + b*di*t)^(1/b)                 for t <= t_sw
+      q(t) = q_sw * exp(-dmin * (t - t_sw))          for t >  t_sw
+
+    The switch is computed analytically and q, N and the economic limit are
+    evaluated piecewise in one vectorized pass. dmin = 0 (never switches)
+    reproduces `Hyperbolic`; di <= dmin is exponential at dmin throughout.
+
+    q, N, d and D write into `out` when given (no temporaries): the
+    exponential tail and the hyperbolic segment are written in place
+    through a mask of the times past the switch (`out` may alias t).
+
+    """ + BASE_DOC + """dmin: Terminal (minimum) nominal decline rate (1/time, same unit as di)
+"""
+
+    b: float = 0.5
+    di: float = 1.0
+    qi: float = 1.0
+    dmin: float = 0.0
+
+    # ---- construction & validation -----------------------------------------
+    def __post_init__(self):
+        if not (0.0 <= self.b <= 1.0):
+            raise ValueError(f"b must be in [0, 1], got {self.b!r}")
+        _validate_positive("di", self.di)
+        _validate_positive("qi", self.qi)
+        if not (self.dmin >= 0.0):
+            raise ValueError(f"dmin must be >= 0, got {self.dmin!r}")
+
+    def with_params(
+        self,
+        *,
+        di: Number | None = None,
+        qi: Number | None = None,
+        b: Number | None = None,
+        dmin: Number | None = None,
+    ) -> "ModifiedHyperbolic":
+        """Return a new instance with updated parameters (immutability-friendly)."""
+        return replace(self,
+            di=float(di) if di is not None else self.di,
+            qi=float(qi) if qi is not None else self.qi,
+            b=float(b) if b is not None else self.b,
+            dmin=float(dmin) if dmin is not None else self.dmin)
+
+    def __call__(self, di: Number, qi: Number) -> "ModifiedHyperbolic":
+        """Configure di, qi and return a new instance (functional style)."""
+        return self.with_params(di=di, qi=qi)
+
+    # ---- switch -------------------------------------------------------------
+    @property
+    def t_switch(self) -> float:
+        """Time at which the decline reaches dmin (inf if it never does)."""
+        return float(_kernel_tsw(self.di, self.b, self.dmin))
+
+    @property
+    def q_switch(self) -> float:
+        """Rate at the switch (0 if the switch is never reached)."""
+        return float(_switch(self.di, self.qi, self.b, self.dmin)[2])
+
+    @property
+    def _hyperbolic(self) -> Hyperbolic:
+        """The hyperbolic segment as a plain `Hyperbolic` (its in-place kernels)."""
+        return Hyperbolic(b=self.b, di=self.di, qi=self.qi)
+
+    def _after(self, t: NDArray[np.float64]):
+        """(t_sw, mask of the times past the switch), the mask None if the switch is never reached."""
+        tsw = self.t_switch
+        if not np.isfinite(tsw):
+            return tsw, None
+        with np.errstate(invalid="ignore"):
+            return tsw, t > tsw
+
+    # ---- core formulas ------------------------------------------------------
+    def q(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
+        """Rate q(t)."""
+        tt = _as_array(t)
+        out = _output(tt, out)
+        tsw, after = self._after(tt)
+        if after is not None:
+            # s = s_sw + dmin * (t - t_sw) on the tail
+            s_sw = float(_hyp_s(tsw, self.di, self.b))
+            np.multiply(tt, self.dmin, out=out, where=after)
+            np.add(out, s_sw - self.dmin * tsw, out=out, where=after)
+        self._hyperbolic._integral(tt, out, where=True if after is None else ~after)
+        np.negative(out, out=out)
+        np.exp(out, out=out)
+        return np.multiply(out, self.qi, out=out)
+
+    @staticmethod
+    def _rate(t: NDArray[np.float64], di, qi, b, dmin) -> NDArray[np.float64]:
+        """Rate kernel on raw arrays; parameters broadcast against t, no validation."""
+        return _kernel_q(t, di, qi, b, dmin)
+
+    def jac(self, t: ArrayLike) -> NDArray[np.float64]:
+        """
+        Partial derivatives of q(t) with b and dmin fixed, shape (t.size, 2),
+        columns (∂q/∂di, ∂q/∂qi):
+          ∂q/∂di = -t * q / (1 + b*di*t)      before the switch
+          ∂q/∂di = -q * dmin * t_sw / di      after it
+          ∂q/∂qi = q / qi
+        """
+        return self._jac(np.ravel(_as_array(t)), self.di, self.qi, self.b, self.dmin)
+
+    @staticmethod
+    def _jac(t: NDArray[np.float64], di, qi, b, dmin) -> NDArray[np.float64]:
+        tsw = _kernel_tsw(di, b, dmin)
+        out = np.empty((t.size, 2))
+        q = _kernel_q(t, di, qi, b, dmin)
+        with np.errstate(invalid="ignore"):
+            after = -q * dmin * np.where(np.isfinite(tsw), tsw, 0.0) / di
+        out[:, 0] = np.where(t < tsw, -t * q / (1.0 + b * di * t), after)
+        out[:, 1] = q / qi
+        return out
+
+    def d(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
+        """Nominal decline d(t) = max(di / (1 + b*di*t), dmin)."""
+        out = self._hyperbolic.d(t, out=out)
+        return np.maximum(out, self.dmin, out=out)
+
+    def D(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
+        """
+        Effective decline over Δt=1: 1 - (1 + b*d)^(-1/b) on the hyperbolic
+        segment, 1 - exp(-dmin) on the exponential tail.
+        """
+        tt = _as_array(t)
+        with np.errstate(invalid="ignore"):
+            tail = ~(tt < self.t_switch)
+        out = self._hyperbolic.D(tt, out=out)
+        np.copyto(out, -np.expm1(-self.dmin), where=tail)
+        return out
+
+    def N(self, t: ArrayLike, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
+        """
+        Cumulative production N(t): hyperbolic N up to t_sw, plus
+        q_sw * (1 - exp(-dmin*(t - t_sw))) / dmin on the tail.
+        """
+        tt = _as_array(t)
+        out = _output(tt, out)
+        tsw, after = self._after(tt)
+        if after is not None:
+            _, _, q_sw, N_sw = _switch(self.di, self.qi, self.b, self.dmin)
+            np.subtract(tt, tsw, out=out, where=after)
+            np.multiply(out, -self.dmin, out=out, where=after)
+            np.expm1(out, out=out, where=after)
+            np.multiply(out, -float(q_sw) / self.dmin, out=out, where=after)
+            np.add(out, float(N_sw), out=out, where=after)
+        before = True if after is None else ~after
+        hyp = self._hyperbolic
+        return hyp._cumulative(hyp._integral(tt, out, where=before), out, where=before)
+
+    def qN(self, t: ArrayLike, out: Optional[Tuple[NDArray[np.float64], NDArray[np.float64]]] = None) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Rate and cumulative in one pass."""
+        if out is None:
+            return _kernel_qN(_as_array(t), self.di, self.qi, self.b, self.dmin)
+        return self.q(t, out=out[0]), self.N(t, out=out[1])
+
+    # ---- economic limit & life ----------------------------------------------
+    def r(self, q_ec: Number) -> float:
+        """Rate ratio r = qi / q_ec."""
+        _validate_positive("q_ec", q_ec)
+        return float(self.qi / q_ec)
+
+    def T(self, q_ec: Number) -> float:
+        """
+        Producing life until q(t) = q_ec: hyperbolic T if q_ec >= q_sw,
+        otherwise t_sw + ln(q_sw / q_ec) / dmin.
+        """
+        _validate_positive("q_ec", q_ec)
+        return float(_kernel_tq(float(q_ec), self.di, self.qi, self.b, self.dmin))
+
+    def N_ec(self, q_ec: Number) -> float:
+        """Cumulative production at economic limit, N(T(q_ec))."""
+        _validate_positive("q_ec", q_ec)
+        return float(_kernel_Nec(float(q_ec), self.di, self.qi, self.b, self.dmin))
+
+    def t_at_q(self, q: ArrayLike) -> NDArray[np.float64]:
+        """Time when the rate reaches q (inverse of `q`; array version of `T`)."""
+        return _kernel_tq(_as_array(q), self.di, self.qi, self.b, self.dmin)
+
+    def t_at_N(self, N: ArrayLike) -> NDArray[np.float64]:
+        """Time when the cumulative reaches N; inf beyond the ultimate recovery."""
+        return _kernel_tNm(_as_array(N), self.di, self.qi, self.b, self.dmin)
+
+    # ---- linearization & inversion ------------------------------------------
+    @staticmethod
+    def _linearize(q: ArrayLike, b: Number) -> NDArray[np.float64]:
+        """
+        Linearization of the hyperbolic segment: q^{-b}, or ln(q) for b = 0.
+        Used for initial guesses; the tail bends the trend away from a line.
+        """
+        if b == 0.0:
+            return np.log(_as_array(q))
+        return Hyperbolic._linearize(q, b)
+
+    def linearize(self, q: ArrayLike) -> NDArray[np.float64]:
+        """Instance helper: linearization with current b."""
+        return self._linearize(q, self.b)
+
+    @staticmethod
+    def invert(slope: Number, intercept: Number, b: Number) -> Tuple[float, float]:
+        """Inverse of `_linearize` regression estimates to (di, qi)."""
+        if b == 0.0:
+            return -float(slope), float(np.exp(intercept))
+        return Hyperbolic.invert(slope, intercept, b)
+
+    def fit(self, t: ArrayLike, q: ArrayLike) -> "ModifiedHyperbolic":
+        """
+        Estimate di and qi via the hyperbolic-segment linearization (b and
+        dmin fixed). Use `Arps.fit` for the non-linear fit of the full curve.
+        """
+        from scipy.stats import linregress
+
+        tt = _as_array(t)
+        qq = _as_array(q)
+        if tt.shape != qq.shape:
+            raise ValueError("t and q must have the same shape")
+        reg = linregress(tt, self.linearize(qq))
+        di, qi = self.invert(reg.slope, reg.intercept, self.b)
+        return self.with_params(di=di, qi=qi)
+
+    # ---- convenience / representation ---------------------------------------
+    @property
+    def mode(self) -> str:
+        """Getter for the decline mode."""
+        return 'modified'
+
+    def __repr__(self) -> str:
+        return f"ModifiedHyperbolic(b={self.b:.6g}, di={self.di:.6g}, qi={self.qi:.6g}, dmin={self.dmin:.6g})"
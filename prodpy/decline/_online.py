@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._arps import Arps, FitResult, Number
+from ._linstats import LinearStats
+
+
+def _as_array(x: ArrayLike) -> NDArray[np.float64]:
+    return np.ravel(np.asarray(x, dtype=float))
+
+
+class OnlineFit:
+    """
+    Incremental Arps fit that refits in O(new points) as data arrives.
+
+    The linearized regression is carried as running sufficient statistics
+    (n, Σt, Σy, Σt², Σty on the linearized scale), so `update` only touches
+    the appended samples. The non-linear polish (`curve_fit` over the whole
+    history) runs only when the linear estimate of (di, qi) has moved by
+    more than `rtol` (relative) since the last polish; otherwise the last
+    polished parameters are kept and their R² is updated incrementally.
+
+    Parameters
+    ----------
+    arps : Arps
+        Model family (mode and b) to fit.
+    xi : float, default 0.0
+        Start time; samples before a non-zero `xi` are ignored.
+    rtol : float, default 1e-3
+        Relative change of the linear (di, qi) that triggers a polish.
+
+    Examples
+    --------
+    >>> online = OnlineFit(Arps(1.0, 1.0, mode="hyperbolic"))
+    >>> fit = online.update(t_history, q_history)   # full fit
+    >>> fit = online.update(t_today, q_today)       # O(1) unless it moved
+    """
+
+    def __init__(self, arps: Arps, *, xi: Number = 0.0, rtol: float = 1e-3):
+        self.arps = arps
+        self.xi = float(xi)
+        self.rtol = float(rtol)
+
+        self.result: Optional[FitResult] = None
+        self.polished: bool = False  # whether the last update ran the polish
+
+        self._stats = LinearStats.zeros()  # linearized (t, y) sums
+        self._rates = LinearStats.zeros()  # (t, q) sums, for R²
+        self._ssres = 0.0  # residual sum of squares of `result`
+        self._anchor: Optional[np.ndarray] = None  # linear (di, qi) at last polish
+
+        self._t = np.empty(64)
+        self._q = np.empty(64)
+        self._n = 0
+
+    # ---- data buffer ----------------------------------------------------------
+    @property
+    def t(self) -> NDArray[np.float64]:
+        """Accepted (shifted) times."""
+        return self._t[: self._n]
+
+    @property
+    def q(self) -> NDArray[np.float64]:
+        """Accepted rates."""
+        return self._q[: self._n]
+
+    def _stage(self, t: ArrayLike, q: ArrayLike):
+        """
+        Validate new samples, write them past the accepted ones and return
+        them with the running sums that include them. Nothing is committed:
+        the buffer slots past `_n` are scratch until `_commit`.
+        """
+        tt, qq = _as_array(t), _as_array(q)
+        if tt.shape != qq.shape:
+            raise ValueError("t and q must have the same shape")
+
+        keep = np.isfinite(tt) & np.isfinite(qq) & (qq > 0)
+        if self.xi != 0:
+            keep &= tt >= self.xi
+        tt, qq = tt[keep] - self.xi, qq[keep]
+
+        need = self._n + tt.size
+        if need < 3:
+            raise ValueError("Not enough valid (t, q) points to fit (need >= 3).")
+        if need > self._t.size:
+            size = max(need, 2 * self._t.size)
+            self._t = np.concatenate([self.t, np.empty(size - self._n)])
+            self._q = np.concatenate([self.q, np.empty(size - self._n)])
+        self._t[self._n:need] = tt
+        self._q[self._n:need] = qq
+
+        stats = self._stats + LinearStats.from_samples(tt, self.arps.model.linearize(qq))
+        rates = self._rates + LinearStats.from_samples(tt, qq)
+        return tt, qq, stats, rates
+
+    def _commit(self, n: int, stats: LinearStats, rates: LinearStats) -> None:
+        self._n, self._stats, self._rates = n, stats, rates
+
+    def _linear(self, stats: LinearStats) -> NDArray[np.float64]:
+        di, qi, _, _ = self.arps._invert_stats(stats)
+        return np.array([di, qi], dtype=float)
+
+    # ---- fitting --------------------------------------------------------------
+    @classmethod
+    def from_result(
+        cls,
+        arps: Arps,
+        t: ArrayLike,
+        q: ArrayLike,
+        result: FitResult,
+        *,
+        rtol: float = 1e-3,
+    ) -> "OnlineFit":
+        """Seed the running statistics from data that `result` was already fitted to."""
+        online = cls(arps, xi=result.xi, rtol=rtol)
+        tt, _, stats, rates = online._stage(t, q)
+        online._commit(tt.size, stats, rates)
+        online.result = result
+        online._anchor = online._linear(stats)
+        online._ssres = float(np.sum((online.q - arps._forward(online.t, result.di, result.qi)) ** 2))
+        return online
+
+    def update(self, t: ArrayLike, q: ArrayLike, *, rtol: Optional[float] = None) -> FitResult:
+        """
+        Add samples and return the refreshed fit.
+
+        Non-finite and non-positive rates are ignored, as are samples before
+        a non-zero `xi`. `rtol` replaces the polish tolerance from this update
+        on. The update is all or nothing: if it raises (too few points, a
+        failed polish), the samples, sums, fit and `rtol` are left as they were.
+        """
+        tt, qq, stats, rates = self._stage(t, q)
+        n = self._n + tt.size
+        t_all, q_all = self._t[:n], self._q[:n]
+        rtol = self.rtol if rtol is None else float(rtol)
+        linear = self._linear(stats)
+
+        polished = self.result is None or not np.all(
+            np.abs(linear - self._anchor) <= rtol * np.abs(self._anchor)
+        )
+        if polished:
+            p0 = linear if self.result is None else (self.result.di, self.result.qi)
+            result = self.arps._refine(t_all, q_all, p0, xi=self.xi, linear=stats.result())
+            anchor = linear
+            ssres = float(np.sum((q_all - self.arps._forward(t_all, result.di, result.qi)) ** 2))
+        else:
+            # keep the polished parameters, refresh n, R² and the linear estimate
+            fit, anchor = self.result, self._anchor
+            ssres = self._ssres + float(np.sum((qq - self.arps._forward(tt, fit.di, fit.qi)) ** 2))
+            sstot = float(rates._Syy)
+            result = replace(
+                fit,
+                n=n,
+                r2=1.0 - ssres / sstot if sstot > 0 else float("nan"),
+                linear=stats.result(),
+            )
+
+        # the refit succeeded: commit the new samples and state together
+        self._commit(n, stats, rates)
+        self.result, self.polished, self._anchor, self._ssres, self.rtol = result, polished, anchor, ssres, rtol
+        return self.result
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._robust import _group_mad
+
+
+def quality_mask(
+    x: ArrayLike,
+    q: ArrayLike,
+    *,
+    wells: Optional[ArrayLike] = None,
+    window: Optional[int] = 7,
+    threshold: float = 3.5,
+    min_scale: float = 0.05,
+    min_rate: float = 0.0,
+    after_shutin: int = 0,
+    uptime: Optional[ArrayLike] = None,
+    min_uptime: Optional[float] = None,
+) -> NDArray[np.bool_]:
+    """
+    Rows of a long-format production table that are fit for decline analysis.
+
+    The table is sorted once by (well, x) and every test runs on all wells at
+    once; the mask is returned in the input row order, ready for the `mask`
+    argument of `DCA.fit` and `DCA.fit_many`.
+
+    Parameters
+    ----------
+    x : array_like
+        Time (days or datetime64) of every row.
+    q : array_like
+        Rate of every row.
+    wells : array_like, optional
+        Well id of every row (default: one well).
+    window : int or None, default 7
+        Samples in the rolling median of the log rate (Hampel filter):
+        centered, and shifted inward at the ends of every well so the first
+        and last rows are checked too. The window's median slope is taken
+        out first, so a steep decline is not an outlier. None disables
+        outlier flags.
+    threshold : float, default 3.5
+        Rows whose log rate departs from the rolling median by more than
+        `threshold` robust scales (the well's MAD of those departures) are
+        outliers: allocation spikes, test rates, partial-day dips.
+    min_scale : float, default 0.05
+        Smallest robust scale in log rate (about 5 %), so near noise-free
+        wells only flag real jumps.
+    min_rate : float, default 0.0
+        Rates at or below it are shut-ins.
+    after_shutin : int, default 0
+        Rows dropped after every shut-in run (flush production on restart).
+    uptime, min_uptime : optional
+        Producing fraction of every row and the smallest one kept.
+
+    Rows with missing rates are never kept.
+    """
+    xx = np.ravel(np.asarray(x))
+    qq = np.ravel(np.asarray(q, dtype=float))
+    if xx.size != qq.size:
+        raise ValueError("x and q must have the same length.")
+    if wells is None:
+        codes = np.zeros(qq.size, dtype=np.intp)
+    else:
+        ww = np.ravel(np.asarray(wells))
+        if ww.size != qq.size:
+            raise ValueError("wells must have one value per row.")
+        codes = np.unique(ww, return_inverse=True)[1].astype(np.intp)
+    ngroups = int(codes.max()) + 1 if codes.size else 0
+
+    # one sort by (well, x); group i spans first[i]:end[i] of the sorted rows
+    order = np.lexsort((xx, codes))
+    cs, qs = codes[order], qq[order]
+    counts = np.bincount(cs, minlength=ngroups)
+    end = np.cumsum(counts)
+    first = end - counts
+
+    finite = np.isfinite(qs)
+    shut = finite & ~(qs > min_rate)
+    keep = finite & ~shut
+
+    if after_shutin > 0:
+        # rows since the last shut-in of the same well
+        idx = np.arange(qs.size)
+        last = np.maximum.accumulate(np.where(shut, idx, -1))
+        since = np.where(last >= first[cs], idx - last, np.iinfo(np.intp).max)
+        keep &= since > after_shutin
+
+    if window is not None and window > 1:
+        xs = xx[order]
+        if np.issubdtype(xs.dtype, np.datetime64):
+            xs = (xs - xs.min()) / np.timedelta64(1, "D")
+        xs = np.asarray(xs, dtype=float)
+        keep &= ~_outliers(cs, xs, np.where(keep, qs, np.nan), first, end, ngroups, int(window), threshold, min_scale)
+
+    if min_uptime is not None:
+        if uptime is None:
+            raise ValueError("min_uptime requires uptime.")
+        up = np.ravel(np.asarray(uptime, dtype=float))
+        if up.size != qq.size:
+            raise ValueError("uptime must have one value per row.")
+        keep &= np.nan_to_num(up[order], nan=0.0) >= min_uptime
+
+    out = np.empty(qq.size, dtype=bool)
+    out[order] = keep
+    return out
+
+
+def _outliers(codes, x, q, first, end, ngroups, window, threshold, min_scale) -> NDArray[np.bool_]:
+    """Hampel flags of sorted rows from one (n_rows, window) gather of the log rates (NaN rows are ignored)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = np.log(q)
+    # full-width windows, centered where possible and shifted inward at the
+    # ends of every well, so the first and last rows are checked as well
+    idx = np.arange(y.size)
+    size = np.minimum(window, (end - first)[codes])
+    lo = np.clip(idx - window // 2, first[codes], end[codes] - size)
+    j = lo[:, None] + np.arange(window)
+    inside = j < (lo + size)[:, None]
+    j = np.minimum(j, max(y.size - 1, 0))
+    yw = np.where(inside, y[j], np.nan)
+    xw = x[j]
+
+    # every row of the window projected to the center along the window's
+    # median log-rate slope: a steady decline predicts itself even where
+    # the window is one-sided
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = _nanmedian(np.diff(yw, axis=1) / np.diff(xw, axis=1))
+        pred = yw + np.nan_to_num(slope)[:, None] * (x[:, None] - xw)
+        med = _nanmedian(pred)
+    r = y - med
+    ok = np.isfinite(r)
+    scale = np.full(ngroups, np.nan)
+    if np.any(ok):
+        scale = _group_mad(codes[ok], r[ok], ngroups)
+    scale = np.fmax(scale, min_scale)[codes]
+    return ok & (np.abs(r) > threshold * scale)
+
+
+def _nanmedian(a: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Row medians ignoring NaN (NaN for all-NaN rows), without the all-NaN warning."""
+    srt = np.sort(a, axis=1)  # NaN sort last
+    n = np.sum(np.isfinite(a), axis=1)
+    rows = np.arange(a.shape[0])
+    lo = srt[rows, np.maximum(n - 1, 0) // 2]
+    hi = srt[rows, n // 2 - (n == 0)]
+    return np.where(n > 0, 0.5 * (lo + hi), np.nan)
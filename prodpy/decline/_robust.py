@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ._linstats import LinearStats
+
+# 95% efficiency at the normal distribution
+_TUNING = {"huber": 1.345, "tukey": 4.685}
+
+# MAD of a standard normal sample
+_MAD_SCALE = 0.6744897501960817
+
+
+def _huber(u: NDArray[np.float64], c: float) -> NDArray[np.float64]:
+    """Huber weights: 1 inside [-c, c], c/|u| outside."""
+    a = np.abs(u)
+    with np.errstate(divide="ignore"):
+        return np.where(a <= c, 1.0, c / a)
+
+
+def _tukey(u: NDArray[np.float64], c: float) -> NDArray[np.float64]:
+    """Tukey biweight: (1 - (u/c)²)² inside [-c, c], 0 outside."""
+    return np.where(np.abs(u) < c, (1.0 - (u / c) ** 2) ** 2, 0.0)
+
+
+WEIGHTS: Dict[str, Callable[[NDArray[np.float64], float], NDArray[np.float64]]] = {
+    "huber": _huber,
+    "tukey": _tukey,
+}
+
+
+def _check_loss(loss: str) -> str:
+    loss = loss.lower()
+    if loss not in WEIGHTS:
+        raise ValueError(f"robust must be one of {tuple(WEIGHTS)}, got {loss!r}.")
+    return loss
+
+
+def _group_mad(codes: NDArray[np.intp], r: NDArray[np.float64], ngroups: int) -> NDArray[np.float64]:
+    """Per-group residual scale MAD / 0.6745 from one sort of (group, |r|)."""
+    a = np.abs(r)
+    order = np.lexsort((a, codes))
+    counts = np.bincount(codes, minlength=ngroups)
+    first = np.cumsum(counts) - counts
+    lo = first + np.maximum(counts - 1, 0) // 2
+    hi = first + counts // 2
+    srt = a[order] if a.size else np.zeros(1)
+    with np.errstate(invalid="ignore"):
+        med = 0.5 * (srt[np.minimum(lo, srt.size - 1)] + srt[np.minimum(hi, srt.size - 1)])
+    return np.where(counts > 0, med / _MAD_SCALE, np.nan)
+
+
+def _irls(
+    codes: NDArray[np.intp],
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    ngroups: int,
+    *,
+    loss: str,
+    c: Optional[float] = None,
+    w0: Optional[NDArray[np.float64]] = None,
+    maxiter: int = 50,
+    tol: float = 1e-6,
+) -> Tuple[LinearStats, NDArray[np.float64]]:
+    """
+    Robust regressions y = c + m x of every group by iteratively reweighted
+    least squares.
+
+    Each iteration is one weighted segmented regression, the residuals, one
+    per-group MAD scale and the weights, all as whole-array operations over
+    every group at once. Iterations stop when no weight moves by more than
+    `tol`. Tukey's redescending weights start from the Huber solution.
+    Prior weights `w0` (time decay, uptime) multiply the robust ones.
+    Returns the final weighted statistics and sample weights.
+    """
+    loss = _check_loss(loss)
+    weight, c = WEIGHTS[loss], _TUNING[loss] if c is None else float(c)
+    w0 = np.ones_like(y) if w0 is None else w0
+
+    w = w0
+    if loss == "tukey":
+        w = _irls(codes, x, y, ngroups, loss="huber", w0=w0, maxiter=maxiter, tol=tol)[1]
+    for _ in range(maxiter):
+        stats = LinearStats.from_groups(codes, x, y, ngroups, w)
+        r = y - (stats.intercept[codes] + stats.slope[codes] * x)
+        s = _group_mad(codes, r, ngroups)[codes]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            u = np.where(s > 0, r / s, 0.0)
+        w_new = w0 * np.where(np.isfinite(u), weight(u, c), 0.0)
+        done = np.max(np.abs(w_new - w), initial=0.0) <= tol
+        w = w_new
+        if done:
+            break
+    return LinearStats.from_groups(codes, x, y, ngroups, w), w
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._arps import FitResult
+from ._batch import ArpsBatch
+from ._table import FitTable
+
+
+def _as_array(x: ArrayLike) -> NDArray[np.float64]:
+    return np.asarray(x, dtype=float)
+
+
+@dataclass(frozen=True)
+class Sampler:
+    """
+    Monte Carlo forecasts from the parameter covariance of a fit.
+
+    Samples of (di, qi) — and b for free-b fits — are drawn jointly from a
+    multivariate normal around the fitted values using `FitResult.cov`, so
+    the correlation between parameters is preserved. Samples with di <= 0,
+    qi <= 0 or b outside [0, 1] are redrawn, so the draws follow the normal
+    truncated to the valid parameter region (no mass piles up at the b
+    bounds).
+
+    All samples of one draw are evaluated together as an `ArpsBatch`:
+
+    >>> s = Sampler(fit)
+    >>> q = s.run(t, 1000)                       # (1000, t.size)
+    >>> p10, p50, p90 = s.percentiles(t, 10_000)  # high, mid, low case
+
+    Percentiles follow the exceedance convention of `Arps.simulate`: P10 is
+    the value exceeded by 10 % of the samples (the high case), P90 the low
+    case.
+
+    A `FitTable` samples every well at once, from the covariance stored in
+    its rows (`FitTable.covariance`): `size` samples are drawn per well in
+    one vectorized pass and results gain a leading well axis.
+
+    >>> bands = Sampler(table[table.valid]).percentiles(t, 1000)  # (n_wells, 3, t.size)
+
+    For large runs `chunks` and `percentiles` stream the evaluation so only
+    `chunksize` samples (or time steps) are held in memory at once.
+    """
+
+    result: Union[FitResult, FitTable]
+
+    # ---- parameter distribution ---------------------------------------------
+    @property
+    def _table(self) -> bool:
+        return isinstance(self.result, FitTable)
+
+    @property
+    def mean(self) -> NDArray[np.float64]:
+        """Fitted (di, qi) or (di, qi, b); one row per well for a table."""
+        r = self.result
+        if self._table:
+            return np.column_stack([r.di, r.qi, r.b])[:, : self._nparams]
+        return np.array([r.di, r.qi, r.b][: self._nparams], dtype=float)
+
+    @property
+    def _nparams(self) -> int:
+        if self._table:
+            return 3 if np.any(np.isfinite(self.result.b_error)) else 2
+        cov = self.result.cov
+        if cov is not None:
+            return np.shape(cov)[0]
+        return 3 if np.isfinite(self.result.b_error) else 2
+
+    @property
+    def cov(self) -> NDArray[np.float64]:
+        """
+        Parameter covariance; falls back to the diagonal of the std errors.
+        Shape (k, k), or (n_wells, k, k) for a table.
+        """
+        r = self.result
+        if self._table:
+            cov = r.covariance()
+        elif r.cov is not None:
+            cov = _as_array(r.cov)
+        else:
+            cov = np.diag(np.array([r.di_error, r.qi_error, r.b_error][: self._nparams]) ** 2)
+        if not np.all(np.isfinite(cov)):
+            raise ValueError("Fit covariance is not finite; cannot sample parameters.")
+        return cov
+
+    def _factor(self) -> NDArray[np.float64]:
+        cov = self.cov
+        try:
+            return np.linalg.cholesky(cov)
+        except np.linalg.LinAlgError:
+            # positive semi-definite covariance: use the symmetric square root
+            w, v = np.linalg.eigh(cov)
+            return v * np.sqrt(np.clip(w, 0.0, None))[..., None, :]
+
+    def draw(self, size: int, *, rng: Optional[np.random.Generator | int] = None) -> ArpsBatch:
+        """
+        Draw `size` parameter samples as one `ArpsBatch`. For a table the
+        batch holds `size` samples per well, well-major (row r is a sample
+        of well r // size).
+        """
+        rng = np.random.default_rng(rng)
+        mean, L = np.atleast_2d(self.mean), self._factor().reshape(-1, self._nparams, self._nparams)
+        nwells, k = mean.shape
+
+        well = np.repeat(np.arange(nwells), size)
+        params = np.empty((well.size, k))
+        todo = np.arange(well.size)
+        for _ in range(100):
+            w = well[todo]
+            z = rng.standard_normal((todo.size, k))
+            # mean + L z per sample, one column at a time (no (n, k, k) gather)
+            for j in range(k):
+                params[todo, j] = mean[w, j] + np.einsum("ni,ni->n", z, L[w, j])
+            bad = (params[todo, 0] <= 0) | (params[todo, 1] <= 0)
+            if k == 3:
+                bad |= ~((params[todo, 2] >= 0) & (params[todo, 2] <= 1))
+            todo = todo[bad]
+            if todo.size == 0:
+                break
+        else:
+            raise ValueError("Fit uncertainty is too wide to draw positive di and qi (and b in [0, 1]) samples.")
+
+        r = self.result
+        b = params[:, 2] if k == 3 else np.repeat(np.atleast_1d(r.b), size)
+        xi, dmin = (np.repeat(np.atleast_1d(v), size) for v in (r.xi, r.dmin))
+        return ArpsBatch(params[:, 0], params[:, 1], b=b, xi=xi, dmin=dmin)
+
+    # ---- forecasts ------------------------------------------------------------
+    def run(
+        self,
+        t: ArrayLike,
+        size: int,
+        *,
+        cum: bool = False,
+        rng: Optional[np.random.Generator | int] = None,
+    ) -> NDArray[np.float64]:
+        """
+        Rate (or cumulative with `cum=True`) of `size` samples, shape
+        (size, n_times), or (n_wells, size, n_times) for a table.
+        """
+        batch = self.draw(size, rng=rng)
+        values = batch.N(t) if cum else batch.q(t)
+        return values.reshape(-1, size, values.shape[-1]) if self._table else values
+
+    def chunks(
+        self,
+        t: ArrayLike,
+        size: int,
+        *,
+        chunksize: int = 1000,
+        rng: Optional[np.random.Generator | int] = None,
+    ) -> Iterator[Tuple[NDArray[np.float64], NDArray[np.float64]]]:
+        """
+        Stream (q, N) blocks of at most `chunksize` samples each (rows of
+        `draw`, well-major for a table).
+
+        Parameters are drawn once up front (a few floats per sample); only
+        the evaluated block is materialized per iteration.
+        """
+        batch = self.draw(size, rng=rng)
+        for start in range(0, batch.size, chunksize):
+            part = batch.take(slice(start, start + chunksize))
+            yield part.q(t), part.N(t)
+
+    def percentiles(
+        self,
+        t: ArrayLike,
+        size: int,
+        prc: Sequence[float] = (10.0, 50.0, 90.0),
+        *,
+        cum: bool = False,
+        chunksize: int = 256,
+        rng: Optional[np.random.Generator | int] = None,
+    ) -> NDArray[np.float64]:
+        """
+        Percentile bands across `size` samples, shape (len(prc), n_times),
+        or (n_wells, len(prc), n_times) for a table.
+
+        `prc` are exceedance percentiles (P10 >= P50 >= P90, as in
+        `Arps.simulate`). Time steps are evaluated in blocks of `chunksize`,
+        so memory stays at n_wells × size × chunksize values however long
+        the grid is.
+        """
+        tt = np.ravel(_as_array(t))
+        exceed = 100.0 - np.asarray(prc, dtype=float)  # exceedance -> non-exceedance
+        batch = self.draw(size, rng=rng)
+        nwells = batch.size // size
+        out = np.empty((len(prc), nwells, tt.size))
+        for start in range(0, tt.size, chunksize):
+            block = tt[start:start + chunksize]
+            values = batch.N(block) if cum else batch.q(block)
+            with warnings.catch_warnings():
+                # times before xi are NaN for every sample
+                warnings.simplefilter("ignore", RuntimeWarning)
+                out[:, :, start:start + block.size] = np.nanpercentile(
+                    values.reshape(nwells, size, block.size), exceed, axis=1
+                )
+        return out.transpose(1, 0, 2) if self._table else out[:, 0]
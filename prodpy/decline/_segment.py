@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._linstats import LinearStats
+from ._select import _criteria
+from ._table import FitRow, FitTable
+
+
+@dataclass(frozen=True)
+class Segments:
+    """
+    Piecewise decline fit: one Arps model per segment of the history.
+
+    Segment i covers the samples ``bounds[i]:bounds[i + 1]`` of the
+    time-sorted data and is described by row i of `fits`, whose `xi` is the
+    segment's start time. The last segment is open-ended and drives the
+    forecast.
+
+    `sse` and `score` hold, for every candidate number of segments
+    1 … max_segments, the log-rate residual sum of squares of the optimal
+    partition and its information criterion; the partition kept is the
+    minimum of `score`.
+    """
+
+    fits: FitTable
+    bounds: NDArray[np.intp]
+    sse: NDArray[np.float64]
+    score: NDArray[np.float64]
+    criterion: str = "bic"
+
+    def __len__(self) -> int:
+        return len(self.fits)
+
+    @property
+    def start(self) -> NDArray[np.float64]:
+        """Start time of every segment."""
+        return self.fits.xi
+
+    @property
+    def last(self) -> FitRow:
+        """Fit of the last (forecasting) segment."""
+        return self.fits[len(self) - 1]
+
+    def run(self, x: ArrayLike, *, cum: bool = False) -> NDArray[np.float64]:
+        """
+        Piecewise rate (or cumulative since the first segment start) at `x`.
+
+        Every time is evaluated with the segment it falls in; times before
+        the first segment, and segments that could not be fitted, give NaN.
+        """
+        from ._arps import Arps
+
+        xx = np.asarray(x, dtype=float)
+        out = np.full(xx.shape, np.nan)
+        which = np.searchsorted(self.start, xx, side="right") - 1
+        base = 0.0
+        for i, row in enumerate(self.fits):
+            if not self.fits.valid[i]:
+                base = np.nan
+                continue
+            arps = Arps.from_result(row)
+            inside = which == i
+            with np.errstate(over="ignore", invalid="ignore"):
+                out[inside] = arps.run(xx[inside], xi=row.xi, cum=cum) + (base if cum else 0.0)
+            if cum and i + 1 < len(self):
+                base = base + float(arps.run([self.start[i + 1]], xi=row.xi, cum=True)[0])
+        return out
+
+
+def _partition(
+    arps,
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    *,
+    max_segments: int,
+    min_size: int,
+    criterion: str,
+    max_candidates: Optional[int] = None,
+) -> Segments:
+    """
+    Optimal partition of time-sorted (x, y) into 1 … max_segments segments.
+
+    The cost of a segment is the residual sum of squares of its linearized
+    regression, read off one set of prefix sums, so any segment costs O(1).
+    Change points are restricted to a bounded candidate set: every sample
+    is scored in O(n) by the drop in cost from splitting its neighbourhood
+    in two (at three window widths), and at most L = `max_candidates` of
+    the strongest local maxima (default ``16 * max_segments``) are kept.
+    Dynamic programming over the L candidates then costs
+    O(L² · max_segments), so the whole search is O(n + L² · max_segments)
+    instead of O(n² · max_segments); histories with at most L admissible
+    starts keep them all and are solved exactly. The optimal partitions of
+    all segment counts are then compared by `criterion`.
+    """
+    if max_segments < 1:
+        raise ValueError("max_segments must be >= 1.")
+    if min_size < 3:
+        raise ValueError("min_size must be >= 3.")
+    if criterion not in {"aic", "bic"}:
+        raise ValueError("criterion must be 'aic' or 'bic'.")
+
+    n = x.size
+    if n < min_size:
+        raise ValueError(f"Not enough valid (t, q) points to fit (need >= {min_size}).")
+    K = min(int(max_segments), n // min_size)
+    L = 16 * int(max_segments) if max_candidates is None else int(max_candidates)
+
+    P = LinearStats.prefix(x - x.mean(), arps.model.linearize(y))
+
+    def cost(i, j):
+        c = (P.take(j) - P.take(i)).sse
+        return np.where(np.isfinite(c), c, np.inf)
+
+    # candidate segment bounds: 0, the screened change points and n
+    cand = np.concatenate(([0], _candidates(cost, n, min_size, L), [n]))
+
+    # F[m, e]: best cost of the samples before cand[e] in m segments;
+    # arg[m, e]: the candidate where its last segment starts
+    F = np.full((K + 1, cand.size), np.inf)
+    F[0, 0] = 0.0
+    arg = np.zeros((K + 1, cand.size), dtype=np.intp)
+    for e in range(1, cand.size):
+        i = np.flatnonzero(cand[e] - cand[:e] >= min_size)
+        if i.size == 0:
+            continue
+        total = F[:K, i] + cost(cand[i], cand[e])
+        best = np.argmin(total, axis=1)
+        F[1:, e] = total[np.arange(K), best]
+        arg[1:, e] = cand[i[best]]
+
+    # score every segment count on the log-rate residuals of its partition,
+    # which unlike the linearized ones are comparable across segments
+    last = cand.size - 1
+    m = np.flatnonzero(np.isfinite(F[1:, last])) + 1
+    parts = [_backtrack(arg, cand, last, k) for k in m]
+    fits = [_fit_partition(arps, x, y, bounds) for bounds in parts]
+    sse = np.array([_log_sse(arps, x, y, bounds, fit) for bounds, fit in zip(parts, fits)])
+    aic, bic = _criteria(sse, n, 3 * m - 1)  # per segment di, qi and its start
+    score = aic if criterion == "aic" else bic
+    best = int(np.argmin(np.where(np.isfinite(score), score, np.inf)))
+    return Segments(fits=fits[best], bounds=parts[best], sse=sse, score=score, criterion=criterion)
+
+
+def _candidates(cost, n: int, min_size: int, limit: int) -> NDArray[np.intp]:
+    """
+    Admissible change points (segments of at least `min_size` on both
+    sides), at most `limit` of them: all if they fit, else the strongest
+    local maxima of the split gain C(c-h, c+h) - C(c-h, c) - C(c, c+h) at
+    the scales h = min_size, 2 min_size and 4 min_size, an equal share each.
+    """
+    c = np.arange(min_size, n - min_size + 1)
+    if c.size <= limit:
+        return c
+    share = -(-limit // 3)
+    r = max(min_size // 2, 1)
+    keep = []
+    for h in (min_size, 2 * min_size, 4 * min_size):
+        a, b = np.maximum(c - h, 0), np.minimum(c + h, n)
+        gain = cost(a, b) - cost(a, c) - cost(c, b)
+        gain = np.where(np.isfinite(gain), gain, -np.inf)
+        # non-maximum suppression over +-r, then the strongest peaks
+        pad = np.pad(gain, r, constant_values=-np.inf)
+        window = np.lib.stride_tricks.sliding_window_view(pad, 2 * r + 1)
+        peak = gain >= window.max(axis=1)
+        peaks = np.flatnonzero(peak & np.isfinite(gain))
+        keep.append(peaks[np.argsort(-gain[peaks], kind="stable")[:share]])
+    return c[np.unique(np.concatenate(keep))]
+
+
+def _backtrack(arg: NDArray[np.intp], cand: NDArray[np.intp], last: int, nseg: int) -> NDArray[np.intp]:
+    """Bounds of the optimal `nseg`-segment partition ending at candidate `last`."""
+    bounds = [int(cand[last])]
+    e = last
+    for k in range(nseg, 0, -1):
+        bounds.append(int(arg[k, e]))
+        e = int(np.searchsorted(cand, bounds[-1]))
+    return np.asarray(bounds[::-1], dtype=np.intp)
+
+
+def _codes(bounds: NDArray[np.intp]) -> NDArray[np.intp]:
+    return np.repeat(np.arange(bounds.size - 1), np.diff(bounds))
+
+
+def _fit_partition(arps, x, y, bounds) -> FitTable:
+    """Linearized fit of every segment, with `xi` at its start."""
+    codes = _codes(bounds)
+    start = x[bounds[:-1]]
+    return arps._fit_groups(np.arange(bounds.size - 1), codes, x - start[codes], y, start)
+
+
+def _log_sse(arps, x, y, bounds, fits: FitTable) -> float:
+    """Sum of squared log-rate residuals of a piecewise fit (inf if a segment failed)."""
+    codes = _codes(bounds)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        ycal = arps._forward(x - fits.xi[codes], fits.di[codes], fits.qi[codes])
+        sse = float(np.sum((np.log(y) - np.log(ycal)) ** 2))
+    return sse if np.isfinite(sse) else np.inf
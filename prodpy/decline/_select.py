@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+# candidate families compared by `Arps.select` / `Arps.select_batch`
+MODELS: Tuple[str, ...] = ("exponential", "hyperbolic", "harmonic", "free")
+
+
+def _criteria(sse, n, k) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Gaussian AIC and BIC from the rate-space residual sum of squares."""
+    sse, n, k = np.asarray(sse, dtype=float), np.asarray(n, dtype=float), np.asarray(k, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        loglik = n * np.log(sse / n)
+        return loglik + 2.0 * k, loglik + k * np.log(n)
+
+
+@dataclass(frozen=True)
+class Selection:
+    """
+    Comparison of decline families fitted to the same data.
+
+    `models` names the candidates: 'exponential', 'hyperbolic' (fixed b),
+    'harmonic' and 'free' (hyperbolic with fitted b). The score arrays have
+    the candidates on their last axis: shape (n_models,) for one well, or
+    (n_wells, n_models) for `Arps.select_batch`. A candidate that could not
+    be fitted scores NaN.
+
+    AIC = n ln(SSE/n) + 2k and BIC = n ln(SSE/n) + k ln(n), with SSE the
+    rate-space residual sum of squares and k the number of fitted parameters.
+    """
+
+    models: Tuple[str, ...]
+    fits: Dict[str, object]  # FitResult (single well) or FitTable (batch)
+    n: NDArray[np.int64]
+    sse: NDArray[np.float64]
+    aic: NDArray[np.float64]
+    bic: NDArray[np.float64]
+    r2: NDArray[np.float64]
+    criterion: str = "bic"
+
+    def __post_init__(self):
+        if self.criterion not in {"aic", "bic"}:
+            raise ValueError("criterion must be 'aic' or 'bic'.")
+
+    @property
+    def best(self):
+        """Winning model name (array of names per well for batches); None/'' if nothing fitted."""
+        score = getattr(self, self.criterion)
+        score = np.where(np.isfinite(score), score, np.inf)
+        idx = np.argmin(score, axis=-1)
+        found = np.take_along_axis(np.isfinite(score), np.expand_dims(idx, -1), axis=-1)[..., 0]
+        names = np.asarray(self.models)[idx]
+        if score.ndim == 1:
+            return str(names) if found else None
+        return np.where(found, names, "")
+
+    def fit(self, model: str | None = None):
+        """Fit of `model`, by default the winner (single well only)."""
+        return self.fits[self.best if model is None else model]
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, fields
+from typing import Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._linstats import LinearFit
+
+_INT_COLUMNS = {"n"}
+_STR_COLUMNS = {"error"}
+_COV_COLUMNS = ("cov_di_qi", "cov_di_b", "cov_qi_b")
+
+
+@dataclass(frozen=True)
+class FitTable:
+    """
+    Columnar store of decline fits: one NumPy array per `FitResult` field.
+
+    A table holds one row per fit (well, scenario, vintage, ...). The
+    linearized regression is kept as its `slope`, `intercept` and `rvalue`
+    columns instead of one SciPy result object per row, so millions of fits
+    cost a few arrays and serialize as such.
+
+    Rows are read through `FitRow` views (``table[i]``), which expose the
+    attributes of `FitResult` without copying. Integer arrays, slices and
+    boolean masks select sub-tables (``table[table.valid]``).
+
+    Rows that could not be fitted (fewer than 3 usable points or a
+    non-declining trend) carry NaN parameters; see `valid`. Fits that
+    raised (e.g. in `DCA.fit_many`) also keep the message in `error`.
+
+    The off-diagonal terms of the non-linear fit covariance are kept as the
+    `cov_di_qi`, `cov_di_b` and `cov_qi_b` columns (NaN when not estimated,
+    e.g. for linearized fits), so a whole table can be sampled by `Sampler`.
+    """
+
+    well: NDArray
+    b: NDArray[np.float64]
+    di: NDArray[np.float64]
+    qi: NDArray[np.float64]
+    xi: NDArray[np.float64]
+    n: NDArray[np.int64]
+    r2: NDArray[np.float64]
+    di_error: NDArray[np.float64]
+    qi_error: NDArray[np.float64]
+    slope: NDArray[np.float64]
+    intercept: NDArray[np.float64]
+    rvalue: NDArray[np.float64]
+    b_error: Optional[NDArray[np.float64]] = None  # NaN unless b was fitted
+    dmin: Optional[NDArray[np.float64]] = None  # terminal decline, 0 unless modified hyperbolic
+    cov_di_qi: Optional[NDArray[np.float64]] = None  # NaN unless the covariance was estimated
+    cov_di_b: Optional[NDArray[np.float64]] = None
+    cov_qi_b: Optional[NDArray[np.float64]] = None
+    error: Optional[NDArray[np.str_]] = None  # "" unless the fit raised
+
+    def __post_init__(self):
+        size = np.size(self.di)
+        for f in ("b_error",) + _COV_COLUMNS:
+            if getattr(self, f) is None:
+                object.__setattr__(self, f, np.full(size, np.nan))
+        if self.dmin is None:
+            object.__setattr__(self, "dmin", np.zeros(size))
+        if self.error is None:
+            object.__setattr__(self, "error", np.full(size, "", dtype=str))
+        for f in self.columns():
+            dtype = _dtype(f)
+            value = np.atleast_1d(np.asarray(getattr(self, f), dtype=dtype))
+            if value.shape != (size,):
+                raise ValueError(f"column {f!r} has shape {value.shape}, expected ({size},).")
+            object.__setattr__(self, f, value)
+
+    @classmethod
+    def columns(cls) -> tuple:
+        """Column names, in storage order."""
+        return tuple(f.name for f in fields(cls))
+
+    # ---- construction -------------------------------------------------------
+    @classmethod
+    def empty(cls) -> "FitTable":
+        """Table without rows."""
+        return cls(**{f: np.empty(0, dtype=_dtype(f) or float) for f in cls.columns()})
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Sequence,
+        well: Optional[ArrayLike] = None,
+        error: Optional[Sequence[str]] = None,
+    ) -> "FitTable":
+        """
+        Collect `FitResult` records (or `FitRow` views) into a table.
+
+        `well` labels the rows; it defaults to their position. `error`
+        holds one message per row ("" for fits that succeeded); None
+        entries in `results` become rows of NaN parameters.
+        """
+        results = list(results)
+        if well is None:
+            well = np.arange(len(results))
+        if not results:
+            return cls.empty()
+
+        def column(f):
+            missing = {"n": 0, "dmin": 0.0}.get(f, np.nan)
+            return [missing if r is None else getattr(r, f) for r in results]
+
+        nan = LinearFit(*(5 * [np.nan]))
+        linear = [nan if r is None else r.linear for r in results]
+
+        def covariance(i, j):
+            # entry (i, j) of each fit's (di, qi[, b]) covariance
+            values = []
+            for r in results:
+                cov = None if r is None else r.cov
+                values.append(cov[i][j] if cov is not None and np.shape(cov)[0] > max(i, j) else np.nan)
+            return values
+        return cls(
+            well=well,
+            b=column("b"),
+            di=column("di"),
+            qi=column("qi"),
+            xi=column("xi"),
+            n=column("n"),
+            r2=column("r2"),
+            di_error=column("di_error"),
+            qi_error=column("qi_error"),
+            slope=[lin.slope for lin in linear],
+            intercept=[lin.intercept for lin in linear],
+            rvalue=[lin.rvalue for lin in linear],
+            b_error=column("b_error"),
+            dmin=column("dmin"),
+            cov_di_qi=covariance(0, 1),
+            cov_di_b=covariance(0, 2),
+            cov_qi_b=covariance(1, 2),
+            error=error,
+        )
+
+    @classmethod
+    def concat(cls, tables: Iterable["FitTable"]) -> "FitTable":
+        """Stack tables row-wise in one copy per column."""
+        tables = list(tables)
+        if not tables:
+            return cls.empty()
+        return cls(**{f: np.concatenate([getattr(t, f) for t in tables]) for f in cls.columns()})
+
+    def append(self, *others: "FitTable") -> "FitTable":
+        """Table with the rows of `others` added at the end (see `concat`)."""
+        return self.concat((self, *others))
+
+    # ---- rows -----------------------------------------------------------------
+    def __len__(self) -> int:
+        return self.di.size
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            i = int(index)
+            if not -len(self) <= i < len(self):
+                raise IndexError("FitTable row index out of range.")
+            return FitRow(self, i % len(self))
+        return self.take(index)
+
+    def __iter__(self) -> Iterator["FitRow"]:
+        return (FitRow(self, i) for i in range(len(self)))
+
+    def take(self, index) -> "FitTable":
+        """Return the rows selected by a slice, an integer array or a boolean mask."""
+        if not isinstance(index, slice):
+            index = np.asarray(index)
+        return FitTable(**{f: getattr(self, f)[index] for f in self.columns()})
+
+    def filter(self, mask: Optional[ArrayLike] = None, **equal) -> "FitTable":
+        """
+        Rows where `mask` holds and every ``column=value`` pair matches.
+
+        >>> table.filter(table.r2 > 0.9, b=0.5)
+        """
+        keep = np.ones(len(self), dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+        for name, value in equal.items():
+            if name not in self.columns():
+                raise ValueError(f"Unknown column {name!r}.")
+            keep = keep & (getattr(self, name) == value)
+        return self.take(keep)
+
+    @property
+    def valid(self) -> NDArray[np.bool_]:
+        """Rows with finite, positive di and qi."""
+        return np.isfinite(self.di) & np.isfinite(self.qi) & (self.di > 0) & (self.qi > 0)
+
+    def covariance(self) -> NDArray[np.float64]:
+        """
+        Parameter covariance of every row, shape (n_rows, k, k).
+
+        k is 3 (di, qi, b) if any row fitted b, else 2; rows with a fixed b
+        get zero b variance. Off-diagonal terms that were not estimated are
+        0, leaving the diagonal of the squared standard errors.
+        """
+        k = 3 if np.any(np.isfinite(self.b_error)) else 2
+        err = np.column_stack([self.di_error, self.qi_error, np.nan_to_num(self.b_error, nan=0.0)])[:, :k]
+        cov = np.zeros((len(self), k, k))
+        cov[:, np.arange(k), np.arange(k)] = err ** 2
+        pairs = ((0, 1, self.cov_di_qi), (0, 2, self.cov_di_b), (1, 2, self.cov_qi_b))
+        for i, j, c in pairs[: 1 if k == 2 else 3]:
+            cov[:, i, j] = cov[:, j, i] = np.nan_to_num(c, nan=0.0)
+        return cov
+
+    # ---- conversion -----------------------------------------------------------
+    def to_batch(self):
+        """Fitted models as an `ArpsBatch` (all rows must be valid)."""
+        from ._batch import ArpsBatch
+
+        return ArpsBatch(self.di, self.qi, b=self.b, xi=self.xi, dmin=self.dmin)
+
+    def to_frame(self):
+        """Fit table as a pandas DataFrame indexed by well."""
+        import pandas as pd
+
+        data = {f: getattr(self, f) for f in self.columns() if f != "well"}
+        return pd.DataFrame(data, index=pd.Index(self.well, name="well"))
+
+    @classmethod
+    def from_frame(cls, frame) -> "FitTable":
+        """Inverse of `to_frame`."""
+        data = {f: frame[f].to_numpy() for f in cls.columns() if f != "well" and f in frame}
+        return cls(well=frame.index.to_numpy(), **data)
+
+    # ---- persistence ----------------------------------------------------------
+    def save(self, path: str | os.PathLike) -> None:
+        """
+        Write the table to ``.npz`` (NumPy, no extra dependency) or
+        ``.parquet`` (through pandas; needs pyarrow or fastparquet).
+
+        Any other path is written as ``.npz`` with that suffix appended, as
+        `np.savez` does, and `load` finds it under the same path.
+        """
+        if _suffix(path) == ".parquet":
+            frame = self.to_frame()
+            frame.index = frame.index.astype(str) if frame.index.dtype == object else frame.index
+            frame.to_parquet(path)
+            return
+        well = self.well.astype(str) if self.well.dtype == object else self.well
+        np.savez(_npz(path), **{f: well if f == "well" else getattr(self, f) for f in self.columns()})
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "FitTable":
+        """Read a table written by `save` (given the path passed to `save`)."""
+        if _suffix(path) == ".parquet":
+            import pandas as pd
+
+            return cls.from_frame(pd.read_parquet(path))
+        with np.load(_npz(path), allow_pickle=False) as data:
+            return cls(**{f: data[f] for f in cls.columns() if f in data})
+
+
+def _dtype(column: str):
+    if column in _INT_COLUMNS:
+        return np.int64
+    if column in _STR_COLUMNS:
+        return str
+    return None if column == "well" else float
+
+
+def _suffix(path) -> str:
+    return os.path.splitext(os.fspath(path))[1].lower()
+
+
+def _npz(path) -> str:
+    """Path with the ``.npz`` suffix that `np.savez` appends when it is missing."""
+    path = os.fspath(path)
+    return path if path.endswith(".npz") else path + ".npz"
+
+
+class FitRow:
+    """
+    Read-only view of one `FitTable` row with the attributes of `FitResult`.
+
+    Values are read from the table's columns on access; nothing is copied.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: FitTable, index: int):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str):
+        if name in FitTable.columns():
+            value = getattr(self._table, name)[self._index]
+            if name == "well":
+                return value
+            if name in _STR_COLUMNS:
+                return str(value)
+            return int(value) if name in _INT_COLUMNS else float(value)
+        raise AttributeError(name)
+
+    @property
+    def linear(self) -> LinearFit:
+        """Linearized regression estimates (standard errors are not stored)."""
+        return LinearFit(self.slope, self.intercept, self.rvalue, float("nan"), float("nan"))
+
+    @property
+    def cov(self) -> Optional[NDArray[np.float64]]:
+        """(di, qi[, b]) covariance rebuilt from the row, None if it was not stored."""
+        k = 3 if np.isfinite(self.b_error) else 2
+        if not np.isfinite(self.cov_di_qi) or (k == 3 and not np.isfinite(self.cov_di_b + self.cov_qi_b)):
+            return None
+        return self._table[self._index: self._index + 1].covariance()[0]
+
+    def to_result(self):
+        """Copy of the row as a `FitResult`."""
+        from ._arps import FitResult
+
+        return FitResult(
+            b=self.b,
+            di=self.di,
+            qi=self.qi,
+            xi=self.xi,
+            n=self.n,
+            r2=self.r2,
+            di_error=self.di_error,
+            qi_error=self.qi_error,
+            linear=self.linear,
+            b_error=self.b_error,
+            dmin=self.dmin,
+            cov=self.cov,
+        )
+
+    def __repr__(self) -> str:
+        return f"FitRow(well={self.well!r}, b={self.b:g}, di={self.di:.6g}, qi={self.qi:.6g}, r2={self.r2:.4f})"
+
+
+# result type of `Arps.fit_batch` before the table was generalized
+BatchFit = FitTable
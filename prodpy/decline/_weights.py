@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+def _as_array(x: ArrayLike) -> NDArray[np.float64]:
+    return np.asarray(x, dtype=float)
+
+
+def decay_weights(t: ArrayLike, half_life: float, *, ref: Optional[float] = None) -> NDArray[np.float64]:
+    """
+    Exponential time-decay weights w = 0.5 ** ((ref - t) / half_life).
+
+    Samples `half_life` before `ref` (default: the latest time) count half as
+    much as those at `ref`, so recent production dominates the fit over the
+    early transient.
+    """
+    if not half_life > 0:
+        raise ValueError(f"half_life must be > 0, got {half_life!r}")
+    tt = _as_array(t)
+    ref = float(np.nanmax(tt)) if ref is None else float(ref)
+    return np.exp2(-(ref - tt) / half_life)
+
+
+def uptime_weights(uptime: ArrayLike, *, period: Optional[float] = None) -> NDArray[np.float64]:
+    """
+    Weights from producing time: the uptime fraction, clipped to [0, 1].
+
+    `uptime` is a fraction of the period, or a duration (e.g. hours on)
+    when `period` (e.g. 24 for daily rates) is given. Partially shut-in
+    periods then count in proportion to the time the well produced, and
+    fully shut-in ones not at all. Missing values give 0.
+    """
+    u = _as_array(uptime)
+    if period is not None:
+        if not period > 0:
+            raise ValueError(f"period must be > 0, got {period!r}")
+        u = u / period
+    return np.clip(np.nan_to_num(u, nan=0.0), 0.0, 1.0)
+
+
+def _flatten(w: ArrayLike | Sequence[ArrayLike], wells: Optional[ArrayLike]) -> NDArray[np.float64]:
+    """Weights in the layout of `_group` (one flat column, or one array per well)."""
+    if wells is None:
+        parts = [np.ravel(_as_array(v)) for v in w]
+        return np.concatenate(parts) if parts else np.empty(0)
+    return np.ravel(_as_array(w))
+
+
+def _normalize(codes: NDArray[np.intp], w: NDArray[np.float64], ngroups: int) -> NDArray[np.float64]:
+    """Rescale weights to a mean of one within every group, keeping n = Σ w."""
+    total = np.bincount(codes, weights=w, minlength=ngroups)
+    count = np.bincount(codes, minlength=ngroups)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(total > 0, count / total, 0.0)
+    return w * scale[codes]
+
+
+def _group_decay(codes: NDArray[np.intp], t: NDArray[np.float64], half_life: float, ngroups: int) -> NDArray[np.float64]:
+    """`decay_weights` of every group relative to its own latest sample."""
+    if not half_life > 0:
+        raise ValueError(f"half_life must be > 0, got {half_life!r}")
+    last = np.full(ngroups, -np.inf)
+    np.maximum.at(last, codes, t)
+    return np.exp2(-(last[codes] - t) / half_life)
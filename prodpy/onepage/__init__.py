@@ -1,4 +1,31 @@
-from ._charts import Charts
-from ._spatial import Spatial
-from ._history import History
-from ._forecast import Forecast
\ No newline at end of file
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Chart classes are imported on first access (PEP 562), so matplotlib
+# is only loaded once a chart is used.
+_LAZY = {
+    "Charts": "._charts",
+    "Spatial": "._spatial",
+    "History": "._history",
+    "Forecast": "._forecast",
+}
+
+__all__ = list(_LAZY)
+
+if TYPE_CHECKING:
+    from ._charts import Charts
+    from ._spatial import Spatial
+    from ._history import History
+    from ._forecast import Forecast
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
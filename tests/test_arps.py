@@ -148,4 +148,191 @@ def test_simulate_moves_params(params, tvec):
 
     # monotone with prc
     assert di_lo <= di_hi or (math.isnan(di_lo) and math.isnan(di_hi))
-    assert qi_lo >= qi_hi or (math.isnan(qi_lo) and math.isnan(qi_hi))
\ No newline at end of file
+    assert qi_lo >= qi_hi or (math.isnan(qi_lo) and math.isnan(qi_hi))
+# -----------------------------
+# fit_batch (many wells at once)
+# -----------------------------
+def _field(params, nwells=5, seed=11):
+    rng = np.random.default_rng(seed)
+    ts, qs, truth = [], [], []
+    for i in range(nwells):
+        di = params["di"] * (1.0 + 0.2 * i)
+        qi = params["qi"] * (1.0 - 0.1 * i)
+        t = np.sort(rng.uniform(0.0, 10.0, 40 + 7 * i))
+        q = _model_from_params(dict(params, di=di, qi=qi)).q(t)
+        ts.append(t)
+        qs.append(q * (1.0 + 0.002 * rng.standard_normal(t.size)))
+        truth.append((di, qi))
+    return ts, qs, np.array(truth)
+
+def test_fit_batch_matches_per_well_linregress(params):
+    ts, qs, _ = _field(params)
+    arps = Arps(params["di"], params["qi"], b=params["b"])
+    fits = arps.fit_batch(ts, qs)
+
+    assert len(fits) == len(ts)
+    for i, (t, q) in enumerate(zip(ts, qs)):
+        lr = arps.linregress(t, q)
+        assert_allclose(fits.slope[i], lr.slope, rtol=1e-8)
+        assert_allclose(fits.intercept[i], lr.intercept, rtol=1e-8)
+        assert_allclose(fits.rvalue[i], lr.rvalue, rtol=1e-8)
+
+        di, qi = arps._invert_from_lin(lr)
+        assert_allclose([fits.di[i], fits.qi[i]], [di, qi], rtol=1e-8)
+        assert fits.n[i] == t.size
+        assert fits.r2[i] > 0.99
+
+def test_fit_batch_long_format_equals_ragged(params):
+    ts, qs, truth = _field(params)
+    arps = Arps(params["di"], params["qi"], b=params["b"])
+    ragged = arps.fit_batch(ts, qs)
+
+    wells = np.concatenate([np.full(t.size, f"W{i}") for i, t in enumerate(ts)])
+    order = np.random.default_rng(3).permutation(wells.size)
+    long = arps.fit_batch(np.concatenate(ts)[order], np.concatenate(qs)[order], wells=wells[order])
+
+    assert list(long.well) == [f"W{i}" for i in range(len(ts))]
+    assert_allclose(long.di, ragged.di, rtol=1e-10)
+    assert_allclose(long.qi, ragged.qi, rtol=1e-10)
+    assert_allclose(long.di, truth[:, 0], rtol=3e-2)
+    assert np.all(long.di_error > 0) and np.all(long.qi_error > 0)
+
+def test_fit_batch_flags_unusable_wells(params):
+    arps = Arps(params["di"], params["qi"], b=params["b"])
+    t = np.linspace(0.0, 5.0, 20)
+    good = _model_from_params(params).q(t)
+    fits = arps.fit_batch([t, t[:2], t], [good, good[:2], good[::-1]])
+
+    assert fits.valid.tolist() == [True, False, False]
+    assert np.isnan(fits.di[1:]).all()
+    assert fits.take(fits.valid).to_batch().size == 1
+
+# -----------------------------
+# free-b hyperbolic fit
+# -----------------------------
+@pytest.mark.parametrize("b_true", [0.3, 0.6, 0.9])
+def test_free_b_fit_recovers_exponent(tvec, b_true):
+    rng = np.random.default_rng(5)
+    q = Hyperbolic(b=b_true, di=0.4, qi=150.0).q(tvec) * (1.0 + 0.002 * rng.standard_normal(tvec.shape))
+
+    res = Arps(1.0, 1.0, mode="hyperbolic").fit(tvec, q, free_b=True)
+    assert_allclose(res.b, b_true, atol=3e-2)
+    assert_allclose(res.di, 0.4, rtol=5e-2)
+    assert_allclose(res.qi, 150.0, rtol=1e-2)
+    assert np.isfinite(res.b_error) and res.b_error > 0
+    assert res.r2 > 0.999
+
+def test_scan_b_scores_whole_grid(tvec):
+    q = Hyperbolic(b=0.5, di=0.4, qi=150.0).q(tvec)
+    B, di, qi, sse = Arps.scan_b(tvec, q, Arps._B_GRID)
+
+    assert B.shape == di.shape == qi.shape == sse.shape == (40,)
+    assert_allclose(B[np.argmin(sse)], 0.5)
+    assert_allclose(di[np.argmin(sse)], 0.4, rtol=1e-8)
+
+    with pytest.raises(ValueError):
+        Arps.scan_b(tvec, q, [0.0, 0.5])
+
+# -----------------------------
+# automatic start (xi) search
+# -----------------------------
+def _ramp_then_decline(params, t_start=3.0, seed=0):
+    # early build-up (rate rising to qi), decline from t_start onwards
+    t = np.linspace(0.0, 10.0, 301)
+    base = _model_from_params(params)
+    q = np.where(t < t_start, params["qi"] * (0.4 + 0.6 * t / t_start), base.q(np.clip(t - t_start, 0.0, None)))
+    rng = np.random.default_rng(seed)
+    return t, q * (1.0 + 0.002 * rng.standard_normal(t.size))
+
+def test_scan_xi_finds_decline_onset(params):
+    t, q = _ramp_then_decline(params)
+    arps = Arps(params["di"], params["qi"], b=params["b"])
+    xi, cand, score = arps.scan_xi(t, q)
+
+    assert cand.shape == score.shape == t.shape
+    assert abs(xi - 3.0) <= 0.15
+    assert np.isnan(score[cand > 5.0]).all()  # beyond max_start
+
+    res = arps.fit(t, q, xi="auto")
+    assert res.xi == xi
+    assert_allclose(res.di, params["di"], rtol=3e-2)
+
+def test_scan_xi_matches_brute_force(params):
+    t, q = _ramp_then_decline(params)
+    arps = Arps(params["di"], params["qi"], b=params["b"])
+    _, cand, score = arps.scan_xi(t, q, min_points=20)
+
+    for k in (0, 50, 120):
+        lr = arps.linregress(t[k:], q[k:])
+        n = t.size - k
+        adj = 1.0 - (1.0 - lr.rvalue ** 2) * (n - 1) / (n - 2)
+        assert_allclose(score[k], adj, rtol=1e-8)
+
+def test_fit_batch_auto_xi_matches_single_well(params):
+    arps = Arps(params["di"], params["qi"], b=params["b"])
+    wells = [_ramp_then_decline(params, t_start=ts, seed=i) for i, ts in enumerate((1.0, 2.5, 4.0))]
+    fits = arps.fit_batch([w[0] for w in wells], [w[1] for w in wells], xi="auto")
+
+    expected = [arps.scan_xi(t, q)[0] for t, q in wells]
+    assert_allclose(fits.xi, expected)
+    assert_allclose(fits.di, params["di"], rtol=5e-2)
+
+    short = arps.fit_batch([np.arange(5.0)], [np.linspace(10.0, 5.0, 5)], xi="auto")
+    assert short.xi[0] == 0.0
+
+# ---------------------------------------------------------------------
+# out= buffers and Arps.evaluate
+# ---------------------------------------------------------------------
+@pytest.mark.parametrize("b", [0.0, 0.5, 1.0])
+def test_run_out_and_evaluate(b):
+    arps = Arps(0.2, 150.0, b=b)
+    x = np.linspace(0.0, 30.0, 61)
+    xi = 5.0
+
+    out = np.empty_like(x)
+    res = arps.run(x, xi=xi, out=out)
+    assert res is out
+    assert np.all(np.isnan(out[x < xi]))
+    after = x >= xi
+    assert_allclose(out[after], arps.model.q(x[after] - xi), rtol=1e-14)
+
+    q, N = arps.evaluate(x, xi=xi)
+    assert_allclose(q, arps.run(x, xi=xi), rtol=1e-14, equal_nan=True)
+    assert_allclose(N, arps.run(x, xi=xi, cum=True), rtol=1e-14, equal_nan=True)
+
+    bufs = (np.empty_like(x), np.empty_like(x))
+    q0, N0 = arps.evaluate(x, out=bufs)
+    assert q0 is bufs[0] and N0 is bufs[1]
+    assert_allclose(N0, arps.run(x, cum=True), rtol=1e-14)
+
+def test_run_out_shape_is_checked():
+    with pytest.raises(ValueError):
+        Arps(0.2, 150.0).run(np.arange(5.0), xi=1.0, out=np.empty(4))
+
+# ---------------------------------------------------------------------
+# modified hyperbolic
+# ---------------------------------------------------------------------
+def test_fit_modified_recovers_parameters():
+    truth = Arps(0.3, 120.0, mode="modified", dmin=0.05)
+    assert truth.mode == "modified" and truth.b == 0.5 and truth.dmin == 0.05
+    t = np.linspace(0.0, 100.0, 101)
+    res = Arps(1.0, 1.0, mode="modified", dmin=0.05).fit(t, truth.run(t))
+    assert_allclose([res.di, res.qi], [0.3, 120.0], rtol=1e-6)
+    assert res.dmin == 0.05
+
+    back = Arps.from_result(res)
+    assert back.mode == "modified"
+    assert_allclose(back.run(t), truth.run(t), rtol=1e-6)
+    with pytest.raises(ValueError):
+        Arps(1.0, 1.0, mode="modified", dmin=0.05).fit(t, truth.run(t), free_b=True)
+
+
+def test_fit_rejects_a_non_declining_polish():
+    t = np.arange(30.0)
+    rising = 10.0 * np.exp(0.05 * t)
+    with pytest.raises(ValueError, match="declining model"):
+        Arps(1.0, 1.0, b=0.5).fit(t, rising, p0=(0.01, 10.0))
+    # free b, with bounds that let di go negative
+    bounds = ([-1.0, 0.0, 0.0], [np.inf, np.inf, 1.0])
+    with pytest.raises(ValueError, match="declining model"):
+        Arps(1.0, 1.0, b=0.5).fit(t, rising, free_b=True, p0=(0.01, 10.0, 0.5), bounds=bounds)
@@ -0,0 +1,65 @@
+# tests/test_backtest.py
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from prodpy.decline import Arps, Backtest
+
+
+@pytest.fixture
+def field():
+    rng = np.random.default_rng(8)
+    ts, qs = [], []
+    for i, n in enumerate((36, 48, 30)):
+        t = np.arange(n, dtype=float) * 30.0
+        q = Arps(0.002 * (1 + i), 200.0, b=0.5).run(t)
+        ts.append(t)
+        qs.append(q * (1.0 + 0.01 * rng.standard_normal(n)))
+    return ts, qs
+
+
+def test_cutoff_matches_manual_fit(field):
+    ts, qs = field
+    arps = Arps(1.0, 1.0, b=0.5)
+    bt = arps.backtest(ts, qs, horizon=6, window=12)
+    assert isinstance(bt, Backtest)
+
+    row = np.flatnonzero((bt.code == 1) & (bt.cutoff == ts[1][20]))[0]
+    t, q = ts[1][9:21], qs[1][9:21]
+    lr = arps.linregress(t - t[0], q)
+    di, qi = arps._invert_from_lin(lr)
+    assert bt.start[row] == t[0]
+    assert_allclose([bt.di[row], bt.qi[row]], [di, qi], rtol=1e-8)
+
+    expected = Arps(di, qi, b=0.5).run(ts[1][21:27] - t[0])
+    assert_allclose(bt.forecast[row], expected, rtol=1e-8)
+    assert_allclose(bt.actual[row], qs[1][21:27])
+
+def test_horizons_stop_at_end_of_each_well(field):
+    ts, qs = field
+    bt = Arps(1.0, 1.0, b=0.5).backtest(ts, qs, horizon=4, min_points=6)
+
+    counts = np.bincount(bt.code)
+    assert counts.tolist() == [t.size - 6 for t in ts]
+    last = np.flatnonzero(bt.cutoff == ts[0][-2])
+    last = last[bt.code[last] == 0][0]
+    assert np.isfinite(bt.forecast[last, 0]) and np.isnan(bt.forecast[last, 1:]).all()
+
+def test_metrics_per_well_and_horizon(field):
+    ts, qs = field
+    bt = Arps(1.0, 1.0, b=0.5).backtest(ts, qs, horizon=5)
+    m = bt.metrics()
+
+    for key in ("count", "bias", "mae", "rmse", "mape"):
+        assert m[key].shape == (3, 5)
+    sel = bt.code == 2
+    err = bt.error[sel, 0]
+    assert_allclose(m["mae"][2, 0], np.nanmean(np.abs(err)))
+    assert_allclose(m["count"][2, 0], np.isfinite(err).sum())
+    assert np.all(m["rmse"] >= m["mae"] - 1e-12)
+
+def test_noise_free_data_forecasts_exactly():
+    t = np.arange(24, dtype=float)
+    q = Arps(0.05, 100.0, b=0.0).run(t)
+    bt = Arps(1.0, 1.0, b=0.0).backtest([t], [q], horizon=3)
+    assert_allclose(np.nan_to_num(bt.error), 0.0, atol=1e-8)
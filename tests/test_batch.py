@@ -0,0 +1,166 @@
+# tests/test_batch.py
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from prodpy.decline import Arps, ArpsBatch
+
+
+@pytest.fixture
+def wells():
+    # one exponential, one harmonic and two hyperbolic wells
+    return dict(
+        di=np.array([0.25, 0.30, 0.20, 0.40]),
+        qi=np.array([120.0, 80.0, 150.0, 60.0]),
+        b=np.array([0.0, 1.0, 0.5, 0.8]),
+        xi=np.array([0.0, 2.0, 0.0, 3.5]),
+    )
+
+@pytest.fixture
+def batch(wells):
+    return ArpsBatch(wells["di"], wells["qi"], b=wells["b"], xi=wells["xi"])
+
+@pytest.fixture
+def tvec():
+    return np.linspace(0.0, 10.0, 201)
+
+
+@pytest.mark.parametrize("cum", [False, True])
+def test_matches_per_well_arps_run(wells, batch, tvec, cum):
+    grid = batch.N(tvec) if cum else batch.q(tvec)
+    assert grid.shape == (batch.size, tvec.size)
+
+    for i in range(batch.size):
+        arps = Arps(wells["di"][i], wells["qi"][i], b=wells["b"][i])
+        ref = arps.run(tvec, xi=wells["xi"][i], cum=cum)
+        assert_allclose(grid[i], ref, rtol=1e-12, atol=1e-12, equal_nan=True)
+
+def test_decline_rates_match_models(wells, batch, tvec):
+    for i in range(batch.size):
+        model = Arps(wells["di"][i], wells["qi"][i], b=wells["b"][i]).model
+        mask = tvec >= wells["xi"][i]
+        tau = tvec[mask] - wells["xi"][i]
+        assert_allclose(batch.d(tvec)[i, mask], model.d(tau), rtol=1e-12)
+        assert_allclose(batch.D(tvec)[i, mask], model.D(tau), rtol=1e-12)
+
+def test_two_dimensional_time_grid(batch, tvec):
+    t2 = np.vstack([tvec + k for k in range(batch.size)])
+    grid = batch.q(t2)
+    for i in range(batch.size):
+        assert_allclose(grid[i], batch.take([i]).q(t2[i])[0], rtol=1e-12, equal_nan=True)
+
+def test_scalar_parameters_broadcast(tvec):
+    batch = ArpsBatch([0.1, 0.2, 0.3], 100.0, b=0.5)
+    assert batch.size == 3
+    assert_allclose(batch.q(0.0)[:, 0], 100.0)
+
+def test_from_results_roundtrip(tvec):
+    t = np.linspace(0.0, 8.0, 60)
+    fits = [Arps(di, 100.0, b=0.5).fit(t, Arps(di, 100.0, b=0.5).run(t)) for di in (0.1, 0.2)]
+    batch = ArpsBatch.from_results(fits)
+    assert_allclose(batch.di, [f.di for f in fits])
+    assert_allclose(batch.b, 0.5)
+
+def test_invalid_parameters_raise():
+    with pytest.raises(ValueError):
+        ArpsBatch([0.1, -0.2], 100.0)
+    with pytest.raises(ValueError):
+        ArpsBatch([0.1, 0.2], [100.0, 0.0])
+    with pytest.raises(ValueError):
+        ArpsBatch([0.1, 0.2], 100.0, b=[0.5, 1.5])
+    with pytest.raises(ValueError):
+        ArpsBatch(0.1, 100.0).q(np.zeros((3, 4)))
+
+# ---------------------------------------------------------------------
+# economic limit over wells × cases
+# ---------------------------------------------------------------------
+def test_econ_matches_scalar_models():
+    di = np.array([0.1, 0.2, 0.3, 0.15])
+    qi = np.array([100.0, 250.0, 80.0, 40.0])
+    b = np.array([0.0, 0.5, 1.0, 0.8])
+    batch = ArpsBatch(di, qi, b=b)
+    cases = np.array([1.0, 5.0, 20.0])
+
+    T, N = batch.econ(cases)
+    assert T.shape == N.shape == (4, 3)
+    for i in range(4):
+        m = Arps(di[i], qi[i], b=b[i]).model
+        for j, q_ec in enumerate(cases):
+            assert_allclose(T[i, j], m.T(q_ec), rtol=1e-12)
+            assert_allclose(N[i, j], m.N_ec(q_ec), rtol=1e-12)
+    assert_allclose(batch.r(cases), qi[:, None] / cases)
+    assert_allclose(batch.T(5.0), T[:, 1])
+    assert_allclose(batch.N_ec(5.0), N[:, 1])
+
+def test_econ_per_well_cutoffs_and_wells_below_limit():
+    batch = ArpsBatch([0.1, 0.2], [50.0, 10.0], b=0.5)
+    q_ec = np.array([[5.0, 60.0], [10.0, 1.0]])
+    T, N = batch.econ(q_ec)
+    assert T[0, 1] == 0.0 and N[0, 1] == 0.0  # qi below the cutoff
+    assert T[1, 0] == 0.0 and N[1, 0] == 0.0  # qi at the cutoff
+    assert_allclose(batch.q(T[0, :1])[0], [5.0], rtol=1e-12)
+    with pytest.raises(ValueError):
+        batch.econ(np.ones((3, 2)))
+    with pytest.raises(ValueError):
+        batch.econ([1.0, 0.0])
+
+def test_econ_max_life_caps_time_and_volume():
+    batch = ArpsBatch([0.01, 0.5], [100.0, 100.0], b=0.5)
+    T, N = batch.econ([1.0], max_life=50.0)
+    T0, N0 = batch.econ([1.0])
+    assert T0[0, 0] > 50.0 and T0[1, 0] < 50.0
+    assert_allclose(T[:, 0], [50.0, T0[1, 0]])
+    assert_allclose(N[0, 0], batch.N([50.0])[0, 0], rtol=1e-12)
+    assert N[1, 0] == N0[1, 0]
+    with pytest.raises(ValueError):
+        batch.econ(1.0, max_life=-1.0)
+
+# ---------------------------------------------------------------------
+# inverse-time queries
+# ---------------------------------------------------------------------
+def test_inverse_time_round_trip_with_xi():
+    batch = ArpsBatch([0.1, 0.2, 0.3], [100.0, 50.0, 80.0], b=[0.0, 0.5, 1.0], xi=[0.0, 2.0, 5.0])
+    targets = np.array([40.0, 10.0])
+    t = batch.t_at_q(targets)
+    assert t.shape == (3, 2)
+    for i in range(3):
+        assert_allclose(batch.take([i]).q(t[i])[0], targets, rtol=1e-10)
+
+    vols = np.array([[10.0, 100.0], [20.0, 30.0], [5.0, 50.0]])
+    t = batch.t_at_N(vols)
+    for i in range(3):
+        assert_allclose(batch.take([i]).N(t[i])[0], vols[i], rtol=1e-10)
+    assert_allclose(batch.t_at_N(0.0), batch.xi)
+
+def test_inverse_time_validates_rates():
+    batch = ArpsBatch([0.1], [100.0])
+    with pytest.raises(ValueError):
+        batch.t_at_q([10.0, -1.0])
+    assert np.isinf(batch.t_at_N(2000.0)).all()
+
+# ---------------------------------------------------------------------
+# modified hyperbolic (terminal decline)
+# ---------------------------------------------------------------------
+def test_modified_batch_matches_scalar_model():
+    from prodpy.decline import ModifiedHyperbolic
+
+    di, qi, b, dmin = [0.3, 0.1, 0.2], [120.0, 80.0, 50.0], [0.5, 1.0, 0.0], [0.05, 0.02, 0.0]
+    batch = ArpsBatch(di, qi, b=b, dmin=dmin)
+    t = np.linspace(0.0, 200.0, 41)
+    q, N = batch.q(t), batch.N(t)
+    T, Nec = batch.econ([10.0, 1.0])
+    tq = batch.t_at_q([10.0, 1.0])
+    tN = batch.t_at_N([100.0])
+    for i in range(3):
+        m = ModifiedHyperbolic(b=b[i], di=di[i], qi=qi[i], dmin=dmin[i])
+        assert_allclose(q[i], m.q(t), rtol=1e-12)
+        assert_allclose(N[i], m.N(t), rtol=1e-12)
+        assert_allclose(T[i], [m.T(10.0), m.T(1.0)], rtol=1e-12)
+        assert_allclose(Nec[i], [m.N_ec(10.0), m.N_ec(1.0)], rtol=1e-12)
+        assert_allclose(tq[i], T[i], rtol=1e-12)
+        assert_allclose(tN[i], m.t_at_N([100.0]), rtol=1e-12)
+
+    T, N = batch.econ([1.0], max_life=50.0)
+    assert_allclose(N[:, 0], np.diag(batch.N(T[:, 0])), rtol=1e-12)
+    with pytest.raises(ValueError):
+        ArpsBatch(di, qi, b=b, dmin=[0.0, -1.0, 0.0])
@@ -9,7 +9,7 @@ import matplotlib.pyplot as plt
 from matplotlib.axes import Axes
 from numpy.testing import assert_allclose
 
-from prodpy._decline import DCA
+from prodpy._decline import DCA, PeriodVolumes
 
 try:
     from prodpy.decline import Arps
@@ -70,3 +70,270 @@ def test_dca_plot_returns_axes(synthetic_decline_df):
 
     assert isinstance(ax, Axes)
     plt.close(ax.figure)
+
+
+def test_dca_fit_free_b(synthetic_decline_df):
+    dca = DCA(synthetic_decline_df).fit(model="hyperbolic", free_b=True)
+    assert_allclose(dca._fit.b, 0.5, atol=1e-4)
+    assert_allclose(dca._fit.di, 0.25, rtol=1e-4)
+
+
+def test_dca_update_appends_history(synthetic_decline_df):
+    head, tail = synthetic_decline_df.iloc[:20], synthetic_decline_df.iloc[20:]
+    dca = DCA(head).fit(model="hyperbolic", b=0.5).update(tail)
+    full = DCA(synthetic_decline_df).fit(model="hyperbolic", b=0.5)
+
+    assert dca._fit.n == synthetic_decline_df.shape[0]
+    assert_allclose([dca._fit.di, dca._fit.qi], [full._fit.di, full._fit.qi], rtol=1e-6)
+    assert_allclose(dca._t_days, full._t_days)
+    assert dca.run(horizon_days=30).shape == full.run(horizon_days=30).shape
+
+    with pytest.raises(ValueError):
+        dca.update(head)
+
+
+def test_dca_update_with_fresh_index_keeps_lookups_aligned():
+    dates = pd.date_range("2022-01-01", periods=70, freq="D")
+    rate = Arps(di=0.05, qi=150.0, b=0.5).run(np.arange(70.0))
+    head = pd.DataFrame({"date": dates[:60], "rate": rate[:60]})
+    tail = pd.DataFrame({"date": dates[60:], "rate": rate[60:]})  # RangeIndex 0..9 again
+
+    dca = DCA(head).fit(model="hyperbolic", b=0.5).update(tail)
+    assert dca.df.index.is_unique and dca.df.shape[0] == 70
+    assert (dca._sched.series.to_numpy() == dates.to_numpy()).all()
+
+    bt = dca.backtest(model="hyperbolic", b=0.5, horizon=5, window=10)
+    assert np.all(bt.metrics()["mape"] < 1e-6)
+    refit = dca.fit(model="hyperbolic", b=0.5)
+    assert refit._fit.n == 70
+    assert_allclose(refit._fit.di, 0.05, rtol=1e-6)
+
+
+def test_dca_backtest_scores_history(synthetic_decline_df):
+    bt = DCA(synthetic_decline_df).backtest(model="hyperbolic", b=0.5, horizon=5, window=10)
+    m = bt.metrics()
+    assert m["mape"].shape == (1, 5)
+    assert np.all(m["mape"] < 1e-6)
+
+
+def test_dca_fit_modified(synthetic_decline_df):
+    dca = DCA(synthetic_decline_df).fit(model="modified", b=0.5, dmin=1e-4)
+    assert dca._arps_hat.mode == "modified"
+    assert dca._fit.dmin == 1e-4
+    # hyperbolic data far from the switch: same curve as the plain fit
+    plain = DCA(synthetic_decline_df).fit(model="hyperbolic", b=0.5)
+    assert_allclose([dca._fit.di, dca._fit.qi], [plain._fit.di, plain._fit.qi], rtol=1e-4)
+    assert DCA(synthetic_decline_df).fit(dmin=1e-4)._arps_hat.mode == "modified"
+
+
+def test_dca_fit_segments_forecasts_last_segment():
+    dates = pd.date_range("2022-01-01", periods=60, freq="D")
+    t = np.arange(dates.size, dtype=float)
+    rates = np.where(t < 25, Arps(0.05, 100.0, b=0.5).run(t), Arps(0.08, 80.0, b=0.5).run(t, xi=25.0))
+    dca = DCA(pd.DataFrame({"date": dates, "rate": rates})).fit_segments(model="hyperbolic", b=0.5)
+
+    assert len(dca.segments) == 2
+    assert dca._fit.xi == 25.0
+    assert_allclose([dca._fit.di, dca._fit.qi], [0.08, 80.0], rtol=1e-6)
+
+    out = dca.run(horizon_days=30)
+    assert_allclose(out["q_fit"].iloc[:60], rates, rtol=1e-6)
+    assert_allclose(out["q_forecast"].iloc[-1], Arps(0.08, 80.0, b=0.5).run([89.0], xi=25.0)[0], rtol=1e-6)
+
+    # the cumulative counts the first segment's volume and runs on without a restart
+    N = out["N_forecast"].to_numpy()
+    assert np.all(np.isfinite(N)) and np.all(np.diff(N) > 0)
+    assert_allclose(N[:61], dca.segments.run(out["t_days"].iloc[:61], cum=True), rtol=1e-6)
+    first = Arps(0.05, 100.0, b=0.5).run([25.0], cum=True)[0]
+    assert_allclose(N[-1], first + Arps(0.08, 80.0, b=0.5).run([64.0], cum=True)[0], rtol=1e-6)
+
+    # a plain fit drops the segments again
+    assert dca.fit(model="hyperbolic", b=0.5).segments is None
+
+
+def test_dca_fit_robust_ignores_shut_ins(synthetic_decline_df):
+    df = synthetic_decline_df.copy()
+    df.loc[[8, 9, 20], "rate"] *= 0.05
+    plain = DCA(df).fit(model="hyperbolic", b=0.5)
+    robust = DCA(df).fit(model="hyperbolic", b=0.5, robust="tukey")
+    assert_allclose([robust._fit.di, robust._fit.qi], [0.25, 150.0], rtol=1e-6)
+    assert abs(plain._fit.di - 0.25) > 1e-3
+
+
+def test_dca_weighted_fit(synthetic_decline_df):
+    df = synthetic_decline_df.copy()
+    df["uptime"] = 1.0
+    df.loc[[5, 6], "uptime"] = 0.0
+    df.loc[[5, 6], "rate"] *= 0.1  # shut-in days, zero weight
+    dca = DCA(df).fit(model="hyperbolic", b=0.5, uptime_col="uptime", half_life=10.0)
+    assert_allclose([dca._fit.di, dca._fit.qi], [0.25, 150.0], rtol=1e-6)
+    assert dca._fit.n == df.shape[0] - 2
+
+    same = DCA(df).fit(model="hyperbolic", b=0.5, weights="uptime")
+    assert_allclose(same._fit.di, 0.25, rtol=1e-6)
+    with pytest.raises(RuntimeError):
+        dca.update(df.tail(1))
+
+
+@pytest.fixture
+def field_df():
+    rng = np.random.default_rng(0)
+    frames = []
+    for w in range(6):
+        dates = pd.date_range("2020-01-01", periods=24, freq="MS")
+        t = (dates - dates[0]).days.to_numpy(float)
+        q = Arps(0.002 * (1 + w % 3), 100.0 + w, b=0.5).run(t) * np.exp(0.01 * rng.standard_normal(t.size))
+        frames.append(pd.DataFrame({"well": f"W{w}", "date": dates, "rate": q}))
+    short = pd.DataFrame({"well": "BAD", "date": pd.date_range("2020-01-01", periods=2, freq="MS"), "rate": [1.0, 2.0]})
+    return pd.concat(frames + [short]).sample(frac=1.0, random_state=0).reset_index(drop=True)
+
+
+def test_fit_many_matches_single_well_fits(field_df):
+    table = DCA.fit_many(field_df, workers=1, model="hyperbolic", b=0.5)
+    assert list(table.well) == ["BAD"] + [f"W{w}" for w in range(6)]
+    assert table.error[0].startswith("ValueError") and np.isnan(table.di[0])
+    assert np.all(table.error[1:] == "")
+
+    one = field_df[field_df["well"] == "W4"].sort_values("date")
+    ref = DCA(one).fit(model="hyperbolic", b=0.5)._fit
+    assert_allclose([table[5].di, table[5].qi], [ref.di, ref.qi], rtol=1e-12)
+
+
+def test_fit_many_process_pool_and_row_weights(field_df):
+    pooled = DCA.fit_many(field_df, workers=2, chunksize=2, model="hyperbolic", b=0.5)
+    inline = DCA.fit_many(field_df, workers=1, model="hyperbolic", b=0.5)
+    assert_allclose(pooled.di, inline.di, rtol=1e-12)
+    assert list(pooled.error) == list(inline.error)
+
+    weighted = DCA.fit_many(field_df, workers=1, model="hyperbolic", b=0.5, weights=np.ones(field_df.shape[0]))
+    assert_allclose(weighted.di, inline.di, rtol=1e-8)
+    with pytest.raises(ValueError):
+        DCA.fit_many(field_df, workers=0)
+
+
+def test_fit_many_keeps_weight_and_uptime_arrays_apart(field_df):
+    rng = np.random.default_rng(1)
+    df = field_df.assign(w=rng.uniform(0.5, 2.0, field_df.shape[0]), up=rng.uniform(0.5, 1.0, field_df.shape[0]))
+    by_name = DCA.fit_many(df, workers=1, model="hyperbolic", b=0.5, weights="w", uptime_col="up")
+    by_array = DCA.fit_many(df, workers=1, model="hyperbolic", b=0.5,
+                            weights=df["w"].to_numpy(), uptime_col=df["up"].to_numpy())
+    assert_allclose(by_array.di, by_name.di, rtol=1e-12)
+    assert_allclose(by_array.qi, by_name.qi, rtol=1e-12)
+
+    one = df[df["well"] == "W4"].sort_values("date")
+    ref = DCA(one).fit(model="hyperbolic", b=0.5, weights="w", uptime_col="up")._fit
+    assert_allclose([by_array[5].di, by_array[5].qi], [ref.di, ref.qi], rtol=1e-12)
+    with pytest.raises(ValueError):
+        DCA.fit_many(df, workers=1, weights=np.ones(3))
+
+
+def test_run_is_memoized_until_refit(synthetic_decline_df):
+    dca = DCA(synthetic_decline_df).fit(model="hyperbolic", b=0.5)
+    first = dca.run(horizon_days=30)
+    first.loc[:, "q_fit"] = -1.0  # callers get copies
+    second = dca.run(horizon_days=30)
+    assert np.all(second["q_fit"] > 0)
+    assert len(dca._forecasts) == 1
+    assert dca._forecasts[(None, 30, None)] is not second
+
+    q, N = dca._arps_hat.evaluate(second["t_days"].to_numpy(), xi=dca._fit.xi)
+    assert_allclose(second["q_fit"], q, rtol=1e-14)
+    assert_allclose(second["N_forecast"], N, rtol=1e-14)
+
+    cached = dca._forecasts[(None, 30, None)]
+    ax = dca.plot(horizon_days=30, show=False)
+    plt.close(ax.figure)
+    assert len(dca._forecasts) == 1 and dca._forecasts[(None, 30, None)] is cached  # plot shares the memo
+
+    dca.fit(model="exponential")
+    assert dca._forecasts == {}
+    assert not np.allclose(dca.run(horizon_days=30)["q_fit"], second["q_fit"])
+
+
+def test_run_stops_at_economic_limit(synthetic_decline_df):
+    dca = DCA(synthetic_decline_df).fit(model="hyperbolic", b=0.5)
+    t_ec = float(dca._arps_hat.model.t_at_q(1.0))  # ~ 212 days
+
+    long = dca.run(horizon_days=50 * 365, econ_rate=1.0)
+    assert long["t_days"].iloc[-1] <= t_ec < long["t_days"].iloc[-1] + 1.0
+    assert np.all(long["q_forecast"].iloc[29:] >= 1.0)
+
+    until = dca.run(horizon_days="econ", econ_rate=1.0)
+    pd.testing.assert_frame_equal(until, long)
+
+    # the cut also applies to a shorter horizon and to history past the limit
+    short = dca.run(horizon_days=30, econ_rate=1.0)
+    assert short.shape[0] == 30 + 30
+    late = dca.run(econ_rate=20.0)
+    assert late.shape[0] == 30 and np.isnan(late["q_fit"].iloc[-1])
+    with pytest.raises(ValueError):
+        dca.run(horizon_days="econ")
+    with pytest.raises(ValueError):
+        dca.run(econ_rate=0.0)
+
+
+def test_volumes_difference_the_cumulative_over_calendar_months(synthetic_decline_df):
+    dca = DCA(synthetic_decline_df).fit(model="hyperbolic", b=0.5)
+    vol = dca.volumes("M", periods=3)
+
+    assert isinstance(vol, PeriodVolumes) and len(vol) == 3
+    assert vol.start[0] == np.datetime64("2022-01-30")  # last history date
+    assert list(pd.DatetimeIndex(vol.start[1:]).strftime("%Y-%m-%d")) == ["2022-02-01", "2022-03-01"]
+    assert vol.end == np.datetime64("2022-04-01")
+    assert_allclose(vol.days, [2.0, 28.0, 31.0])
+
+    edges = np.array([29.0, 31.0, 59.0, 90.0])
+    N = dca._arps_hat.run(edges, cum=True)
+    assert_allclose(vol.volume, np.diff(N))
+    assert_allclose(vol.cumulative[-1], N[-1] - N[0])
+    assert list(vol.to_frame().columns) == ["days", "volume"]
+
+
+def test_volumes_uptime_econ_limit_and_validation(synthetic_decline_df):
+    dca = DCA(synthetic_decline_df).fit(model="hyperbolic", b=0.5)
+    full = dca.volumes("Q", periods=2)
+    assert_allclose(dca.volumes("Q", periods=2, uptime=[1.0, 0.5]).volume, full.volume * [1.0, 0.5])
+
+    # the rate reaches 1.0 on day ~212: nothing is produced after it
+    capped = dca.volumes("M", periods=12, econ_rate=1.0)
+    t_ec = float(dca._arps_hat.model.t_at_q(1.0))
+    assert_allclose(capped.cumulative[-1], dca._arps_hat.model.N(t_ec) - dca._arps_hat.model.N(29.0))
+    assert np.all(capped.volume[8:] == 0.0)
+
+    with pytest.raises(ValueError):
+        dca.volumes("W")
+    with pytest.raises(ValueError):
+        dca.volumes(periods=0)
+    with pytest.raises(RuntimeError):
+        DCA(synthetic_decline_df).volumes()
+
+
+def test_fit_mask_excludes_rows_without_copying(synthetic_decline_df):
+    df = synthetic_decline_df.copy()
+    df.loc[10, "rate"] *= 5.0
+    keep = np.ones(df.shape[0], dtype=bool)
+    keep[10] = False
+
+    masked = DCA(df).fit(model="hyperbolic", b=0.5, mask=keep)
+    assert_allclose([masked._fit.di, masked._fit.qi], [0.25, 150.0], rtol=1e-6)
+    assert masked.run(periods=1)["q_hist"].iloc[10] == df["rate"].iloc[10]
+
+    by_name = DCA(df.assign(ok=keep)).fit(model="hyperbolic", b=0.5, mask="ok")
+    assert by_name._fit.di == masked._fit.di
+    with pytest.raises(ValueError):
+        DCA(df).fit(mask=keep[:-1])
+
+
+def test_fit_many_consumes_a_quality_mask(field_df):
+    from prodpy.decline import quality_mask
+
+    df = field_df.copy()
+    spike = df.index[(df["well"] == "W4") & (df["date"] == "2021-01-01")]
+    df.loc[spike, "rate"] *= 4.0
+    keep = quality_mask(df["date"], df["rate"], wells=df["well"])
+    assert np.array_equal(np.flatnonzero(~keep), spike)
+
+    clean = DCA.fit_many(field_df, workers=1, model="hyperbolic", b=0.5)
+    table = DCA.fit_many(df, workers=1, model="hyperbolic", b=0.5, mask=keep)
+    assert_allclose(table[5].di, clean[5].di, rtol=0.05)
+    assert_allclose(np.delete(table.di, [0, 5]), np.delete(clean.di, [0, 5]), rtol=1e-12)
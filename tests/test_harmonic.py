@@ -225,3 +225,53 @@ def test_fit_shape_mismatch_raises(model):
     q = np.linspace(100, 90, 9)
     with pytest.raises(ValueError):
         model.fit(t, q)
+
+# ------------------------------------
+# Analytic Jacobian
+# ------------------------------------
+def test_jac_matches_finite_differences(model, tvec):
+    J = model.jac(tvec)
+    assert J.shape == (tvec.size, 2)
+
+    for col, name in enumerate(("di", "qi")):
+        h = 1e-6 * max(abs(getattr(model, name)), 1.0)
+        up = model.with_params(**{name: getattr(model, name) + h}).q(tvec)
+        dn = model.with_params(**{name: getattr(model, name) - h}).q(tvec)
+        assert_allclose(J[:, col], (up - dn) / (2.0 * h), rtol=1e-6, atol=1e-8)
+
+# ---------------------------------------------------------------------
+# out= buffers and one-pass (q, N)
+# ---------------------------------------------------------------------
+def test_out_buffers_are_filled_in_place(model, tvec):
+    for name in ("q", "N", "d", "D"):
+        out = np.empty_like(tvec)
+        res = getattr(model, name)(tvec, out=out)
+        assert res is out
+        assert_allclose(out, getattr(model, name)(tvec), rtol=0, atol=0)
+
+def test_out_buffer_shape_is_checked(model, tvec):
+    with pytest.raises(ValueError):
+        model.q(tvec, out=np.empty(tvec.size + 1))
+    with pytest.raises(ValueError):
+        model.N(tvec, out=np.empty(tvec.shape, dtype=np.float32))
+
+def test_qN_matches_separate_calls(model, tvec):
+    q, N = model.qN(tvec)
+    assert_allclose(q, model.q(tvec), rtol=1e-14)
+    assert_allclose(N, model.N(tvec), rtol=1e-14, atol=1e-12)
+
+    bufs = (np.empty_like(tvec), np.empty_like(tvec))
+    q2, N2 = model.qN(tvec, out=bufs)
+    assert q2 is bufs[0] and N2 is bufs[1]
+    assert_allclose(q2, q, rtol=0, atol=0)
+
+# ---------------------------------------------------------------------
+# inverse-time queries
+# ---------------------------------------------------------------------
+def test_t_at_q_and_t_at_N_invert_forward(model, tvec):
+    assert_allclose(model.t_at_q(model.q(tvec)), tvec, rtol=1e-10, atol=1e-10)
+    assert_allclose(model.t_at_N(model.N(tvec)), tvec, rtol=1e-10, atol=1e-10)
+
+def test_t_at_q_matches_T(model):
+    q_ec = np.array([model.qi / 2.0, model.qi / 10.0])
+    assert_allclose(model.t_at_q(q_ec), [model.T(q) for q in q_ec], rtol=1e-12)
@@ -15,8 +15,7 @@ except Exception:
 
 @pytest.fixture
 def params():
-    # Use "safe" b values (not exactly 0 or 1) because the current implementation
-    # does not special-case those limits.
+    # Interior b; the exact limits b = 0 and b = 1 are covered further below.
     return dict(b=0.5, di=0.25, qi=120.0)
 
 @pytest.fixture
@@ -188,3 +187,105 @@ def test_fit_shape_mismatch_raises(model):
     q = np.linspace(100, 90, 9)
     with pytest.raises(ValueError):
         model.fit(t, q)
+
+# ------------------------------------
+# Analytic Jacobian
+# ------------------------------------
+def test_jac_matches_finite_differences(model, tvec):
+    J = model.jac(tvec)
+    assert J.shape == (tvec.size, 3)
+
+    for col, name in enumerate(("di", "qi", "b")):
+        h = 1e-6 * max(abs(getattr(model, name)), 1.0)
+        up = model.with_params(**{name: getattr(model, name) + h}).q(tvec)
+        dn = model.with_params(**{name: getattr(model, name) - h}).q(tvec)
+        assert_allclose(J[:, col], (up - dn) / (2.0 * h), rtol=1e-6, atol=1e-8)
+
+# ------------------------------------
+# Stable evaluation at and near the b limits
+# ------------------------------------
+@pytest.mark.parametrize("b", [0.0, 1e-12, 1e-6, 1.0 - 1e-9, 1.0])
+def test_limits_match_exponential_and_harmonic(b, tvec):
+    from prodpy.decline import Exponential, Harmonic
+
+    di, qi, qec = 0.25, 120.0, 10.0
+    m = Hyperbolic(b=b, di=di, qi=qi)
+    ref = Exponential(di=di, qi=qi) if b < 0.5 else Harmonic(di=di, qi=qi)
+    tol = 1e-9 if b in (0.0, 1.0) else 1e-5
+
+    assert_allclose(m.q(tvec), ref.q(tvec), rtol=tol)
+    assert_allclose(m.N(tvec), ref.N(tvec), rtol=tol, atol=1e-12)
+    assert_allclose(m.D(tvec), ref.D(tvec), rtol=tol)
+    assert_allclose(m.T(qec), ref.T(qec), rtol=tol)
+    assert_allclose(m.N_ec(qec), ref.N_ec(qec), rtol=tol)
+    assert np.all(np.isfinite(m.jac(tvec)))
+
+def test_mixed_b_kernel_has_no_nans(tvec):
+    from prodpy.decline._hyperbolic import _kernel_N, _kernel_q
+
+    b = np.array([0.0, 1e-300, 0.3, 0.999999, 1.0])[:, None]
+    q = _kernel_q(tvec, 0.25, 120.0, b)
+    N = _kernel_N(tvec, 0.25, 120.0, b)
+    assert np.all(np.isfinite(q)) and np.all(np.isfinite(N))
+    # interior b against the textbook power form
+    assert_allclose(q[2], 120.0 / (1.0 + 0.3 * 0.25 * tvec) ** (1.0 / 0.3), rtol=1e-12)
+    assert_allclose(N[2], 480.0 / 0.7 * (1.0 - (1.0 + 0.3 * 0.25 * tvec) ** (1.0 - 1.0 / 0.3)), rtol=1e-12)
+
+def test_Nec_at_qi_is_zero(model):
+    assert model.N_ec(model.qi) == 0.0
+
+# ---------------------------------------------------------------------
+# out= buffers and one-pass (q, N)
+# ---------------------------------------------------------------------
+def test_out_buffers_are_filled_in_place(model, tvec):
+    for name in ("q", "N", "d", "D"):
+        out = np.empty_like(tvec)
+        res = getattr(model, name)(tvec, out=out)
+        assert res is out
+        assert_allclose(out, getattr(model, name)(tvec), rtol=0, atol=0)
+
+def test_out_buffer_shape_is_checked(model, tvec):
+    with pytest.raises(ValueError):
+        model.q(tvec, out=np.empty(tvec.size + 1))
+    with pytest.raises(ValueError):
+        model.N(tvec, out=np.empty(tvec.shape, dtype=np.float32))
+
+def test_qN_matches_separate_calls(model, tvec):
+    q, N = model.qN(tvec)
+    assert_allclose(q, model.q(tvec), rtol=1e-14)
+    assert_allclose(N, model.N(tvec), rtol=1e-14, atol=1e-12)
+
+    bufs = (np.empty_like(tvec), np.empty_like(tvec))
+    q2, N2 = model.qN(tvec, out=bufs)
+    assert q2 is bufs[0] and N2 is bufs[1]
+    assert_allclose(q2, q, rtol=0, atol=0)
+
+@pytest.mark.parametrize("b", [0.0, 1e-9, 0.5, 1.0 - 1e-9, 1.0])
+def test_inplace_paths_match_kernels_at_limits(b, tvec):
+    from prodpy.decline._hyperbolic import _kernel_D, _kernel_N, _kernel_q
+
+    m = Hyperbolic(b=b, di=0.3, qi=80.0)
+    q, N = m.qN(tvec)
+    assert_allclose(q, _kernel_q(tvec, m.di, m.qi, b), rtol=1e-12)
+    assert_allclose(N, _kernel_N(tvec, m.di, m.qi, b), rtol=1e-12)
+    assert_allclose(m.D(tvec), _kernel_D(tvec, m.di, b), rtol=1e-12)
+
+# ---------------------------------------------------------------------
+# inverse-time queries
+# ---------------------------------------------------------------------
+def test_t_at_q_and_t_at_N_invert_forward(model, tvec):
+    assert_allclose(model.t_at_q(model.q(tvec)), tvec, rtol=1e-10, atol=1e-10)
+    assert_allclose(model.t_at_N(model.N(tvec)), tvec, rtol=1e-10, atol=1e-10)
+
+def test_t_at_q_matches_T(model):
+    q_ec = np.array([model.qi / 2.0, model.qi / 10.0])
+    assert_allclose(model.t_at_q(q_ec), [model.T(q) for q in q_ec], rtol=1e-12)
+
+@pytest.mark.parametrize("b", [0.0, 1e-9, 0.3, 1.0 - 1e-9, 1.0])
+def test_inverse_is_stable_at_limits(b):
+    m = Hyperbolic(b=b, di=0.2, qi=50.0)
+    t = np.array([0.0, 1e-8, 0.5, 5.0, 40.0])
+    assert_allclose(m.t_at_q(m.q(t)), t, rtol=1e-9, atol=1e-12)
+    assert_allclose(m.t_at_N(m.N(t)), t, rtol=1e-9, atol=1e-12)
+    if b < 1.0:
+        assert np.isinf(m.t_at_N(1.01 * m.qi / (m.di * (1.0 - b))))
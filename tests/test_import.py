@@ -0,0 +1,68 @@
+# tests/test_import.py
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+HEAVY = ("scipy", "pandas", "matplotlib")
+
+# wall-clock checks are machine dependent, so they are opt-in: set
+# PRODPY_IMPORT_BUDGET to a budget in seconds to time the light import path
+IMPORT_BUDGET = os.environ.get("PRODPY_IMPORT_BUDGET")
+
+
+def _run(code: str) -> dict:
+    script = textwrap.dedent(
+        """
+        import json, sys, time
+        start = time.perf_counter()
+        {code}
+        elapsed = time.perf_counter() - start
+        loaded = sorted({{m.split(".")[0] for m in sys.modules}} & set({heavy!r}))
+        print(json.dumps({{"elapsed": elapsed, "loaded": loaded}}))
+        """
+    ).format(code=code, heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_import_prodpy_is_light():
+    res = _run("import prodpy, prodpy.onepage")
+    assert res["loaded"] == []
+
+def test_decline_models_do_not_import_scipy():
+    res = _run(
+        "from prodpy.decline import Arps, ArpsBatch, FitTable, Sampler, OnlineFit\n"
+        "Arps(0.1, 100.0, b=0.5).run([0.0, 1.0, 2.0])"
+    )
+    assert res["loaded"] == []
+
+def test_fitting_loads_scipy_on_demand():
+    res = _run(
+        "import numpy as np\n"
+        "from prodpy.decline import Arps\n"
+        "t = np.linspace(0.0, 10.0, 20)\n"
+        "Arps(1.0, 1.0).fit(t, Arps(0.2, 50.0).run(t))"
+    )
+    assert "scipy" in res["loaded"]
+
+@pytest.mark.skipif(IMPORT_BUDGET is None, reason="set PRODPY_IMPORT_BUDGET to time the import")
+def test_import_within_budget():
+    res = _run("import prodpy, prodpy.decline")
+    assert res["elapsed"] < float(IMPORT_BUDGET)
+
+@pytest.mark.parametrize("name", ["Schedule", "DCA", "Allocate", "decline"])
+def test_lazy_names_resolve(name):
+    import prodpy
+
+    assert getattr(prodpy, name) is not None
+    assert name in dir(prodpy)
+
+def test_unknown_name_raises():
+    import prodpy.decline
+
+    with pytest.raises(AttributeError):
+        prodpy.decline.NoSuchModel
@@ -0,0 +1,41 @@
+# tests/test_inverse.py
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from prodpy.decline import ArpsBatch, solve_time
+
+
+@pytest.fixture
+def batch():
+    return ArpsBatch([0.05, 0.2, 0.4, 0.1], [100.0, 300.0, 50.0, 20.0], b=[0.0, 0.5, 1.0, 0.9])
+
+
+def _curves(batch, shape):
+    di, qi, b = (np.broadcast_to(p[:, None], shape) for p in (batch.di, batch.qi, batch.b))
+    from prodpy.decline._hyperbolic import _kernel_N, _kernel_q
+
+    return (lambda t: _kernel_N(t, di, qi, b)), (lambda t: _kernel_q(t, di, qi, b))
+
+
+@pytest.mark.parametrize("use_derivative", [True, False])
+def test_newton_matches_closed_form_cumulative(batch, use_derivative):
+    vols = np.array([1.0, 50.0, 120.0])
+    N, q = _curves(batch, (batch.size, vols.size))
+    target = np.broadcast_to(vols, (batch.size, vols.size))
+    t = solve_time(N, target, dfdt=q if use_derivative else None)
+    assert_allclose(t, batch.t_at_N(vols), rtol=1e-9)
+
+def test_newton_decreasing_rate(batch):
+    rates = np.array([15.0, 5.0])
+    _, q = _curves(batch, (batch.size, rates.size))
+    t = solve_time(q, np.broadcast_to(rates, (batch.size, rates.size)), increasing=False)
+    expected = batch.t_at_q(rates)
+    reached = rates[None, :] < batch.qi[:, None]
+    assert_allclose(t[reached], expected[reached], rtol=1e-9)
+    assert np.all(t[~reached] == 0.0)
+
+def test_unreachable_targets_are_inf(batch):
+    N, q = _curves(batch, (batch.size, 1))
+    t = solve_time(N, np.full((batch.size, 1), 1e6), dfdt=q, t_max=1e4)
+    assert np.all(np.isinf(t[[0, 1]]))
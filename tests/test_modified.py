@@ -0,0 +1,120 @@
+# tests/test_modified.py
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from prodpy.decline import Exponential, Hyperbolic, ModifiedHyperbolic
+
+
+@pytest.fixture
+def model():
+    # switches at t_sw = (0.3 - 0.05) / (0.5 * 0.3 * 0.05) = 33.3
+    return ModifiedHyperbolic(b=0.5, di=0.3, qi=120.0, dmin=0.05)
+
+@pytest.fixture
+def tvec():
+    return np.linspace(0.0, 100.0, 2001)
+
+# -----------------------------
+# switch and continuity
+# -----------------------------
+def test_switch_time_is_where_decline_reaches_dmin(model):
+    tsw = model.t_switch
+    assert_allclose(tsw, (0.3 - 0.05) / (0.5 * 0.3 * 0.05))
+    hyp = Hyperbolic(b=0.5, di=0.3, qi=120.0)
+    assert_allclose(hyp.d(tsw), 0.05, rtol=1e-12)
+    assert_allclose(model.q_switch, hyp.q(tsw), rtol=1e-12)
+
+def test_segments(model, tvec):
+    hyp = Hyperbolic(b=0.5, di=0.3, qi=120.0)
+    tsw = model.t_switch
+    before, after = tvec <= tsw, tvec > tsw
+    assert_allclose(model.q(tvec[before]), hyp.q(tvec[before]), rtol=1e-13)
+    assert_allclose(model.q(tvec[after]), model.q_switch * np.exp(-0.05 * (tvec[after] - tsw)), rtol=1e-12)
+    assert_allclose(model.d(tvec), np.maximum(hyp.d(tvec), 0.05), rtol=1e-13)
+
+    # continuous rate and cumulative across the switch
+    eps = 1e-7
+    assert_allclose(model.q(tsw - eps), model.q(tsw + eps), rtol=1e-7)
+    assert_allclose(model.N(tsw - eps), model.N(tsw + eps), rtol=1e-7)
+
+def test_limits():
+    t = np.linspace(0.0, 50.0, 101)
+    hyp = Hyperbolic(b=0.5, di=0.3, qi=120.0)
+    assert np.isinf(ModifiedHyperbolic(b=0.5, di=0.3, qi=120.0, dmin=0.0).t_switch)
+    assert_allclose(ModifiedHyperbolic(b=0.5, di=0.3, qi=120.0).q(t), hyp.q(t), rtol=1e-14)
+    assert_allclose(ModifiedHyperbolic(b=0.5, di=0.3, qi=120.0).N(t), hyp.N(t), rtol=1e-14)
+
+    # already below the terminal decline: exponential at dmin throughout
+    low = ModifiedHyperbolic(b=0.5, di=0.02, qi=120.0, dmin=0.05)
+    assert low.t_switch == 0.0
+    assert_allclose(low.q(t), Exponential(di=0.05, qi=120.0).q(t), rtol=1e-13)
+    assert_allclose(low.N(t), Exponential(di=0.05, qi=120.0).N(t), rtol=1e-13)
+
+# -----------------------------
+# cumulative, decline and economic limit
+# -----------------------------
+def test_cumulative_is_integral_of_rate(model, tvec):
+    q = model.q(tvec)
+    trap = np.concatenate([[0.0], np.cumsum(0.5 * (q[1:] + q[:-1]) * np.diff(tvec))])
+    assert_allclose(model.N(tvec), trap, rtol=1e-4)
+    q2, N2 = model.qN(tvec)
+    assert_allclose(q2, q, rtol=1e-14)
+    assert_allclose(N2, model.N(tvec), rtol=1e-14)
+
+def test_effective_decline_on_tail(model):
+    assert_allclose(model.D(80.0), 1.0 - np.exp(-0.05), rtol=1e-13)
+    assert_allclose(model.D(0.0), Hyperbolic(b=0.5, di=0.3, qi=120.0).D(0.0), rtol=1e-13)
+
+@pytest.mark.parametrize("q_ec", [60.0, 5.0])  # before / after the switch
+def test_economic_limit(model, q_ec):
+    T = model.T(q_ec)
+    assert_allclose(model.q(T), q_ec, rtol=1e-12)
+    assert_allclose(model.N_ec(q_ec), model.N(T), rtol=1e-12)
+    assert model.r(q_ec) == 120.0 / q_ec
+
+def test_inverse_round_trip(model, tvec):
+    assert_allclose(model.t_at_q(model.q(tvec)), tvec, rtol=1e-10, atol=1e-10)
+    assert_allclose(model.t_at_N(model.N(tvec)), tvec, rtol=1e-9, atol=1e-9)
+    assert np.isinf(model.t_at_N(1e9))
+
+# -----------------------------
+# jacobian, buffers, validation
+# -----------------------------
+def test_jacobian_matches_finite_differences(model):
+    t = np.array([1.0, 20.0, 40.0, 90.0])
+    J = model.jac(t)
+    h = 1e-7
+    ddi = (model.with_params(di=0.3 + h).q(t) - model.with_params(di=0.3 - h).q(t)) / (2 * h)
+    dqi = (model.with_params(qi=120.0 + h).q(t) - model.with_params(qi=120.0 - h).q(t)) / (2 * h)
+    assert_allclose(J[:, 0], ddi, rtol=1e-6)
+    assert_allclose(J[:, 1], dqi, rtol=1e-6)
+
+def test_out_buffers(model, tvec):
+    buf = np.empty_like(tvec)
+    assert model.q(tvec, out=buf) is buf
+    assert_allclose(buf, model.q(tvec))
+    bufs = (np.empty_like(tvec), np.empty_like(tvec))
+    q, N = model.qN(tvec, out=bufs)
+    assert q is bufs[0] and N is bufs[1]
+
+@pytest.mark.parametrize("params", [dict(b=0.5, di=0.3, dmin=0.05), dict(b=0.5, di=0.03, dmin=0.05), dict(b=0.0, di=0.3, dmin=0.0)])
+def test_out_buffers_match_kernels_piecewise(tvec, params):
+    # segments are written straight into `out`, which may be t itself
+    model = ModifiedHyperbolic(qi=120.0, **params)
+    q, N = model.qN(tvec)  # one-pass kernel
+    for name, expected in (("q", q), ("N", N), ("d", model.d(list(tvec))), ("D", model.D(list(tvec)))):
+        buf = tvec.copy()
+        assert getattr(model, name)(buf, out=buf) is buf
+        assert_allclose(buf, expected, rtol=1e-13)
+    with pytest.raises(ValueError):
+        model.q(tvec, out=np.empty(3))
+
+def test_validation():
+    with pytest.raises(ValueError):
+        ModifiedHyperbolic(b=0.5, di=0.3, qi=1.0, dmin=-0.1)
+    with pytest.raises(ValueError):
+        ModifiedHyperbolic(b=1.5, di=0.3, qi=1.0)
+    with pytest.raises(ValueError):
+        ModifiedHyperbolic(b=0.5, di=0.3, qi=1.0).T(0.0)
+    assert ModifiedHyperbolic().mode == "modified"
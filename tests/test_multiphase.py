@@ -0,0 +1,100 @@
+# tests/test_multiphase.py
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose
+
+from prodpy import DCA, MultiPhaseDCA
+
+try:
+    from prodpy.decline import Arps
+except Exception:  # pragma: no cover - fallback for local runs
+    from prodpy.decline._arps import Arps
+
+
+@pytest.fixture
+def three_phase_df():
+    dates = pd.date_range("2023-01-01", periods=60, freq="D")
+    t = np.arange(dates.size, dtype=float)
+    frame = pd.DataFrame({
+        "date": dates,
+        "oil": Arps(di=0.03, qi=200.0, b=0.5).run(t),
+        "water": Arps(di=0.01, qi=80.0, b=0.5).run(t),
+        "gas": Arps(di=0.02, qi=900.0, b=0.5).run(t),
+    })
+    return frame.iloc[::-1]  # unsorted rows: phases must follow the schedule
+
+
+def test_fit_recovers_every_phase_in_one_table(three_phase_df):
+    mp = MultiPhaseDCA(three_phase_df).fit("hyperbolic", b=0.5)
+
+    assert list(mp.fits.well) == ["oil", "water", "gas"] == mp.phases
+    assert_allclose(mp.fits.di, [0.03, 0.01, 0.02], rtol=1e-8)
+    assert_allclose(mp.fits.qi, [200.0, 80.0, 900.0], rtol=1e-8)
+    assert np.all(mp.fits.error == "")
+
+
+def test_refined_phases_match_single_phase_fits(three_phase_df):
+    rng = np.random.default_rng(3)
+    noisy = three_phase_df.assign(gas=three_phase_df["gas"] * np.exp(0.1 * rng.standard_normal(60)))
+    mp = MultiPhaseDCA(noisy).fit("hyperbolic", b=0.5, half_life=30.0)
+    linear = MultiPhaseDCA(noisy).fit("hyperbolic", b=0.5, half_life=30.0, refine=False)
+
+    single = DCA(noisy.sort_values("date"), rate_col="gas").fit("hyperbolic", b=0.5, half_life=30.0)._fit
+    assert_allclose([mp.fits[2].di, mp.fits[2].qi], [single.di, single.qi], rtol=1e-6)
+    assert_allclose(linear.fits[2].slope, single.linear.slope)
+    assert abs(linear.fits[2].di - single.di) > 1e-6  # the linear stage alone differs
+
+
+def test_run_forecasts_phases_and_consistent_ratios(three_phase_df):
+    mp = MultiPhaseDCA(three_phase_df).fit("hyperbolic", b=0.5, ratios=False)
+    out = mp.run(horizon_days=30)
+
+    assert out.shape[0] == 60 + 30
+    assert_allclose(out["oil_hist"].iloc[:60], three_phase_df["oil"].iloc[::-1])
+    assert_allclose(out["gas_fit"], Arps(di=0.02, qi=900.0, b=0.5).run(out["t_days"]), rtol=1e-8)
+    assert_allclose(out["oil_cum"], Arps(di=0.03, qi=200.0, b=0.5).run(out["t_days"], cum=True), rtol=1e-8)
+
+    qo, qw, qg = out["oil_fit"], out["water_fit"], out["gas_fit"]
+    assert_allclose(out["water_cut"], qw / (qo + qw))
+    assert_allclose(out["wor"], qw / qo)
+    assert_allclose(out["gor"], qg / qo)
+    assert out["wor"].is_monotonic_increasing  # water declines slower than oil
+
+
+def test_rising_water_is_forecast_from_the_wor_trend(three_phase_df):
+    oil = Arps(di=0.03, qi=200.0, b=0.5)
+    t = np.arange(60.0)[::-1]  # rows of the fixture are reversed
+    Np = oil.run(t, cum=True)
+    df = three_phase_df.assign(water=three_phase_df["oil"] * 0.2 * np.exp(4e-4 * Np))  # log WOR linear in Np
+    mp = MultiPhaseDCA(df, gas_col=None).fit("hyperbolic", b=0.5)
+
+    assert list(mp.fits.valid) == [True, False]  # water rises: no decline of its own
+    assert mp.fits.error[1].startswith("ValueError")
+    trend = mp.ratio_trends["water"]
+    assert_allclose([trend.intercept, trend.slope], [np.log(0.2), 4e-4], rtol=1e-8)
+
+    out = mp.run(horizon_days=120)
+    Np_f = oil.run(out["t_days"], cum=True)
+    assert_allclose(out["wor"], 0.2 * np.exp(4e-4 * Np_f), rtol=1e-8)
+    assert_allclose(out["water_fit"], out["oil_fit"] * out["wor"])
+    assert_allclose(out["water_cut"], out["wor"] / (1.0 + out["wor"]))
+    # cumulative water is the integral of WOR over the oil cumulative
+    assert_allclose(out["water_cum"], 0.2 / 4e-4 * np.expm1(4e-4 * Np_f), rtol=1e-8)
+    assert out["water_fit"].notna().all() and out["water_fit"].iloc[-1] > out["water_fit"].iloc[59]
+
+
+def test_missing_and_unfittable_phases(three_phase_df):
+    df = three_phase_df.assign(water=10.0 + three_phase_df.index)  # rising water
+    mp = MultiPhaseDCA(df, gas_col=None).fit("exponential", ratios=False)
+
+    assert mp.phases == ["oil", "water"]
+    assert list(mp.fits.valid) == [True, False]
+    out = mp.run(periods=5)
+    assert "gor" not in out and out["water_fit"].isna().all()
+    assert out["oil_fit"].notna().all()
+
+    with pytest.raises(RuntimeError):
+        MultiPhaseDCA(three_phase_df).run()
+    with pytest.raises(ValueError):
+        MultiPhaseDCA(three_phase_df, oil_col=None, water_col=None, gas_col=None).fit()
@@ -0,0 +1,84 @@
+# tests/test_online.py
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from prodpy.decline import Arps, OnlineFit
+
+
+@pytest.fixture
+def history():
+    rng = np.random.default_rng(21)
+    t = np.arange(0.0, 400.0)
+    q = Arps(0.01, 200.0, b=0.5).run(t) * (1.0 + 0.01 * rng.standard_normal(t.size))
+    return t, q
+
+
+def test_incremental_linear_estimate_matches_batch(history):
+    t, q = history
+    arps = Arps(1.0, 1.0, mode="hyperbolic")
+    online = OnlineFit(arps)
+    for chunk in np.array_split(np.arange(t.size), 9):
+        fit = online.update(t[chunk], q[chunk])
+
+    lr = arps.linregress(t, q)
+    assert_allclose(fit.linear.slope, lr.slope, rtol=1e-9)
+    assert_allclose(fit.linear.intercept, lr.intercept, rtol=1e-9)
+    assert fit.n == t.size
+    assert_allclose(online.t, t)
+
+def test_polish_runs_only_when_parameters_move(history):
+    t, q = history
+    arps = Arps(1.0, 1.0, mode="hyperbolic")
+    online = OnlineFit(arps, rtol=1e-2)
+    first = online.update(t[:-1], q[:-1])
+    assert online.polished
+
+    # one more consistent point: linear estimate barely moves
+    fit = online.update(t[-1:], q[-1:])
+    assert not online.polished
+    assert (fit.di, fit.qi) == (first.di, first.qi)
+    assert fit.n == t.size
+    full_r2 = Arps.rsquared(arps._forward(t, fit.di, fit.qi), q)
+    assert_allclose(fit.r2, full_r2, rtol=1e-10)
+
+    # a regime change moves the estimate past rtol and triggers a polish
+    t_new = t[-1] + np.arange(1.0, 200.0)
+    fit = online.update(t_new, Arps(0.03, 200.0, b=0.5).run(t_new))  # steeper decline
+    assert online.polished
+    assert fit.di != first.di
+
+def test_polished_result_matches_full_fit(history):
+    t, q = history
+    arps = Arps(1.0, 1.0, mode="hyperbolic")
+    online = OnlineFit(arps, xi=10.0, rtol=0.0)
+    online.update(t[:200], q[:200])
+    fit = online.update(t[200:], q[200:])
+
+    ref = arps.fit(t, q, xi=10.0)
+    assert_allclose([fit.di, fit.qi], [ref.di, ref.qi], rtol=1e-6)
+    assert fit.n == ref.n
+
+def test_needs_three_points():
+    with pytest.raises(ValueError):
+        OnlineFit(Arps(1.0, 1.0)).update([0.0, 1.0], [10.0, 9.0])
+
+def test_failed_update_leaves_state_intact(history):
+    t, q = history
+    online = OnlineFit(Arps(1.0, 1.0, mode="hyperbolic"), rtol=0.5)
+    with pytest.raises(ValueError):
+        online.update(t[:2], q[:2])
+    assert online.t.size == 0 and online.result is None
+
+    first = online.update(t, q)
+    stats, rtol = online._stats, online.rtol
+    t_new = t[-1] + np.arange(1.0, 400.0)
+    with pytest.raises(ValueError):  # rising rates: the polish finds no decline
+        online.update(t_new, 50.0 * np.exp(0.01 * t_new), rtol=0.0)
+
+    assert online.result is first and online.rtol == rtol
+    assert online._stats is stats
+    assert_allclose(online.t, t)
+    # the next consistent update carries on from the intact history
+    fit = online.update(t[-1:] + 1.0, Arps(first.di, first.qi, b=0.5).run(t[-1:] + 1.0))
+    assert fit.n == t.size + 1
@@ -0,0 +1,75 @@
+# tests/test_quality.py
+import numpy as np
+import pytest
+
+from prodpy.decline import Arps, quality_mask
+
+
+@pytest.fixture
+def noisy():
+    rng = np.random.default_rng(0)
+    t = np.arange(200.0)
+    q = Arps(di=0.02, qi=100.0, b=0.5).run(t) * np.exp(0.03 * rng.standard_normal(t.size))
+    q[50] *= 3.0  # allocation spike
+    q[80:85] = 0.0  # shut-in
+    q[120] *= 0.3  # partial day
+    q[150] = np.nan
+    return t, q
+
+
+def test_flags_spikes_shutins_and_missing_rates(noisy):
+    t, q = noisy
+    keep = quality_mask(t, q)
+    assert sorted(np.flatnonzero(~keep)) == [50, 80, 81, 82, 83, 84, 120, 150]
+
+    # flush production after the shut-in
+    keep = quality_mask(t, q, after_shutin=2)
+    assert not keep[85] and not keep[86] and keep[87]
+
+    # no outlier test: only shut-ins and missing rates
+    assert np.count_nonzero(~quality_mask(t, q, window=None)) == 6
+
+
+def test_wells_are_independent_and_order_is_kept(noisy):
+    t, q = noisy
+    wells = np.repeat(["A", "B"], 100)
+    t2 = np.concatenate([t[:100], t[:100]])  # both wells start at 0
+    order = np.random.default_rng(1).permutation(200)
+
+    keep = quality_mask(t2[order], q[order], wells=wells[order], after_shutin=3)
+    expected = quality_mask(t2, q, wells=wells, after_shutin=3)
+    assert np.array_equal(keep, expected[order])
+
+    # well B starts right after A's last row: A's state does not carry over
+    q_b = q.copy()
+    q_b[95:100] = 0.0
+    keep = quality_mask(t2, q_b, wells=wells, after_shutin=3)
+    assert keep[100:103].all()
+
+
+def test_min_uptime_and_validation(noisy):
+    t, q = noisy
+    up = np.ones_like(t)
+    up[10:20] = 0.4
+    up[30] = np.nan
+    keep = quality_mask(t, q, uptime=up, min_uptime=0.5, window=None)
+    assert not keep[10:20].any() and not keep[30] and keep[20:30].all()
+
+    with pytest.raises(ValueError):
+        quality_mask(t, q, min_uptime=0.5)
+    with pytest.raises(ValueError):
+        quality_mask(t, q[:-1])
+
+
+@pytest.mark.parametrize("at", [0, 1, 38, 39])
+def test_spikes_on_the_first_and_last_rows_are_flagged(at):
+    t = np.arange(40.0)
+    q = Arps(di=0.05, qi=100.0, b=0.5).run(t)
+    q[at] *= 5.0
+    assert np.flatnonzero(~quality_mask(t, q)).tolist() == [at]
+
+
+def test_datetime_times_and_steep_declines_keep_clean_rows():
+    dates = np.datetime64("2020-01-01") + np.arange(24) * np.timedelta64(30, "D")
+    q = Arps(di=0.01, qi=100.0, b=0.5).run(30.0 * np.arange(24))  # about -25 % per step early on
+    assert quality_mask(dates, q).all()
@@ -0,0 +1,73 @@
+# tests/test_robust.py
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from prodpy.decline import Arps
+from prodpy.decline._linstats import LinearStats
+from prodpy.decline._robust import _group_mad, _irls
+
+
+@pytest.fixture
+def spiky():
+    rng = np.random.default_rng(3)
+    t = np.arange(120.0)
+    q = Arps(0.02, 200.0, b=0.5).run(t) * np.exp(0.02 * rng.standard_normal(t.size))
+    q[[10, 40, 41, 42, 80]] *= 0.1  # partial shut-ins
+    q[[60, 95]] *= 3.0  # test spikes
+    return t, q
+
+
+def test_weighted_stats_match_repeated_samples():
+    x = np.array([0.0, 1.0, 2.0, 3.0])
+    y = np.array([1.0, 3.0, 2.0, 5.0])
+    w = np.array([1.0, 2.0, 1.0, 3.0])
+    weighted = LinearStats.from_samples(x, y, w)
+    repeated = LinearStats.from_samples(np.repeat(x, w.astype(int)), np.repeat(y, w.astype(int)))
+    for f in ("n", "sx", "sy", "sxx", "sxy", "syy"):
+        assert_allclose(getattr(weighted, f), getattr(repeated, f))
+    grouped = LinearStats.from_groups(np.zeros(4, dtype=int), x, y, 1, w)
+    assert_allclose(grouped.slope[0], weighted.slope)
+    assert_allclose(np.polyfit(x, y, 1, w=np.sqrt(w)), [weighted.slope, weighted.intercept])
+
+def test_group_mad():
+    codes = np.array([0, 0, 0, 1, 1, 1, 1])
+    r = np.array([1.0, -3.0, 2.0, 4.0, -1.0, 2.0, 3.0])
+    s = _group_mad(codes, r, 3)
+    assert_allclose(s[:2] * 0.6744897501960817, [2.0, 2.5])
+    assert np.isnan(s[2])
+
+@pytest.mark.parametrize("loss", ["huber", "tukey"])
+def test_robust_fit_ignores_outliers(spiky, loss):
+    t, q = spiky
+    arps = Arps(1.0, 1.0, b=0.5)
+    plain = arps.fit(t, q)
+    robust = arps.fit(t, q, robust=loss)
+    assert abs(robust.di / 0.02 - 1.0) < 0.02 < abs(plain.di / 0.02 - 1.0)
+    assert abs(robust.qi / 200.0 - 1.0) < 0.01
+    if loss == "tukey":
+        assert robust.n <= t.size - 7  # the outliers get zero weight
+
+def test_irls_is_exact_on_clean_data():
+    t = np.arange(30.0)
+    arps = Arps(0.05, 100.0, b=0.5)
+    stats, w = _irls(np.zeros(30, dtype=np.intp), t, arps.model.linearize(arps.run(t)), 1, loss="tukey")
+    di, qi, _, _ = arps._invert_stats(stats)
+    assert_allclose([di[0], qi[0]], [0.05, 100.0], rtol=1e-8)
+
+def test_robust_batch_matches_single_well_linear_stage(spiky):
+    t, q = spiky
+    arps = Arps(1.0, 1.0, b=0.5)
+    table = arps.fit_batch([t, t[:60]], [q, 2.0 * q[:60]], robust="tukey")
+    single = arps.fit(t, q, robust="tukey")
+    di, qi = arps._invert_from_lin(single.linear)
+    assert_allclose([table.di[0], table.qi[0]], [di, qi], rtol=1e-10)
+    assert table.n[0] == single.n
+    assert np.all(table.r2 > 0.99)
+
+def test_robust_validation(spiky):
+    t, q = spiky
+    with pytest.raises(ValueError):
+        Arps(1.0, 1.0, b=0.5).fit(t, q, robust="cauchy")
+    with pytest.raises(ValueError):
+        Arps(1.0, 1.0, b=0.5).fit(t, q, robust="huber", free_b=True)
@@ -0,0 +1,105 @@
+# tests/test_sample.py
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from prodpy.decline import Arps, ArpsBatch, Sampler
+
+
+@pytest.fixture
+def tvec():
+    return np.linspace(0.0, 10.0, 120)
+
+@pytest.fixture(params=[False, True], ids=["fixed-b", "free-b"])
+def fit(request, tvec):
+    rng = np.random.default_rng(17)
+    q = Arps(0.3, 100.0, b=0.5).run(tvec) * (1.0 + 0.02 * rng.standard_normal(tvec.shape))
+    return Arps(1.0, 1.0, mode="hyperbolic").fit(tvec, q, free_b=request.param)
+
+
+def test_fit_keeps_covariance(fit):
+    assert fit.cov is not None
+    assert fit.cov.shape in {(2, 2), (3, 3)}
+    assert_allclose(np.sqrt(np.diag(fit.cov))[:2], [fit.di_error, fit.qi_error])
+
+def test_draws_follow_fit_covariance(fit):
+    batch = Sampler(fit).draw(20_000, rng=1)
+    assert isinstance(batch, ArpsBatch) and batch.size == 20_000
+
+    params = np.column_stack([batch.di, batch.qi, batch.b])[:, : fit.cov.shape[0]]
+    assert_allclose(params.mean(axis=0)[:2], [fit.di, fit.qi], rtol=1e-2)
+    assert_allclose(np.cov(params.T), fit.cov, rtol=0.1, atol=1e-8)
+    assert np.all(batch.di > 0) and np.all((batch.b >= 0) & (batch.b <= 1))
+
+def test_chunks_and_percentiles_match_full_run(fit, tvec):
+    s = Sampler(fit)
+    q_full = s.run(tvec, 500, rng=3)
+    N_full = s.run(tvec, 500, cum=True, rng=3)
+
+    blocks = list(s.chunks(tvec, 500, chunksize=128, rng=3))
+    assert [q.shape[0] for q, _ in blocks] == [128, 128, 128, 116]
+    assert_allclose(np.vstack([q for q, _ in blocks]), q_full)
+    assert_allclose(np.vstack([N for _, N in blocks]), N_full)
+
+    bands = s.percentiles(tvec, 500, (10, 50, 90), chunksize=7, rng=3)
+    assert_allclose(bands, np.percentile(q_full, (90, 50, 10), axis=0))
+
+def test_percentiles_follow_exceedance_convention(fit, tvec):
+    # P10 is the high case, as in Arps.simulate (lower di, higher qi)
+    p10, p50, p90 = Sampler(fit).percentiles(tvec, 2000, rng=4)
+    assert np.all(p10 >= p50) and np.all(p50 >= p90)
+    assert np.all(p10[1:] > p90[1:])
+    hi, lo = Arps.simulate(fit, 10.0), Arps.simulate(fit, 90.0)
+    assert Arps(*hi, b=fit.b).run(tvec[-1]) > Arps(*lo, b=fit.b).run(tvec[-1])
+
+def test_missing_covariance_uses_std_errors(fit):
+    from dataclasses import replace
+
+    s = Sampler(replace(fit, cov=None))
+    assert_allclose(np.diag(s.cov)[:2], [fit.di_error ** 2, fit.qi_error ** 2])
+
+    with pytest.raises(ValueError):
+        Sampler(replace(fit, cov=None, di_error=np.nan)).draw(10)
+
+def test_b_outside_unit_interval_is_redrawn(tvec):
+    from dataclasses import replace
+
+    q = Arps(0.3, 100.0, b=0.5).run(tvec)
+    fit = Arps(1.0, 1.0, mode="hyperbolic").fit(tvec, q, free_b=True)
+    near_one = replace(fit, b=0.95, cov=np.diag([1e-6, 1e-2, 0.05 ** 2]))
+    b = Sampler(near_one).draw(20_000, rng=2).b
+
+    assert np.all((b >= 0) & (b <= 1))
+    assert not np.any(b == 1.0)  # rejected, not clipped onto the bound
+    # normal truncated one sd above the mean: P(0 < z < 1) / P(z < 1) above it
+    assert_allclose(np.mean(b > 0.95), 0.3413 / 0.8413, atol=0.02)
+
+def test_table_samples_every_well_in_one_draw(tvec):
+    from prodpy.decline import FitTable
+
+    rng = np.random.default_rng(9)
+    fits = []
+    for i, free in enumerate((False, True, False)):
+        q = Arps(0.2 + 0.1 * i, 100.0, b=0.5).run(tvec) * (1.0 + 0.02 * rng.standard_normal(tvec.shape))
+        fits.append(Arps(1.0, 1.0, mode="hyperbolic").fit(tvec, q, free_b=free))
+    table = FitTable.from_results(fits)
+    assert_allclose(table[1].cov, fits[1].cov)
+    assert_allclose(table.covariance()[0, :2, :2], fits[0].cov)
+    assert np.all(table.covariance()[[0, 2], 2] == 0.0)  # fixed b: no b spread
+
+    s = Sampler(table)
+    batch = s.draw(20_000, rng=5)
+    assert batch.size == 3 * 20_000
+    for i, fit in enumerate(fits):
+        rows = slice(i * 20_000, (i + 1) * 20_000)
+        params = np.column_stack([batch.di[rows], batch.qi[rows], batch.b[rows]])[:, : fit.cov.shape[0]]
+        assert_allclose(params.mean(axis=0)[:2], [fit.di, fit.qi], rtol=1e-2)
+        assert_allclose(np.cov(params.T), fit.cov, rtol=0.1, atol=1e-8)
+    assert np.all(batch.b[:20_000] == fits[0].b)
+
+    assert s.run(tvec, 50, rng=1).shape == (3, 50, tvec.size)
+    bands = s.percentiles(tvec, 500, chunksize=7, rng=3)
+    assert bands.shape == (3, 3, tvec.size)
+    q_full = s.run(tvec, 500, rng=3)
+    assert_allclose(bands, np.percentile(q_full, (90, 50, 10), axis=1).transpose(1, 0, 2))
+    assert np.all(bands[:, 0] >= bands[:, 2])
@@ -0,0 +1,95 @@
+# tests/test_segment.py
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from prodpy.decline import Arps, Segments
+
+
+def _workover(t, noise=0.0, seed=1):
+    # decline restarts at t = 25 (e.g. after a workover) at a higher rate
+    q = np.where(t < 25.0, Arps(0.05, 100.0, b=0.5).run(t), Arps(0.08, 80.0, b=0.5).run(t, xi=25.0))
+    rng = np.random.default_rng(seed)
+    return q * np.exp(noise * rng.standard_normal(t.size))
+
+
+@pytest.fixture
+def history():
+    t = np.arange(60.0)
+    return t, _workover(t, noise=0.02)
+
+
+def test_change_point_is_found(history):
+    t, q = history
+    seg = Arps(1.0, 1.0, b=0.5).segment(t, q)
+    assert isinstance(seg, Segments)
+    assert len(seg) == 2
+    assert_allclose(seg.bounds, [0, 25, 60])
+    assert_allclose(seg.start, [0.0, 25.0])
+    assert_allclose(seg.last.di, 0.08, rtol=0.1)
+    assert_allclose(seg.last.qi, 80.0, rtol=0.05)
+    assert seg.score.shape == (4,) and np.argmin(seg.score) == 1
+
+def test_exact_segments_and_piecewise_run():
+    t = np.arange(60.0)
+    q = _workover(t)
+    seg = Arps(1.0, 1.0, b=0.5).segment(t, q, max_segments=2)
+    assert_allclose(seg.fits.di, [0.05, 0.08], rtol=1e-8)
+    assert_allclose(seg.fits.qi, [100.0, 80.0], rtol=1e-8)
+    assert_allclose(seg.run(t), q, rtol=1e-8)
+
+    # cumulative keeps counting across the boundary
+    N = seg.run([24.0, 25.0, 40.0], cum=True)
+    first = Arps(0.05, 100.0, b=0.5)
+    assert_allclose(N[1], first.run([25.0], cum=True)[0], rtol=1e-8)
+    assert_allclose(N[2] - N[1], Arps(0.08, 80.0, b=0.5).run([15.0], cum=True)[0], rtol=1e-8)
+    assert np.isnan(seg.run([-1.0])[0])
+
+def test_partition_matches_brute_force(history):
+    t, q = history
+    arps = Arps(1.0, 1.0, b=0.5)
+    seg = arps.segment(t, q, max_segments=2, min_size=6)
+    y = arps.model.linearize(q)
+
+    def sse(a, b):
+        stats = np.polyfit(t[a:b], y[a:b], 1, full=True)[1]
+        return float(stats[0]) if stats.size else 0.0
+
+    costs = {k: sse(0, k) + sse(k, t.size) for k in range(6, t.size - 5)}
+    assert len(seg) == 2
+    assert seg.bounds[1] == min(costs, key=costs.get)
+
+def test_segment_validation(history):
+    t, q = history
+    arps = Arps(1.0, 1.0, b=0.5)
+    with pytest.raises(ValueError):
+        arps.segment(t, q, min_size=2)
+    with pytest.raises(ValueError):
+        arps.segment(t, q, max_segments=0)
+    with pytest.raises(ValueError):
+        arps.segment(t, q, criterion="r2")
+    with pytest.raises(ValueError):
+        arps.segment(t[:4], q[:4])
+    # unsorted input and non-positive rates are handled
+    order = np.random.default_rng(0).permutation(t.size)
+    qq = q.copy()
+    qq[3] = 0.0
+    seg = arps.segment(t[order], qq[order])
+    assert seg.bounds[-1] == t.size - 1
+
+
+def test_long_history_screens_candidates_like_the_exact_search():
+    rng = np.random.default_rng(7)
+    t = np.arange(400.0)
+    q = np.concatenate([
+        Arps(0.01, 120.0, b=0.5).run(t[:150]),
+        Arps(0.02, 90.0, b=0.5).run(t[150:290] - 150.0),
+        Arps(0.015, 70.0, b=0.5).run(t[290:] - 290.0),
+    ]) * np.exp(0.03 * rng.standard_normal(t.size))
+    arps = Arps(1.0, 1.0, b=0.5)
+
+    fast = arps.segment(t, q)
+    exact = arps.segment(t, q, max_candidates=t.size)
+    assert_allclose(fast.bounds, [0, 150, 290, 400])
+    assert_allclose(fast.bounds, exact.bounds)
+    assert_allclose(fast.score, exact.score)
@@ -0,0 +1,86 @@
+# tests/test_select.py
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from prodpy.decline import Arps, Selection
+
+
+def _noisy(b, di=0.1, qi=1000.0, n=60, seed=5):
+    rng = np.random.default_rng(seed)
+    t = np.linspace(0.0, 20.0, n)
+    q = Arps(di, qi, b=b).run(t)
+    return t, q * (1.0 + 0.005 * rng.standard_normal(n))
+
+
+@pytest.mark.parametrize("b, expected", [(0.0, "exponential"), (1.0, "harmonic")])
+def test_select_picks_generating_family(b, expected):
+    t, q = _noisy(b)
+    sel = Arps(1.0, 1.0).select(t, q, b=0.5)
+    assert isinstance(sel, Selection)
+    assert sel.models == ("exponential", "hyperbolic", "harmonic", "free")
+    # free-b nests both ends, so the 2-parameter family must win on BIC
+    assert sel.best == expected
+    i, j = sel.models.index(expected), sel.models.index("hyperbolic")
+    assert sel.bic[i] < sel.bic[j]
+
+def test_select_matches_individual_fits():
+    t, q = _noisy(0.5)
+    sel = Arps(1.0, 1.0).select(t, q, b=0.5)
+    fit = Arps(1.0, 1.0, b=0.5).fit(t, q)
+    got = sel.fits["hyperbolic"]
+    assert_allclose([got.di, got.qi, got.r2], [fit.di, fit.qi, fit.r2], rtol=1e-6)
+
+    n = t.size
+    k = sel.models.index("hyperbolic")
+    ssres = np.sum((q - Arps(got.di, got.qi, b=0.5).run(t)) ** 2)
+    assert_allclose(sel.aic[k], n * np.log(ssres / n) + 4.0)
+    assert_allclose(sel.bic[k], n * np.log(ssres / n) + 2.0 * np.log(n))
+
+def test_select_criterion_validation():
+    t, q = _noisy(0.5)
+    with pytest.raises(ValueError):
+        Arps(1.0, 1.0).select(t, q, criterion="r2")
+
+def test_select_batch_per_well_winners():
+    ts, qs = [], []
+    for i, b in enumerate((0.0, 1.0, 0.0)):
+        t, q = _noisy(b, seed=i)
+        ts.append(t)
+        qs.append(q)
+    sel = Arps(1.0, 1.0).select_batch(ts, qs, b=0.5)
+
+    assert sel.aic.shape == (3, 4)
+    assert set(sel.fits) == set(sel.models)
+    best = sel.best
+    assert best.shape == (3,)
+    assert best[0] in {"exponential", "free"}
+    assert best[1] in {"harmonic", "free"}
+
+    # fixed families are exactly `fit_batch`
+    ref = Arps(1.0, 1.0, b=1.0).fit_batch(ts, qs)
+    assert_allclose(sel.fits["harmonic"].di, ref.di)
+    assert_allclose(sel.r2[:, 2], ref.r2)
+    # free-b keeps the best grid exponent per well; 0.5 and 1 are on the grid
+    assert np.all(sel.sse[:, 3] <= np.nanmin(sel.sse[:, 1:3], axis=1) * (1 + 1e-9))
+
+
+def test_select_batch_free_b_matches_scan_b(monkeypatch):
+    ts, qs = [], []
+    for i, b in enumerate((0.3, 0.8, 0.55, 0.1)):
+        t, q = _noisy(b, seed=10 + i)
+        ts.append(t)
+        qs.append(q)
+    free = Arps(1.0, 1.0).select_batch(ts, qs).fits["free"]
+
+    for i, (t, q) in enumerate(zip(ts, qs)):
+        B, di, qi, sse = Arps.scan_b(t, q, Arps._B_GRID)
+        k = int(np.argmin(sse))
+        assert free.b[i] == B[k]
+        assert_allclose([free.di[i], free.qi[i]], [di[k], qi[k]], rtol=1e-9)
+
+    # stacking the grid in several blocks gives the same table
+    monkeypatch.setattr(Arps, "_STACK", 3 * ts[0].size * 4)
+    blocked = Arps(1.0, 1.0).select_batch(ts, qs).fits["free"]
+    assert_allclose(blocked.b, free.b)
+    assert_allclose(blocked.r2, free.r2)
@@ -0,0 +1,115 @@
+# tests/test_table.py
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from prodpy.decline import Arps, FitResult, FitRow, FitTable, Sampler
+
+
+@pytest.fixture
+def fits():
+    rng = np.random.default_rng(3)
+    ts, qs = [], []
+    for i in range(4):
+        t = np.linspace(0.0, 10.0, 30)
+        ts.append(t)
+        qs.append(Arps(0.2 + 0.05 * i, 500.0, b=0.5).run(t) * (1.0 + 0.003 * rng.standard_normal(t.size)))
+    return Arps(1.0, 1.0, b=0.5).fit_batch(ts, qs), ts, qs
+
+
+def test_fit_batch_returns_table(fits):
+    table, _, _ = fits
+    assert isinstance(table, FitTable)
+    assert table.columns()[0] == "well"
+    assert np.all(np.isnan(table.b_error))
+    assert table.n.dtype == np.int64
+
+def test_row_view_behaves_like_fit_result(fits):
+    table, _, _ = fits
+    row = table[2]
+    assert isinstance(row, FitRow)
+    assert row.di == table.di[2] and row.n == table.n[2]
+    assert row.linear.slope == table.slope[2]
+    assert "Initial rate" in Arps.reader(row)
+    assert table[-1].well == table.well[-1]
+    with pytest.raises(IndexError):
+        table[len(table)]
+
+    result = row.to_result()
+    assert isinstance(result, FitResult)
+    assert_allclose([result.di, result.qi], [row.di, row.qi])
+
+def test_rows_feed_sampler_and_batch(fits):
+    table, _, _ = fits
+    q = Sampler(table[0]).run(np.linspace(0.0, 5.0, 6), 20, rng=0)
+    assert q.shape == (20, 6)
+    assert table.to_batch().size == len(table)
+
+def test_from_results_round_trip():
+    t = np.linspace(0.0, 10.0, 25)
+    results = [Arps(1.0, 1.0, b=0.5).fit(t, Arps(d, 100.0, b=0.5).run(t)) for d in (0.1, 0.2)]
+    table = FitTable.from_results(results, well=["a", "b"])
+    assert_array_equal(table.well, ["a", "b"])
+    assert_allclose(table.di, [r.di for r in results])
+    assert_allclose(table.rvalue, [r.linear.rvalue for r in results])
+    assert len(FitTable.from_results([])) == 0
+
+def test_append_and_filter(fits):
+    table, _, _ = fits
+    both = table.append(table, FitTable.empty())
+    assert len(both) == 2 * len(table)
+    assert_allclose(both.di[len(table):], table.di)
+
+    sub = both.filter(both.r2 > 0.0, well=1)
+    assert len(sub) == 2 and np.all(sub.well == 1)
+    assert len(table[table.valid]) == len(table)
+    assert len(table[1:3]) == 2
+    with pytest.raises(ValueError):
+        table.filter(colour=1)
+
+def test_column_length_is_checked():
+    with pytest.raises(ValueError):
+        FitTable(**{f: np.zeros(3 if f == "qi" else 2) for f in FitTable.columns()})
+
+def test_save_load_npz(fits, tmp_path):
+    table, _, _ = fits
+    table = FitTable.concat([table, table]).take(slice(None))
+    named = FitTable(**{f: np.array([f"w{i}" for i in range(len(table))], dtype=object) if f == "well"
+                        else getattr(table, f) for f in FitTable.columns()})
+    path = tmp_path / "fits.npz"
+    named.save(path)
+    loaded = FitTable.load(path)
+    assert_array_equal(loaded.well, named.well.astype(str))
+    for f in FitTable.columns()[1:]:
+        assert_array_equal(getattr(loaded, f), getattr(named, f))
+
+def test_save_load_without_suffix(fits, tmp_path):
+    table, _, _ = fits
+    for name in ("fits", "fits.v2"):
+        path = tmp_path / name
+        table.save(path)
+        assert (tmp_path / f"{name}.npz").exists()
+        assert_allclose(FitTable.load(path).di, table.di)
+        assert_allclose(FitTable.load(str(path) + ".npz").di, table.di)
+
+def test_save_load_parquet(fits, tmp_path):
+    pytest.importorskip("pyarrow")
+    table, _, _ = fits
+    path = tmp_path / "fits.parquet"
+    table.save(path)
+    loaded = FitTable.load(path)
+    for f in FitTable.columns():
+        assert_array_equal(getattr(loaded, f), getattr(table, f))
+
+def test_failed_rows_keep_their_error(tmp_path):
+    t = np.linspace(0.0, 10.0, 25)
+    ok = Arps(1.0, 1.0, b=0.5).fit(t, Arps(0.1, 100.0, b=0.5).run(t))
+    table = FitTable.from_results([ok, None], well=["a", "b"], error=["", "ValueError: too short"])
+    assert_array_equal(table.valid, [True, False])
+    assert table[1].error == "ValueError: too short" and table[1].n == 0
+    assert table[0].error == ""
+    assert len(table.filter(error="")) == 1
+
+    path = tmp_path / "fits.npz"
+    table.save(path)
+    assert_array_equal(FitTable.load(path).error, table.error)
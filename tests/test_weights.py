@@ -0,0 +1,72 @@
+# tests/test_weights.py
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from prodpy.decline import Arps, decay_weights, uptime_weights
+
+
+@pytest.fixture
+def transient():
+    # early transient (steeper) followed by the decline we want to forecast
+    t = np.arange(48.0)
+    q = np.where(t < 12, Arps(0.3, 400.0, b=0.5).run(t), Arps(0.05, 150.0, b=0.5).run(t, xi=12.0))
+    return t, q
+
+
+def test_decay_and_uptime_weights():
+    assert_allclose(decay_weights([0.0, 5.0, 10.0], 5.0), [0.25, 0.5, 1.0])
+    assert_allclose(decay_weights([0.0, 5.0], 5.0, ref=15.0), [0.125, 0.25])
+    assert_allclose(uptime_weights([1.0, 0.5, np.nan, 1.2]), [1.0, 0.5, 0.0, 1.0])
+    assert_allclose(uptime_weights([24.0, 6.0], period=24.0), [1.0, 0.25])
+    with pytest.raises(ValueError):
+        decay_weights([0.0], 0.0)
+    with pytest.raises(ValueError):
+        uptime_weights([1.0], period=0.0)
+
+def test_weighted_linregress_matches_polyfit():
+    t = np.arange(20.0)
+    q = Arps(0.1, 50.0).run(t) * np.exp(0.05 * np.sin(t))
+    w = decay_weights(t, 5.0)
+    arps = Arps(1.0, 1.0)
+    res = arps.linregress(t, q, weights=w)
+    m, c = np.polyfit(t, np.log(q), 1, w=np.sqrt(w))
+    assert_allclose([res.slope, res.intercept], [m, c], rtol=1e-10)
+    # weights are rescaled, so their overall scale does not matter
+    assert_allclose(arps.linregress(t, q, weights=10 * w).slope, res.slope)
+
+def test_time_decay_favours_recent_data(transient):
+    t, q = transient
+    arps = Arps(1.0, 1.0, b=0.5)
+    plain = arps.fit(t, q, xi=12.0)
+    recent = arps.fit(t, q, weights=decay_weights(t, 3.0))
+    early = arps.fit(t, q)
+    assert_allclose(plain.di, 0.05, rtol=1e-6)
+    assert abs(recent.di - 0.05) < abs(early.di - 0.05)
+
+def test_zero_weights_drop_samples(transient):
+    t, q = transient
+    w = (t >= 12).astype(float)
+    res = Arps(1.0, 1.0, b=0.5).fit(t - 12.0, q, weights=w)
+    assert_allclose([res.di, res.qi], [0.05, 150.0], rtol=1e-6)
+    assert res.n == 36
+    with pytest.raises(ValueError):
+        Arps(1.0, 1.0, b=0.5).fit(t, q, weights=-w)
+
+def test_weighted_free_b(transient):
+    t, q = transient
+    w = (t >= 12).astype(float)
+    res = Arps(1.0, 1.0).fit(t - 12.0, q, free_b=True, weights=w)
+    assert_allclose([res.b, res.di], [0.5, 0.05], rtol=1e-4)
+
+def test_batch_weights_match_single_well(transient):
+    t, q = transient
+    arps = Arps(1.0, 1.0, b=0.5)
+    w = uptime_weights(np.where(t % 7 == 0, 0.5, 1.0))
+    table = arps.fit_batch([t, t], [q, q], weights=[w, np.ones_like(t)], half_life=6.0)
+    single = arps.linregress(t, q, weights=w * decay_weights(t, 6.0))
+    assert_allclose(arps._invert_from_lin(single), [table.di[0], table.qi[0]], rtol=1e-10)
+    unweighted_decay = arps.linregress(t, q, weights=decay_weights(t, 6.0))
+    assert_allclose(arps._invert_from_lin(unweighted_decay), [table.di[1], table.qi[1]], rtol=1e-10)
+    with pytest.raises(ValueError):
+        arps.fit_batch([t], [q], weights=[w[:-1]])